@@ -0,0 +1,85 @@
+#!/usr/bin/env python3
+"""
+The D-AI-LY Atomic Writer
+
+Every generated page and JSON file goes through write_if_changed():
+
+- if the file already holds exactly the new bytes it is left alone, so its
+  mtime does not change and Observable Framework (and fix-paths.js) does not
+  rebuild a page whose content is the same
+- otherwise the content is written to a temp file in the same directory and
+  renamed over the target, so readers and concurrent runs never see a
+  half-written file
+
+The comparison reads the existing file only when its size matches, so a
+changed page costs one stat before the write.
+"""
+
+import os
+import shutil
+import tempfile
+from pathlib import Path
+from typing import Union
+
+PathLike = Union[str, Path]
+
+# mkstemp creates files as 0600; new files get the mode open() would give them
+_UMASK = os.umask(0)
+os.umask(_UMASK)
+_NEW_FILE_MODE = 0o666 & ~_UMASK
+
+
+def is_identical(path: PathLike, data: bytes) -> bool:
+    """True if path exists and holds exactly data."""
+    try:
+        if os.path.getsize(path) != len(data):
+            return False
+        with open(path, "rb") as f:
+            return f.read() == data
+    except OSError:
+        return False
+
+
+def write_if_changed(path: PathLike, content: Union[str, bytes]) -> bool:
+    """
+    Atomically write content (str is encoded as UTF-8) to path unless the
+    file already holds it. Creates parent directories as needed.
+
+    Returns:
+        True if the file was written, False if it was already up to date
+    """
+    data = content.encode("utf-8") if isinstance(content, str) else content
+    if is_identical(path, data):
+        return False
+
+    path = Path(path)
+    path.parent.mkdir(parents=True, exist_ok=True)
+    try:
+        mode = os.stat(path).st_mode & 0o777
+    except OSError:
+        mode = _NEW_FILE_MODE
+
+    fd, tmp_path = tempfile.mkstemp(dir=path.parent, prefix=f".{path.name}.", suffix=".tmp")
+    try:
+        with os.fdopen(fd, "wb") as f:
+            f.write(data)
+        os.chmod(tmp_path, mode)
+        os.replace(tmp_path, path)
+    except BaseException:
+        if os.path.exists(tmp_path):
+            os.remove(tmp_path)
+        raise
+    return True
+
+
+def copy_if_changed(source: PathLike, dest: PathLike) -> bool:
+    """
+    Copy source to dest (contents, then timestamps like shutil.copy2) unless
+    dest already holds the same bytes. Returns True if dest was written.
+    """
+    with open(source, "rb") as f:
+        data = f.read()
+    if not write_if_changed(dest, data):
+        return False
+    shutil.copystat(source, dest)
+    return True
@@ -0,0 +1,440 @@
+#!/usr/bin/env python3
+"""
+The D-AI-LY Historical Backfill
+
+Generates the Observable article for every (table, period, language) in a
+ref_date range, for a list of tables or every table in
+r-tools/table_configs.json:
+
+    python3 backfill.py --from 2024-01 --to 2025-10
+    python3 backfill.py --tables 18-10-0004 14-10-0287 --from 2025-01
+
+Each table's data file (output/data_18_10_0004.json) is loaded and validated
+once; every period is then a copy-free rebase of that data (see
+rebase_data_to_period), so a table costs one JSON parse however many months
+are backfilled. Periods render in parallel over a process or thread pool.
+
+Progress goes to a checkpoint file (output/.backfill-checkpoint.jsonl), one
+JSON line per finished article. Re-running the same command skips everything
+already recorded for the same data and output directory, so an interrupted
+backfill resumes where it stopped and refreshed data is rendered again. Pass
+--restart to discard the checkpoint and go through everything again; articles
+whose inputs are unchanged then come from the render cache (see
+render_cache.py) without being rewritten, unless --no-cache is given.
+"""
+
+import argparse
+import logging
+import os
+import sys
+import time
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor, as_completed
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Set, Tuple
+
+import json_backend
+from generate_article_observable import (
+    BATCH_LANGS,
+    article_attachments,
+    generate_article_from_data,
+    parse_ref_month,
+    rebase_data_to_period,
+    render_cache_key,
+    validate_data,
+)
+from render_cache import default_cache, digest_bytes
+from series_frame import PeriodIndex, SeriesFrame
+
+logger = logging.getLogger(__name__)
+
+TABLE_CONFIGS_PATH = Path(__file__).parent / "r-tools" / "table_configs.json"
+CHECKPOINT_NAME = ".backfill-checkpoint.jsonl"
+
+
+# =============================================================================
+# TABLES AND PERIODS
+# =============================================================================
+
+def load_table_numbers(path: Path = TABLE_CONFIGS_PATH) -> List[str]:
+    """Return every table number configured in table_configs.json, in file order."""
+    return list(json_backend.load(path))
+
+
+def data_file_for_table(data_dir: str, table: str) -> str:
+    """Path the R fetchers write a table's data to (18-10-0004 -> data_18_10_0004.json)."""
+    return os.path.join(data_dir, f"data_{table.replace('-', '_')}.json")
+
+
+def normalize_month(value: str) -> str:
+    """Normalize a "YYYY-M" or "YYYY-MM" ref_date to "YYYY-MM"."""
+    try:
+        return parse_ref_month(value).strftime("%Y-%m")
+    except (TypeError, ValueError):
+        raise ValueError(f"Invalid ref_date '{value}' (expected YYYY-MM)")
+
+
+def periods_in_range(data: Dict[str, Any], start: str,
+                     end: Optional[str] = None) -> List[str]:
+    """Sorted ref_dates in data's time_series between start and end (inclusive)."""
+    index = PeriodIndex(data.get("time_series", []))
+    return sorted(
+        ref_date for ref_date in index.positions
+        if isinstance(ref_date, str) and ref_date >= start and (end is None or ref_date <= end)
+    )
+
+
+# =============================================================================
+# CHECKPOINT
+# =============================================================================
+
+class Checkpoint:
+    """
+    Append-only record of finished articles, one JSON line each:
+
+        {"table": "18-10-0004", "ref_date": "2025-03", "lang": "en",
+         "data": "<sha256 of the data file>", "output_dir": "/abs/docs", "output": "..."}
+
+    An article is done only for the same data and output directory, so after
+    a data refresh or with another --output-dir it is rendered again (records
+    from before the data and output_dir fields never match).
+
+    Only the parent process writes it, one line per article as results
+    arrive, so a killed run loses at most the articles still in flight. A
+    truncated last line (killed mid-write) is dropped on load.
+    """
+
+    def __init__(self, path: str):
+        self.path = path
+        self.done: Set[Tuple[str, str, str, str, str]] = set()
+        self._load()
+
+    def _load(self) -> None:
+        if not os.path.exists(self.path):
+            return
+        with open(self.path, "rb") as f:
+            content = f.read()
+        for line in content.splitlines():
+            try:
+                entry = json_backend.loads(line)
+                self.done.add((entry["table"], entry["ref_date"], entry["lang"],
+                               entry["data"], entry["output_dir"]))
+            except (ValueError, KeyError, TypeError):
+                continue
+
+        # Drop a partial last line so the next append starts on a fresh line
+        if content and not content.endswith(b"\n"):
+            with open(self.path, "r+b") as f:
+                f.truncate(content.rfind(b"\n") + 1)
+
+    def is_done(self, table: str, ref_date: str, lang: str,
+                data_digest: str, output_dir: str) -> bool:
+        return (table, ref_date, lang, data_digest, os.path.abspath(output_dir)) in self.done
+
+    def record(self, item: "BackfillResult", data_digest: str, output_dir: str) -> None:
+        """Append one finished article, rendered from data_digest into output_dir, and flush it."""
+        output_dir = os.path.abspath(output_dir)
+        entry = {"table": item.table, "ref_date": item.ref_date, "lang": item.lang,
+                 "data": data_digest, "output_dir": output_dir, "output": item.output_path}
+        Path(self.path).parent.mkdir(parents=True, exist_ok=True)
+        with open(self.path, "a", encoding="utf-8") as f:
+            f.write(json_backend.dumps(entry) + "\n")
+        self.done.add((item.table, item.ref_date, item.lang, data_digest, output_dir))
+
+    def reset(self) -> None:
+        """Forget all progress and delete the checkpoint file."""
+        self.done.clear()
+        if os.path.exists(self.path):
+            os.remove(self.path)
+
+
+# =============================================================================
+# BACKFILL
+# =============================================================================
+
+class BackfillResult:
+    """Outcome of generating one (table, period, language) article."""
+    def __init__(self, table: str, ref_date: str, lang: str):
+        self.table = table
+        self.ref_date = ref_date
+        self.lang = lang
+        self.output_path: Optional[str] = None
+        self.error: Optional[str] = None
+        self.cached = False
+
+    @property
+    def ok(self) -> bool:
+        return self.error is None
+
+    def summary(self) -> str:
+        label = f"{self.table} {self.ref_date} [{self.lang}]"
+        if self.ok:
+            cached = " (cached)" if self.cached else ""
+            return f"OK    {label} -> {self.output_path}{cached}"
+        return f"FAIL  {label}: {self.error}"
+
+
+# Parsed data files, their sha256 and their ref_date index, keyed by path.
+# The parent fills this before starting the pool, so forked workers (and
+# threads) inherit every table already parsed; workers started any other way
+# load each file at most once themselves.
+_TABLE_DATA: Dict[str, Tuple[Dict[str, Any], str, PeriodIndex]] = {}
+
+
+def _table_data(data_path: str) -> Tuple[Dict[str, Any], str, PeriodIndex]:
+    loaded = _TABLE_DATA.get(data_path)
+    if loaded is None:
+        with open(data_path, "rb") as f:
+            raw = f.read()
+        data = json_backend.loads(raw)
+        loaded = _TABLE_DATA[data_path] = (data, digest_bytes(raw),
+                                           PeriodIndex(data.get("time_series", [])))
+    return loaded
+
+
+def _backfill_period(data_path: str, table: str, ref_date: str,
+                     langs: List[str], output_dir: str,
+                     use_cache: bool = False) -> List[BackfillResult]:
+    """Worker: rebase one table to one period and render it in every pending language."""
+    results = [BackfillResult(table, ref_date, lang) for lang in langs]
+    table_data, data_digest, index = _table_data(data_path)
+
+    # The table was validated once against its latest period; a historical
+    # period would always fail the freshness check
+    keys: Dict[str, str] = {}
+    pending = results
+    if use_cache:
+        cache = default_cache()
+        pending = []
+        for item in results:
+            keys[item.lang] = render_cache_key(cache, data_digest, output_dir, item.lang,
+                                               False, True, ref_date)
+            entry = cache.fetch(keys[item.lang])
+            if entry is None:
+                pending.append(item)
+            else:
+                item.output_path = entry["output"]
+                item.cached = True
+        if not pending:
+            return results
+
+    # Rebase and build the frame once so every language shares its rankings
+    try:
+        data = rebase_data_to_period(table_data, ref_date, index)
+        frame = SeriesFrame(data)
+    except Exception as e:
+        for item in pending:
+            item.error = f"{type(e).__name__}: {e}"
+        return results
+
+    for item in pending:
+        try:
+            item.output_path = generate_article_from_data(
+                data, output_dir, lang=item.lang, skip_validation=True,
+                source=f"{data_path}@{ref_date}", frame=frame
+            )
+            if use_cache:
+                default_cache().put(keys[item.lang], item.output_path,
+                                    attachments=article_attachments(item.output_path))
+        except Exception as e:
+            item.error = f"{type(e).__name__}: {e}"
+
+    return results
+
+
+def _prepare_table(table: str, data_dir: str, strict: bool,
+                   skip_validation: bool) -> Tuple[Optional[Dict[str, Any]], Optional[str]]:
+    """Load and validate one table's data file; returns (data, error)."""
+    data_path = data_file_for_table(data_dir, table)
+    try:
+        data, _, _ = _table_data(data_path)
+    except (OSError, ValueError) as e:
+        return None, f"could not load data: {e}"
+
+    if not skip_validation:
+        validation = validate_data(data, strict=strict, log=False)
+        if not validation.is_valid:
+            return None, f"data validation failed: {validation.errors}"
+    return data, None
+
+
+def backfill(tables: List[str], start: str, end: Optional[str] = None,
+             data_dir: str = "output", output_dir: str = "docs",
+             langs: List[str] = BATCH_LANGS, checkpoint_path: Optional[str] = None,
+             workers: Optional[int] = None, executor: str = "process",
+             strict: bool = False, skip_validation: bool = False,
+             restart: bool = False, use_cache: bool = False) -> List[BackfillResult]:
+    """
+    Generate every (table, period, language) article in a ref_date range.
+
+    Tables without a data file are reported and skipped. A table whose data
+    fails to load or validate marks all its periods failed; a failure in one
+    period or language does not stop the rest of the run. Articles already in
+    the checkpoint are not rendered again.
+
+    Args:
+        tables: Table numbers (e.g. "18-10-0004")
+        start: First ref_date to generate ("YYYY-MM")
+        end: Last ref_date to generate (default: each table's latest)
+        data_dir: Directory holding data_*.json files
+        output_dir: Output directory for Observable site
+        langs: Languages to render for each period
+        checkpoint_path: Progress file (default: data_dir/.backfill-checkpoint.jsonl)
+        workers: Pool size (default: CPU count; 1 runs in-process)
+        executor: "process" or "thread"
+        strict: Treat validation warnings as errors
+        skip_validation: Skip data validation (not recommended)
+        restart: Discard the checkpoint before starting
+        use_cache: Reuse unchanged articles from the render cache, so a
+            --restart over unchanged data rewrites nothing
+
+    Returns:
+        One BackfillResult per article attempted in this run, in
+        (table, period, language) order
+    """
+    langs = list(langs)
+    workers = workers or os.cpu_count() or 1
+    checkpoint = Checkpoint(checkpoint_path or os.path.join(data_dir, CHECKPOINT_NAME))
+    if restart:
+        checkpoint.reset()
+    start_time = time.perf_counter()
+
+    # Load each table once and work out which of its articles are still pending
+    jobs: List[Tuple[str, str, str, List[str]]] = []
+    failed: List[BackfillResult] = []
+    already_done = 0
+    for table in tables:
+        data_path = data_file_for_table(data_dir, table)
+        if not os.path.exists(data_path):
+            print(f"SKIP  {table}: no data file at {data_path}")
+            continue
+        data, error = _prepare_table(table, data_dir, strict, skip_validation)
+        if error:
+            item = BackfillResult(table, "*", "*")
+            item.error = error
+            failed.append(item)
+            print(item.summary())
+            continue
+        _, data_digest, _ = _table_data(data_path)
+        periods = periods_in_range(data, start, end)
+        if not periods:
+            print(f"SKIP  {table}: no periods between {start} and {end or 'latest'}")
+        for ref_date in periods:
+            pending = [lang for lang in langs
+                       if not checkpoint.is_done(table, ref_date, lang, data_digest, output_dir)]
+            already_done += len(langs) - len(pending)
+            if pending:
+                jobs.append((data_path, table, ref_date, pending))
+
+    if already_done:
+        print(f"Resuming: {already_done} article(s) already in {checkpoint.path}")
+
+    by_job: Dict[int, List[BackfillResult]] = {}
+
+    def finish(i: int, results: List[BackfillResult]) -> None:
+        by_job[i] = results
+        _, data_digest, _ = _table_data(jobs[i][0])
+        for item in results:
+            if item.ok:
+                checkpoint.record(item, data_digest, output_dir)
+            print(item.summary())
+
+    if workers == 1 or len(jobs) <= 1:
+        for i, job in enumerate(jobs):
+            finish(i, _backfill_period(*job, output_dir, use_cache))
+    else:
+        pool_class = ProcessPoolExecutor if executor == "process" else ThreadPoolExecutor
+        with pool_class(max_workers=min(workers, len(jobs))) as pool:
+            futures = {
+                pool.submit(_backfill_period, *job, output_dir, use_cache): i
+                for i, job in enumerate(jobs)
+            }
+            for future in as_completed(futures):
+                i = futures[future]
+                try:
+                    results = future.result()
+                except Exception as e:
+                    # Worker died (e.g. process killed); mark the period failed
+                    _, table, ref_date, pending = jobs[i]
+                    results = [BackfillResult(table, ref_date, lang) for lang in pending]
+                    for item in results:
+                        item.error = f"worker failed: {type(e).__name__}: {e}"
+                finish(i, results)
+
+    elapsed = time.perf_counter() - start_time
+    results = failed + [item for i in range(len(jobs)) for item in by_job[i]]
+    succeeded = sum(1 for item in results if item.ok)
+    rendered = sum(1 for item in results if item.lang != "*")
+    rate = succeeded / elapsed if elapsed > 0 else 0.0
+
+    print()
+    print(f"Backfill complete: {succeeded}/{rendered} articles for {len(jobs)} "
+          f"period(s) in {elapsed:.2f}s ({rate:.1f} articles/s, "
+          f"{workers} {executor} worker(s)); {already_done} already done, "
+          f"{len(failed)} table(s) failed")
+    if use_cache:
+        cached = sum(1 for item in results if item.cached)
+        print(f"Render cache: {cached} unchanged, {rendered - cached} rendered")
+
+    return results
+
+
+if __name__ == "__main__":
+    def month_arg(value: str) -> str:
+        try:
+            return normalize_month(value)
+        except ValueError as e:
+            raise argparse.ArgumentTypeError(str(e))
+
+    parser = argparse.ArgumentParser(
+        description="Backfill Observable articles for a range of historical periods"
+    )
+    parser.add_argument("--tables", nargs="+", default=None,
+                        help="Table numbers to backfill (default: every table in r-tools/table_configs.json)")
+    parser.add_argument("--from", dest="start", type=month_arg, required=True,
+                        help="First reference period to generate (YYYY-MM)")
+    parser.add_argument("--to", dest="end", type=month_arg, default=None,
+                        help="Last reference period to generate (default: latest available)")
+    parser.add_argument("--data-dir", default="output",
+                        help="Directory holding data_*.json files (default: output)")
+    parser.add_argument("--output-dir", default="docs",
+                        help="Output directory for Observable site (default: docs)")
+    parser.add_argument("--lang", choices=["en", "fr"], default=None,
+                        help="Only generate this language (default: en and fr)")
+    parser.add_argument("--checkpoint", default=None,
+                        help=f"Progress file (default: DATA_DIR/{CHECKPOINT_NAME})")
+    parser.add_argument("--restart", action="store_true",
+                        help="Discard the checkpoint and regenerate every article")
+    parser.add_argument("--no-cache", action="store_true",
+                        help="Render every article even if its inputs are unchanged")
+    parser.add_argument("--workers", type=int, default=None,
+                        help="Number of workers (default: CPU count)")
+    parser.add_argument("--executor", choices=["process", "thread"], default="process",
+                        help="Pool type for workers (default: process)")
+    parser.add_argument("--strict", action="store_true",
+                        help="Treat validation warnings as errors")
+    parser.add_argument("--skip-validation", action="store_true",
+                        help="Skip data validation (not recommended)")
+
+    args = parser.parse_args()
+
+    if args.end and args.end < args.start:
+        logger.error(f"--to {args.end} is before --from {args.start}")
+        sys.exit(1)
+
+    tables = args.tables or load_table_numbers()
+    results = backfill(
+        tables,
+        args.start,
+        args.end,
+        data_dir=args.data_dir,
+        output_dir=args.output_dir,
+        langs=[args.lang] if args.lang else BATCH_LANGS,
+        checkpoint_path=args.checkpoint,
+        workers=args.workers,
+        executor=args.executor,
+        strict=args.strict,
+        skip_validation=args.skip_validation,
+        restart=args.restart,
+        use_cache=not args.no_cache
+    )
+    sys.exit(0 if all(item.ok for item in results) else 1)
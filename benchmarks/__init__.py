@@ -0,0 +1 @@
+"""Benchmarks for the D-AI-LY Python pipeline. Run from the repo root with `python -m benchmarks.<name>`."""
@@ -0,0 +1,72 @@
+#!/usr/bin/env python3
+"""
+Benchmark: JSON load and dump for data_*.json and articles.json per backend.
+
+Times every installed json_backend (stdlib json, orjson, msgspec) on:
+
+- loading a pretty-printed data_*.json, as the R fetchers write it, both as a
+  plain dict and as a SeriesFrame (decoded to a dict, then converted)
+- dumping articles.json compact (production) and indented (previous format)
+
+at a realistic size and at --scale times that size.
+
+Usage:
+    python -m benchmarks.bench_json [--scale 100] [--repeat 20]
+"""
+
+import argparse
+import json
+import timeit
+
+from build_site import build_articles_json
+from json_backend import PREFERRED_BACKENDS, get_backend
+from series_frame import SeriesFrame
+from benchmarks.synthetic import make_data, make_date_grouped
+
+
+def _per_call(fn, n: int) -> float:
+    return min(timeit.repeat(fn, number=n, repeat=3)) / n
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.split("\n")[1])
+    parser.add_argument("--scale", type=int, default=100,
+                        help="size multiplier for the large case (default: 100)")
+    parser.add_argument("--repeat", type=int, default=20,
+                        help="calls per measurement at realistic size (default: 20)")
+    args = parser.parse_args()
+
+    backends = []
+    for name in PREFERRED_BACKENDS:
+        try:
+            backends.append(get_backend(name))
+        except ImportError:
+            print(f"({name} not installed, skipped)")
+
+    sizes = [("realistic", 1), (f"{args.scale}x", args.scale)]
+    print(f"{'case':<40} {'backend':<8} {'bytes':>12} {'time':>11}")
+    for label, scale in sizes:
+        # Realistic: 2 years of monthly data, CPI-sized breakdowns, ~a year of releases
+        data = make_data(periods=24 * scale, subseries=8 * scale, provincial=10 * scale)
+        articles = build_articles_json(make_date_grouped(days=250 * scale, per_day=3))
+        pretty_data = json.dumps(data, indent=2).encode("utf-8")
+        n = max(1, args.repeat // scale)
+
+        for backend in backends:
+            rows = [
+                (f"load data_*.json ({label})", len(pretty_data),
+                 lambda: backend.loads(pretty_data)),
+                (f"load data_*.json -> frame ({label})", len(pretty_data),
+                 lambda: SeriesFrame(backend.loads(pretty_data))),
+                (f"dump articles.json compact ({label})", len(backend.dumps(articles, True)),
+                 lambda: backend.dumps(articles, True)),
+                (f"dump articles.json indent ({label})", len(backend.dumps(articles, False)),
+                 lambda: backend.dumps(articles, False)),
+            ]
+            for case, size, fn in rows:
+                print(f"{case:<40} {backend.name:<8} {size:>11,}B {_per_call(fn, n) * 1e3:>9.2f}ms")
+        print()
+
+
+if __name__ == "__main__":
+    main()
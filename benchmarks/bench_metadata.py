@@ -0,0 +1,70 @@
+#!/usr/bin/env python3
+"""
+Benchmark: streaming early-exit metadata extraction vs full-document parsing.
+
+Generates enhanced HTML articles whose embedded time_series_json grows with
+--periods, then times build_site.extract_article_metadata against the old
+approach of reading and parsing the whole file before regex-matching it.
+
+Usage:
+    python -m benchmarks.bench_metadata [--periods 24 600 6000] [--repeat 50]
+"""
+
+import argparse
+import contextlib
+import io
+import json
+import re
+import tempfile
+import timeit
+from pathlib import Path
+
+import generate_article_enhanced
+from build_site import ArticleMetadataExtractor, extract_article_metadata
+from benchmarks.synthetic import make_data
+
+
+def extract_full(html_path: Path):
+    """The pre-streaming approach: parse everything, then regex the raw text."""
+    with open(html_path, "r", encoding="utf-8") as f:
+        content = f.read()
+    parser = ArticleMetadataExtractor()
+    parser.feed(content)
+    table_match = re.search(r'Table[^\d]*(\d{2}-\d{2}-\d{4})', content)
+    return parser.title, parser.release_date, table_match.group(1) if table_match else None
+
+
+def make_article(tmp: Path, periods: int) -> Path:
+    data_path = tmp / f"data_{periods}.json"
+    html_path = tmp / f"article_{periods}.html"
+    with open(data_path, "w") as f:
+        json.dump(make_data(periods=periods, subseries=8 + periods // 10), f)
+    with contextlib.redirect_stdout(io.StringIO()):
+        # max_points=0 embeds the whole series: the large page is the point here
+        generate_article_enhanced.generate_article(str(data_path), str(html_path), max_points=0)
+    return html_path
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.split("\n")[1])
+    parser.add_argument("--periods", type=int, nargs="+", default=[24, 600, 6000],
+                        help="time_series lengths to embed (default: 24 600 6000)")
+    parser.add_argument("--repeat", type=int, default=50,
+                        help="extractions per measurement (default: 50)")
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp:
+        print(f"{'periods':>8} {'size':>10} {'full parse':>12} {'streaming':>12} {'speedup':>8}")
+        for periods in args.periods:
+            html_path = make_article(Path(tmp), periods)
+            size = html_path.stat().st_size
+            n = args.repeat
+            full_s = min(timeit.repeat(lambda: extract_full(html_path), number=n, repeat=3)) / n
+            stream_s = min(timeit.repeat(lambda: extract_article_metadata(html_path),
+                                         number=n, repeat=3)) / n
+            print(f"{periods:>8} {size:>9,}B {full_s * 1e3:>10.2f}ms {stream_s * 1e3:>10.2f}ms "
+                  f"{full_s / stream_s:>7.1f}x")
+
+
+if __name__ == "__main__":
+    main()
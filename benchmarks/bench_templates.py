@@ -0,0 +1,125 @@
+#!/usr/bin/env python3
+"""
+Benchmark: compiled template engine vs the old replace/re.sub chain.
+
+Renders templates/article_enhanced.html with a realistic context both ways,
+checks the outputs agree (ignoring whitespace-only lines), and reports the
+per-render time.
+
+Usage:
+    python -m benchmarks.bench_templates [--periods 24] [--repeat 2000]
+"""
+
+import argparse
+import json
+import re
+import timeit
+from pathlib import Path
+
+import generate_article_enhanced as enhanced
+from template_engine import Template, load_template
+from translations import RenderContext
+from benchmarks.synthetic import make_data
+
+TEMPLATE_PATH = Path(__file__).parent.parent / "templates" / "article_enhanced.html"
+
+
+def build_context(data):
+    render_ctx = RenderContext("en")
+    return {
+        "headline": enhanced.generate_headline(data, render_ctx),
+        "release_date": "December 16, 2025",
+        "chart_title": "Consumer Price Index, November 2023 to November 2025",
+        "chart_y_label": "Index (2002=100)",
+        "series_name": data["metadata"]["series_name"],
+        "note_to_readers": enhanced.generate_note_to_readers(data, render_ctx),
+        "table_number": data["metadata"]["table_number"],
+        "reference_period": "November 2025",
+        "table_viewer_url": data["urls"]["table_viewer"],
+        "csv_download_url": data["urls"]["csv_download"],
+        "cansim_id": data["metadata"]["cansim_id"],
+        "survey_code": "2301",
+        "survey_name": "Consumer Price Index",
+        "release_date_source": "December 16, 2025",
+        "time_series_json": json.dumps(data["time_series"]),
+        "subseries_json": json.dumps(data["subseries"]),
+        "provincial_json": json.dumps(data["provincial"]),
+        "subseries_title": "Prices by major component",
+        "subseries_column_header": "Component",
+        "subseries_table_caption": "Consumer Price Index by major component, November 2025",
+        "subseries_chart_title": "Year-over-year change by component",
+        "subseries_narrative": enhanced.generate_subseries_narrative(data, render_ctx),
+        "provincial_table_caption": "Consumer Price Index by province, November 2025",
+        "provincial_narrative": enhanced.generate_provincial_narrative(data, render_ctx),
+        "has_subseries": True,
+        "has_provincial": True,
+        "has_definitions": False,
+        "full_series_file": "",
+        "highlights": enhanced.generate_highlights(data, render_ctx),
+        "sections": enhanced.generate_sections(data, render_ctx),
+    }
+
+
+def replace_chain(template: str, ctx) -> str:
+    """The substitution sequence generate_article_enhanced used before the engine."""
+    html = template
+    for key in ("headline", "release_date", "chart_title", "chart_y_label", "series_name",
+                "note_to_readers", "table_number", "reference_period",
+                "table_viewer_url", "csv_download_url"):
+        html = html.replace("{{" + key + "}}", ctx[key])
+    html = re.sub(r'\{\{#cansim_id\}\}', '', html)
+    html = re.sub(r'\{\{/cansim_id\}\}', '', html)
+    html = html.replace("{{cansim_id}}", ctx["cansim_id"])
+    for key in ("survey_code", "survey_name", "release_date_source", "time_series_json",
+                "subseries_json", "provincial_json", "subseries_title",
+                "subseries_column_header", "subseries_table_caption",
+                "subseries_chart_title", "subseries_narrative",
+                "provincial_table_caption", "provincial_narrative"):
+        html = html.replace("{{" + key + "}}", ctx[key])
+    for key in ("has_subseries", "has_provincial"):
+        html = re.sub(r'\{\{#' + key + r'\}\}', '', html)
+        html = re.sub(r'\{\{/' + key + r'\}\}', '', html)
+    html = re.sub(r'\{\{#has_definitions\}\}.*?\{\{/has_definitions\}\}', '', html, flags=re.DOTALL)
+    html = re.sub(r'\{\{#full_series_file\}\}.*?\{\{/full_series_file\}\}', '', html, flags=re.DOTALL)
+    highlights_html = "\n".join(f"      <li>{h}</li>" for h in ctx["highlights"])
+    html = re.sub(r'\{\{#highlights\}\}.*?\{\{/highlights\}\}', highlights_html, html, flags=re.DOTALL)
+    sections_html = "\n".join(f"    <p>{s}</p>" for s in ctx["sections"])
+    html = re.sub(r'\{\{#sections\}\}.*?\{\{/sections\}\}', sections_html, html, flags=re.DOTALL)
+    return html
+
+
+def _normalize(html: str) -> str:
+    return "\n".join(line.strip() for line in html.splitlines() if line.strip())
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.split("\n")[1])
+    parser.add_argument("--periods", type=int, default=24,
+                        help="time_series length embedded in the page (default: 24)")
+    parser.add_argument("--repeat", type=int, default=2000,
+                        help="renders per measurement (default: 2000)")
+    args = parser.parse_args()
+
+    data = make_data(periods=args.periods)
+    ctx = build_context(data)
+    source = TEMPLATE_PATH.read_text(encoding="utf-8")
+    template = load_template(TEMPLATE_PATH)
+
+    old_html = replace_chain(source, ctx)
+    new_html = template.render(ctx)
+    if _normalize(old_html) != _normalize(new_html):
+        raise SystemExit("Outputs differ beyond whitespace")
+
+    n = args.repeat
+    compile_s = timeit.timeit(lambda: Template(source), number=max(1, n // 10)) / max(1, n // 10)
+    old_s = min(timeit.repeat(lambda: replace_chain(source, ctx), number=n, repeat=3)) / n
+    new_s = min(timeit.repeat(lambda: template.render(ctx), number=n, repeat=3)) / n
+
+    print(f"Template: {TEMPLATE_PATH.name}, output {len(new_html):,} bytes, {args.periods} periods")
+    print(f"  compile (once per mtime): {compile_s * 1e6:8.1f} us")
+    print(f"  replace chain:            {old_s * 1e6:8.1f} us/render")
+    print(f"  compiled render:          {new_s * 1e6:8.1f} us/render ({old_s / new_s:.1f}x)")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,196 @@
+#!/usr/bin/env python3
+"""
+Benchmark suite: every generator and the site build at several input scales.
+
+For each scale, synthetic data (time_series length, subseries and provincial
+category counts) and a synthetic article archive are generated, then these
+are timed:
+
+- generate_article in generate_article.py, generate_article_enhanced.py and
+  generate_article_observable.py (file in, article out)
+- review_and_fix_article, validate_data and rebase_data_to_period
+- build_site end to end, both a full build and an incremental no-op rebuild
+
+Results are printed and written as JSON (default: benchmarks/results/<commit>.json)
+so runs on different commits can be compared with --compare.
+
+Usage:
+    python -m benchmarks.suite [--scales small realistic large] [--budget 0.2]
+    python -m benchmarks.suite --compare benchmarks/results/abc1234.json
+"""
+
+import argparse
+import contextlib
+import io
+import json
+import logging
+import platform
+import subprocess
+import sys
+import tempfile
+import time
+import timeit
+from pathlib import Path
+from typing import Any, Callable, Dict, List, Optional
+
+import generate_article
+import generate_article_enhanced
+import generate_article_observable
+import json_backend
+from build_site import build_site
+from series_frame import PeriodIndex, SeriesFrame
+from benchmarks.synthetic import make_archive, make_data
+
+RESULTS_DIR = Path(__file__).parent / "results"
+RESULTS_VERSION = 1
+
+# name -> synthetic input sizes; archive is release days x articles per day per language
+SCALES: Dict[str, Dict[str, int]] = {
+    "small": {"periods": 24, "subseries": 8, "provincial": 10, "archive_days": 30, "per_day": 2},
+    "realistic": {"periods": 120, "subseries": 20, "provincial": 13, "archive_days": 250, "per_day": 3},
+    "large": {"periods": 600, "subseries": 200, "provincial": 60, "archive_days": 1000, "per_day": 3},
+}
+
+# Default ratio over the baseline at which --compare flags a case as slower
+REGRESSION_THRESHOLD = 1.10
+
+
+def _per_call(fn: Callable[[], Any], n: int) -> float:
+    return min(timeit.repeat(fn, number=n, repeat=3)) / n
+
+
+def _time(fn: Callable[[], Any], budget: float) -> Dict[str, float]:
+    """
+    Time fn with stdout silenced; returns seconds per call and calls per
+    measurement, choosing as many calls (up to 10000) as fit in `budget`
+    seconds so fast cases are not dominated by timer noise.
+    """
+    with contextlib.redirect_stdout(io.StringIO()):
+        start = time.perf_counter()
+        fn()  # warm caches (compiled templates, translation catalogs) like a real run
+        elapsed = time.perf_counter() - start
+        n = max(1, min(10000, int(budget / max(elapsed, 1e-7))))
+        return {"seconds": _per_call(fn, n), "calls": n}
+
+
+def run_scale(name: str, sizes: Dict[str, int], tmp: Path, budget: float) -> List[Dict[str, Any]]:
+    """Build the inputs for one scale and time every case on them."""
+    data = make_data(periods=sizes["periods"], subseries=sizes["subseries"],
+                     provincial=sizes["provincial"])
+    data_path = tmp / "data.json"
+    with open(data_path, "w", encoding="utf-8") as f:
+        json.dump(data, f, indent=2)  # pretty-printed, as the R fetchers write it
+
+    observable_dir = tmp / "docs"
+    with contextlib.redirect_stdout(io.StringIO()):
+        markdown_path = generate_article_observable.generate_article(
+            str(data_path), str(observable_dir), skip_validation=True)
+    markdown = Path(markdown_path).read_text(encoding="utf-8")
+    frame = SeriesFrame(data)
+    middle = data["time_series"][len(data["time_series"]) // 2]["ref_date"]
+    # backfill indexes each table once and reuses it for every period
+    period_index = PeriodIndex(data["time_series"])
+
+    project = tmp / "project"
+    archive_size = make_archive(project / "output" / "articles",
+                                days=sizes["archive_days"], per_day=sizes["per_day"])
+
+    cases = [
+        ("generate_article.py", lambda: generate_article.generate_article(
+            str(data_path), str(tmp / "legacy.md"))),
+        ("generate_article_enhanced.py", lambda: generate_article_enhanced.generate_article(
+            str(data_path), str(tmp / "enhanced.html"))),
+        ("generate_article_observable.py", lambda: generate_article_observable.generate_article(
+            str(data_path), str(observable_dir), skip_validation=True)),
+        ("review_and_fix_article", lambda: generate_article_observable.review_and_fix_article(
+            markdown, frame, "en")),
+        ("validate_data", lambda: generate_article_observable.validate_data(data, log=False)),
+        ("rebase_data_to_period", lambda: generate_article_observable.rebase_data_to_period(
+            data, middle, period_index)),
+        ("build_site full", lambda: build_site(project, full=True)),
+        ("build_site incremental", lambda: build_site(project)),
+    ]
+
+    params = dict(sizes, archive_files=archive_size)
+    results = []
+    for case, fn in cases:
+        timing = _time(fn, budget)
+        results.append({"scale": name, "case": case, "params": params, **timing})
+        print(f"{name:<10} {case:<32} {timing['seconds'] * 1e3:>11.3f}ms  (x{timing['calls']})")
+    return results
+
+
+def _git_commit() -> Optional[str]:
+    try:
+        out = subprocess.run(["git", "rev-parse", "--short", "HEAD"], capture_output=True,
+                             text=True, cwd=Path(__file__).parent, check=True)
+        return out.stdout.strip() or None
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+
+def compare(baseline: Dict[str, Any], current: Dict[str, Any],
+            threshold: float = REGRESSION_THRESHOLD) -> int:
+    """Print per-case ratios against a baseline run; returns the number of regressions."""
+    before = {(r["scale"], r["case"]): r["seconds"] for r in baseline["results"]}
+    regressions = 0
+    print(f"Compared with {baseline.get('commit') or 'baseline'} "
+          f"(flagging cases over {threshold:.2f}x slower)")
+    print(f"{'scale':<10} {'case':<32} {'before':>12} {'after':>12} {'ratio':>7}")
+    for r in current["results"]:
+        old = before.get((r["scale"], r["case"]))
+        if old is None:
+            continue
+        ratio = r["seconds"] / old if old > 0 else float("inf")
+        flag = "  SLOWER" if ratio > threshold else ""
+        regressions += bool(flag)
+        print(f"{r['scale']:<10} {r['case']:<32} {old * 1e3:>10.3f}ms "
+              f"{r['seconds'] * 1e3:>10.3f}ms {ratio:>6.2f}x{flag}")
+    return regressions
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.split("\n")[1])
+    parser.add_argument("--scales", nargs="+", choices=list(SCALES), default=list(SCALES),
+                        help="input scales to run (default: all)")
+    parser.add_argument("--budget", type=float, default=0.2,
+                        help="target seconds per measurement; slower cases run once (default: 0.2)")
+    parser.add_argument("--output", type=Path, default=None,
+                        help="results JSON path (default: benchmarks/results/<commit>.json)")
+    parser.add_argument("--compare", type=Path, default=None,
+                        help="baseline results JSON to compare against; exits 1 on regressions")
+    parser.add_argument("--threshold", type=float, default=REGRESSION_THRESHOLD,
+                        help=f"slowdown ratio flagged by --compare (default: {REGRESSION_THRESHOLD})")
+    args = parser.parse_args()
+
+    # The generators log every article at INFO
+    logging.disable(logging.INFO)
+
+    commit = _git_commit()
+    run = {
+        "version": RESULTS_VERSION,
+        "commit": commit,
+        "timestamp": time.strftime("%Y-%m-%dT%H:%M:%S"),
+        "python": platform.python_version(),
+        "json_backend": json_backend.BACKEND,
+        "results": [],
+    }
+
+    print(f"{'scale':<10} {'case':<32} {'time':>13}")
+    for name in args.scales:
+        with tempfile.TemporaryDirectory() as tmp:
+            run["results"].extend(run_scale(name, SCALES[name], Path(tmp), args.budget))
+
+    output = args.output or RESULTS_DIR / f"{commit or 'results'}.json"
+    output.parent.mkdir(parents=True, exist_ok=True)
+    json_backend.dump(run, output, compact=False)
+    print(f"\nSaved results: {output}")
+
+    if args.compare:
+        print()
+        regressions = compare(json_backend.load(args.compare), run, args.threshold)
+        sys.exit(1 if regressions else 0)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,173 @@
+#!/usr/bin/env python3
+"""
+Synthetic CANSIM-style data for benchmarks.
+
+Builds data dicts shaped like the R fetchers' data_*.json output, with
+tunable time-series length and breakdown sizes, and article archives shaped
+like build_site's output/articles input.
+"""
+
+import contextlib
+import datetime
+import io
+import json
+import random
+import re
+from pathlib import Path
+from typing import Any, Dict, List
+
+SUBSERIES_NAMES = [
+    "Food", "Shelter", "Household operations, furnishings and equipment",
+    "Clothing and footwear", "Transportation", "Health and personal care",
+    "Recreation, education and reading", "Alcoholic beverages, tobacco products and recreational cannabis",
+]
+
+PROVINCES = [
+    "Newfoundland and Labrador", "Prince Edward Island", "Nova Scotia",
+    "New Brunswick", "Quebec", "Ontario", "Manitoba", "Saskatchewan",
+    "Alberta", "British Columbia",
+]
+
+
+def _ref_dates(n: int, end_year: int, end_month: int) -> List[str]:
+    dates = []
+    year, month = end_year, end_month
+    for _ in range(n):
+        dates.append(f"{year:04d}-{month:02d}")
+        month -= 1
+        if month == 0:
+            year, month = year - 1, 12
+    dates.reverse()
+    return dates
+
+
+def _names(base: List[str], n: int, prefix: str) -> List[str]:
+    return (base + [f"{prefix} {i}" for i in range(max(0, n - len(base)))])[:n]
+
+
+def _breakdown(names: List[str], rng: random.Random) -> Dict[str, List]:
+    return {
+        "category": names,
+        "value": [round(rng.uniform(100, 200), 1) for _ in names],
+        "yoy_pct_change": [round(rng.uniform(-1, 5), 1) for _ in names],
+        "mom_pct_change": [round(rng.uniform(-1, 1), 1) for _ in names],
+    }
+
+
+def make_data(series_name: str = "Consumer Price Index", periods: int = 24,
+              subseries: int = 8, provincial: int = 10,
+              end: str = "2025-11", seed: int = 0) -> Dict[str, Any]:
+    """Build one synthetic data file as a dict."""
+    rng = random.Random(seed)
+    end_year, end_month = (int(part) for part in end.split("-"))
+    ref_dates = _ref_dates(periods, end_year, end_month)
+
+    value = 150.0
+    time_series = []
+    for ref_date in ref_dates:
+        value *= 1 + rng.uniform(-0.005, 0.008)
+        time_series.append({
+            "date": f"{ref_date}-01",
+            "ref_date": ref_date,
+            "value": round(value, 2),
+            "mom_pct_change": round(rng.uniform(-0.5, 0.8), 2),
+            "yoy_pct_change": round(rng.uniform(0.5, 3.5), 2),
+        })
+
+    latest = dict(time_series[-1])
+    previous = time_series[-2] if periods >= 2 else time_series[-1]
+    year_ago = time_series[-13] if periods >= 13 else time_series[0]
+
+    return {
+        "metadata": {
+            "table_number": "18-10-0004-01",
+            "table_title": f"{series_name}, monthly",
+            "series_name": series_name,
+            "reference_period": latest["ref_date"],
+            "cansim_id": "326-0020",
+            "release_time": "2025-12-16T08:30",
+            "survey_code": "2301",
+        },
+        "urls": {
+            "table_viewer": "https://www150.statcan.gc.ca/t1/tbl1/en/tv.action?pid=1810000401",
+            "csv_download": "https://www150.statcan.gc.ca/t1/tbl1/en/dtl!downloadDbLoadingData.action?pid=1810000401",
+        },
+        "latest": latest,
+        "comparison": {
+            "previous_period": {"ref_date": previous["ref_date"], "value": previous["value"]},
+            "year_ago": {"ref_date": year_ago["ref_date"], "value": year_ago["value"]},
+        },
+        "time_series": time_series,
+        "subseries": _breakdown(_names(SUBSERIES_NAMES, subseries, "Component"), rng),
+        "provincial": _breakdown(_names(PROVINCES, provincial, "Region"), rng),
+        "validation": {"passed": True, "warnings": {}, "errors": {}},
+    }
+
+
+def make_date_grouped(days: int = 30, per_day: int = 3,
+                      end: str = "2025-12-16") -> Dict[str, Dict[str, List[Dict]]]:
+    """
+    Build build_site's date-grouped article metadata for `days` release days
+    with `per_day` articles in each language.
+    """
+    last = datetime.date.fromisoformat(end)
+    grouped: Dict[str, Dict[str, List[Dict]]] = {}
+    for d in range(days):
+        date = (last - datetime.timedelta(days=d)).isoformat()
+        grouped[date] = {}
+        for lang in ("en", "fr"):
+            grouped[date][lang] = [
+                {
+                    "slug": f"article-{d}-{i}",
+                    "title": f"Synthetic article {i} released {date}",
+                    "table_number": f"{10 + i % 90:02d}-10-{i:04d}-01",
+                    "filename": f"article-{d}-{i}.html",
+                    "date": date,
+                }
+                for i in range(per_day)
+            ]
+    return grouped
+
+
+RELEASE_DATE_RE = re.compile(r'(class="release-date">)[^<]*')
+
+
+def make_archive(articles_dir: Path, days: int = 30, per_day: int = 3,
+                 periods: int = 24, end: str = "2025-12-16") -> int:
+    """
+    Write an output/articles tree for build_site: `per_day` enhanced articles
+    in each language for each of `days` release days, ending at `end`.
+
+    One article per language is rendered; the rest are copies of it with
+    their own filename and release date. Returns the number of files written.
+    """
+    # Imported here so the data-only helpers above stay dependency-free
+    import generate_article_enhanced
+
+    last = datetime.date.fromisoformat(end)
+    data_path = articles_dir / "data.json"
+    articles_dir.mkdir(parents=True, exist_ok=True)
+    with open(data_path, "w", encoding="utf-8") as f:
+        json.dump(make_data(periods=periods), f)
+
+    written = 0
+    for lang in ("en", "fr"):
+        lang_dir = articles_dir / lang
+        lang_dir.mkdir(parents=True, exist_ok=True)
+        rendered = lang_dir / "template.html"
+        with contextlib.redirect_stdout(io.StringIO()):
+            generate_article_enhanced.generate_article(str(data_path), str(rendered), lang)
+        html = rendered.read_text(encoding="utf-8")
+        rendered.unlink()
+
+        for d in range(days):
+            date = last - datetime.timedelta(days=d)
+            released = RELEASE_DATE_RE.sub(
+                lambda m: f"{m.group(1)}Released: {date:%B} {date.day}, {date.year}", html, count=1
+            )
+            for i in range(per_day):
+                (lang_dir / f"article-{date.isoformat()}-{i}.html").write_text(released, encoding="utf-8")
+                written += 1
+
+    data_path.unlink()
+    return written
@@ -4,57 +4,154 @@ The D-AI-LY Site Builder
 
 Generates the static site from article HTML files:
 - index.html: SPA-style homepage with date navigation
-- articles.json: Date-keyed metadata for both languages
-- Copies articles to site/articles/en/ and site/articles/fr/
+- archive.html: Month index linking to archive/<lang>/<YYYY-MM>.html pages
+- articles.json: Index of dates and per-month metadata shards, which hold
+  the date-keyed articles of both languages (articles-by-month/<YYYY-MM>.json)
+- search/: Prebuilt search index over titles, tables and series (search_index.py)
+- Syncs articles to site/articles/en/ and site/articles/fr/
+
+Builds are incremental: a manifest of every source article's size, mtime and
+content hash (output/.build-manifest.json) lets unchanged articles reuse their
+cached metadata, and archive month pages whose articles did not change are
+not rebuilt. Pass --full to ignore it. Publishing compares source and site
+files directly, so only new or changed articles are linked or copied; the
+manifest also lists the files each sync published, and a deleted article is
+removed from the site only if a sync put it there.
 """
 
 import os
 import re
-import json
-import shutil
+import codecs
+import hashlib
+import argparse
 from pathlib import Path
 from datetime import datetime
-from typing import Dict, List, Optional, Any
+from typing import Dict, List, Optional, Any, Set, Tuple
 from html.parser import HTMLParser
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+
+import json_backend
+from atomic_write import copy_if_changed, write_if_changed
+from search_index import STATE_NAME as SEARCH_STATE_NAME, build_search_index
+from translations import RenderContext
+
+
+# Sidecar written next to enhanced articles whose chart is downsampled
+# (see generate_article_enhanced.FULL_SERIES_SUFFIX)
+FULL_SERIES_SUFFIX = ".series.json"
+
+# articles.json is an index of dates and month shards; each month's articles
+# are in site/<SHARD_DIR>/<YYYY-MM>.json, fetched by js/navigation.js on demand
+ARTICLES_JSON_VERSION = 2
+SHARD_DIR = "articles-by-month"
+
+# <meta name="daily:series" content="..."> in the head of generated articles
+SERIES_META_NAME = "daily:series"
+
+# Bytes of article HTML fed to the metadata parser per read
+METADATA_CHUNK_SIZE = 16384
+# Bytes per read of the rest of an article, which is only hashed
+HASH_CHUNK_SIZE = 1 << 20
+
+TABLE_NUMBER_RE = re.compile(r'Table[^\d]*(\d{2}-\d{2}-\d{4})')
+# A "Table" reference that could still complete with more text
+TABLE_PARTIAL_RE = re.compile(r'Table[^\d]*(\d{1,2}(-(\d{1,2}(-\d{0,3})?)?)?)?')
 
 
 class ArticleMetadataExtractor(HTMLParser):
-    """Extract title and metadata from article HTML."""
+    """
+    Extract title and metadata from article HTML.
+
+    The table number is matched against the text content (so markup such as
+    <a href="...pid=1810000401"> between "Table" and the number is skipped).
+    Once the title, release date and table number are all known, is_complete
+    turns true and callers can stop feeding the rest of the document.
+    """
 
     def __init__(self):
         super().__init__()
         self.title = ""
         self.in_h1 = False
+        self.title_done = False
         self.in_release_date = False
+        self.release_date_tag: Optional[str] = None
         self.release_date = ""
+        self.release_date_done = False
+        self.table_number: Optional[str] = None
+        self.series: Optional[str] = None
+        self._table_text = ""
+
+    @property
+    def is_complete(self) -> bool:
+        return self.title_done and self.release_date_done and self.table_number is not None
 
     def handle_starttag(self, tag, attrs):
         if tag == "h1":
             self.in_h1 = True
-        attrs_dict = dict(attrs)
-        if attrs_dict.get("class") == "release-date":
+        attrs = dict(attrs)
+        if tag == "meta" and attrs.get("name") == SERIES_META_NAME:
+            self.series = attrs.get("content") or None
+        if self.release_date_tag is None and attrs.get("class") == "release-date":
             self.in_release_date = True
+            self.release_date_tag = tag
 
     def handle_endtag(self, tag):
-        if tag == "h1":
+        if tag == "h1" and self.in_h1:
             self.in_h1 = False
-        if self.in_release_date and tag == "div":
+            self.title_done = True
+        if self.in_release_date and tag == self.release_date_tag:
             self.in_release_date = False
+            self.release_date_done = True
 
     def handle_data(self, data):
         if self.in_h1:
             self.title += data.strip()
         if self.in_release_date:
             self.release_date += data.strip()
+        if self.table_number is None:
+            self._match_table_number(data)
+
+    def _match_table_number(self, data: str) -> None:
+        # Only the text since the last still-open "Table" needs to be kept
+        text = self._table_text + data
+        if "Table" not in text:
+            self._table_text = text[-4:]  # a "Tabl" split across data calls
+            return
+        match = TABLE_NUMBER_RE.search(text)
+        if match:
+            self.table_number = match.group(1)
+            self._table_text = ""
+            return
+        start = text.rfind("Table")
+        if start != -1 and TABLE_PARTIAL_RE.fullmatch(text, start):
+            self._table_text = text[start:]
+        else:
+            self._table_text = text[-4:]  # a "Tabl" split across data calls
+
+
+def extract_article_metadata(html_path: Path, lang: str = "en", hasher=None) -> Dict:
+    """
+    Extract metadata from an article HTML file.
 
-
-def extract_article_metadata(html_path: Path, lang: str = "en") -> Dict:
-    """Extract metadata from an article HTML file."""
-    with open(html_path, "r", encoding="utf-8") as f:
-        content = f.read()
-
+    The file is parsed in chunks and parsing stops as soon as the title,
+    release date and table number have been seen, so embedded chart data
+    further down the page is never parsed. Without a hasher (a hashlib
+    object) reading stops there too; with one, the rest of the file is read
+    only to update it, so a single pass both hashes and parses the file.
+    """
     parser = ArticleMetadataExtractor()
-    parser.feed(content)
+    decoder = codecs.getincrementaldecoder("utf-8")()
+    with open(html_path, "rb") as f:
+        while not parser.is_complete:
+            chunk = f.read(METADATA_CHUNK_SIZE)
+            if hasher is not None:
+                hasher.update(chunk)
+            parser.feed(decoder.decode(chunk, final=not chunk))
+            if not chunk:
+                break
+        if hasher is not None:
+            for chunk in iter(lambda: f.read(HASH_CHUNK_SIZE), b""):
+                hasher.update(chunk)
 
     # Extract date from filename pattern
     filename = html_path.stem
@@ -100,62 +197,253 @@ def extract_article_metadata(html_path: Path, lang: str = "en") -> Dict:
             except ValueError:
                 continue
 
-    # Extract table number from source section
-    table_match = re.search(r'Table[^\d]*(\d{2}-\d{2}-\d{4})', content)
-    table_number = table_match.group(1) if table_match else None
-
     return {
         "title": parser.title,
         "date": article_date,
-        "table_number": table_number,
+        "table_number": parser.table_number,
         "filename": html_path.name,
         "slug": html_path.stem,
-        "lang": lang
+        "lang": lang,
+        "series": parser.series
     }
 
 
-def get_bilingual_articles(articles_base: Path) -> Dict[str, Dict[str, List[Dict]]]:
+# =============================================================================
+# BUILD MANIFEST
+# =============================================================================
+
+MANIFEST_NAME = ".build-manifest.json"
+# Bump when extract_article_metadata() changes so cached metadata is rebuilt
+MANIFEST_VERSION = 3
+
+
+class BuildManifest:
+    """
+    Persisted record of the source articles seen by the last build.
+
+    Entries are keyed by path relative to the articles directory and hold the
+    file's size, mtime, sha256 and extracted metadata. A file whose size and
+    mtime match is trusted without being read; one whose stat changed is
+    re-hashed, and only re-parsed if its content actually changed.
+
+    Pages lists the generated pages that are rebuilt only when their inputs
+    change, keyed by path relative to the site directory, with a hash of
+    those inputs. Published lists the article files the last sync put in
+    site/articles/, so only those are ever deleted from it.
+    """
+
+    def __init__(self, path: Optional[Path] = None, load: bool = True):
+        self.path = path
+        self.previous: Dict[str, Dict] = {}
+        self.entries: Dict[str, Dict] = {}
+        self.previous_pages: Dict[str, str] = {}
+        self.pages: Dict[str, str] = {}
+        self.previous_published: Set[str] = set()
+        self.published: List[str] = []
+        self.hits = 0
+        self.misses = 0
+
+        # The published list is kept even with load=False: it records what
+        # the last sync owns, not cached work
+        if path is not None and path.exists():
+            try:
+                saved = json_backend.load(path)
+                if saved.get("version") == MANIFEST_VERSION:
+                    self.previous_published = set(saved.get("published", []))
+                    if load:
+                        self.previous = saved.get("entries", {})
+                        self.previous_pages = saved.get("pages", {})
+            except (OSError, ValueError) as e:
+                print(f"Warning: Ignoring unreadable build manifest {path}: {e}")
+
+    def cached(self, html_path: Path, key: str, lang: str) -> Optional[Dict]:
+        """
+        Return cached metadata if the file's size and mtime are unchanged.
+
+        This only stats the file; on a hit the entry is carried into this build.
+        """
+        previous = self.previous.get(key)
+        if not previous or previous["lang"] != lang:
+            return None
+        stat = html_path.stat()
+        if previous["size"] != stat.st_size or previous["mtime_ns"] != stat.st_mtime_ns:
+            return None
+        self.entries[key] = previous
+        self.hits += 1
+        return previous["metadata"]
+
+    def page_unchanged(self, name: str, signature: str) -> bool:
+        """
+        Record the input signature of a generated page (path relative to the
+        site directory); True if the last build generated it from the same one.
+        """
+        self.pages[name] = signature
+        return self.previous_pages.get(name) == signature
+
+    def known_sha256(self, key: str, lang: str) -> Optional[str]:
+        """Content hash recorded by the last build, if it was scanned in the same language."""
+        previous = self.previous.get(key)
+        if previous and previous["lang"] == lang:
+            return previous["sha256"]
+        return None
+
+    def record(self, key: str, entry: Dict) -> Dict:
+        """
+        Store a fresh scan_article() entry and return its metadata.
+
+        An entry without metadata means the content hash matched the last
+        build, so the previous metadata is reused.
+        """
+        if entry["metadata"] is None:
+            entry = dict(entry, metadata=self.previous[key]["metadata"])
+            self.hits += 1
+        else:
+            self.misses += 1
+        self.entries[key] = entry
+        return entry["metadata"]
+
+    def save(self) -> None:
+        """Write the entries seen in this build; files no longer present are dropped."""
+        if self.path is None:
+            return
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        json_backend.dump({"version": MANIFEST_VERSION, "entries": self.entries,
+                           "pages": self.pages, "published": self.published}, self.path)
+
+
+def scan_article(html_path: Path, lang: str, known_sha256: Optional[str] = None,
+                 with_hash: bool = True) -> Dict:
+    """
+    Read one article and return a manifest entry for it.
+
+    The file is hashed in the same pass that extracts its metadata, and
+    the metadata is kept only when the content hash differs from
+    known_sha256; otherwise the entry's metadata is None. With
+    with_hash=False the file is not hashed and reading stops early.
+    Runs in pool workers, so it must not touch shared state.
+    """
+    stat = html_path.stat()
+    entry = {"size": stat.st_size, "mtime_ns": stat.st_mtime_ns,
+             "sha256": None, "lang": lang, "metadata": None}
+
+    if not with_hash:
+        entry["metadata"] = extract_article_metadata(html_path, lang)
+        return entry
+
+    hasher = hashlib.sha256()
+    metadata = extract_article_metadata(html_path, lang, hasher)
+    entry["sha256"] = hasher.hexdigest()
+    if entry["sha256"] != known_sha256:
+        entry["metadata"] = metadata
+    return entry
+
+
+def _scan_articles(tasks: List[Tuple[Path, str, str]], manifest: Optional[BuildManifest],
+                   workers: int, executor: str) -> List[Any]:
+    """
+    Get metadata for (path, manifest key, lang) tasks, in task order.
+
+    Manifest hits are resolved here with a stat; the remaining files are read
+    and parsed over a thread or process pool. Failed items hold the exception.
+    """
+    results: List[Any] = [None] * len(tasks)
+    pending = []
+
+    for i, (html_file, key, lang) in enumerate(tasks):
+        try:
+            cached = manifest.cached(html_file, key, lang) if manifest else None
+        except OSError as e:
+            results[i] = e
+            continue
+        if cached is not None:
+            results[i] = cached
+        else:
+            known = manifest.known_sha256(key, lang) if manifest else None
+            pending.append((i, (html_file, lang, known, manifest is not None)))
+
+    if workers > 1 and len(pending) > 1:
+        pool_class = ProcessPoolExecutor if executor == "process" else ThreadPoolExecutor
+        with pool_class(max_workers=min(workers, len(pending))) as pool:
+            futures = [(i, pool.submit(scan_article, *args)) for i, args in pending]
+            scanned = []
+            for i, future in futures:
+                try:
+                    scanned.append((i, future.result()))
+                except Exception as e:
+                    scanned.append((i, e))
+    else:
+        scanned = []
+        for i, args in pending:
+            try:
+                scanned.append((i, scan_article(*args)))
+            except Exception as e:
+                scanned.append((i, e))
+
+    # Record in task order so the manifest and output are deterministic
+    for i, entry in scanned:
+        if isinstance(entry, Exception):
+            results[i] = entry
+        elif manifest is not None:
+            results[i] = manifest.record(tasks[i][1], entry)
+        else:
+            results[i] = entry["metadata"]
+
+    return results
+
+
+def get_bilingual_articles(articles_base: Path,
+                           manifest: Optional[BuildManifest] = None,
+                           workers: int = 1,
+                           executor: str = "process") -> Dict[str, Dict[str, List[Dict]]]:
     """
     Get metadata for all articles in both languages.
+
+    If a manifest is given, unchanged articles reuse their cached metadata.
+    With workers > 1, articles that need parsing are scanned over a pool
+    (executor "process", the default since parsing is CPU-bound, or
+    "thread"); results are merged in sorted filename order, so the output
+    does not depend on the pool.
     Returns: {date: {en: [...articles], fr: [...articles]}}
     """
     date_grouped: Dict[str, Dict[str, List[Dict]]] = {}
+    tasks: List[Tuple[Path, str, str]] = []
+    is_root: List[bool] = []
 
     for lang in ["en", "fr"]:
         lang_dir = articles_base / lang
         if not lang_dir.exists():
             continue
-
-        for html_file in lang_dir.glob("*.html"):
-            try:
-                metadata = extract_article_metadata(html_file, lang)
-                if metadata["title"]:
-                    date = metadata["date"]
-                    if date not in date_grouped:
-                        date_grouped[date] = {"en": [], "fr": []}
-                    date_grouped[date][lang].append(metadata)
-            except Exception as e:
-                print(f"Warning: Could not parse {html_file}: {e}")
+        for html_file in sorted(lang_dir.glob("*.html")):
+            tasks.append((html_file, f"{lang}/{html_file.name}", lang))
+            is_root.append(False)
 
     # Also check root articles dir for backwards compatibility
     root_dir = articles_base
     if root_dir.exists():
-        for html_file in root_dir.glob("*.html"):
+        for html_file in sorted(root_dir.glob("*.html")):
             # Skip if it's a directory or in en/fr subdirs
             if html_file.parent.name in ["en", "fr"]:
                 continue
-            try:
-                metadata = extract_article_metadata(html_file, "en")
-                if metadata["title"]:
-                    date = metadata["date"]
-                    if date not in date_grouped:
-                        date_grouped[date] = {"en": [], "fr": []}
-                    # Avoid duplicates
-                    existing_slugs = [a["slug"] for a in date_grouped[date]["en"]]
-                    if metadata["slug"] not in existing_slugs:
-                        date_grouped[date]["en"].append(metadata)
-            except Exception as e:
-                print(f"Warning: Could not parse {html_file}: {e}")
+            tasks.append((html_file, html_file.name, "en"))
+            is_root.append(True)
+
+    results = _scan_articles(tasks, manifest, workers, executor)
+
+    for (html_file, _, lang), root, metadata in zip(tasks, is_root, results):
+        if isinstance(metadata, Exception):
+            print(f"Warning: Could not parse {html_file}: {metadata}")
+            continue
+        if not metadata["title"]:
+            continue
+        date = metadata["date"]
+        if date not in date_grouped:
+            date_grouped[date] = {"en": [], "fr": []}
+        if root:
+            # Avoid duplicates
+            existing_slugs = [a["slug"] for a in date_grouped[date]["en"]]
+            if metadata["slug"] in existing_slugs:
+                continue
+        date_grouped[date][lang].append(metadata)
 
     return date_grouped
 
@@ -209,6 +497,8 @@ def generate_spa_index(articles_data: Dict[str, Any], output_path: Path) -> None
       </p>
     </div>
     <div class="header-controls">
+      <input type="search" id="search-input" class="search-input"
+             placeholder="Search / Rechercher" aria-label="Search articles">
       <div class="lang-toggle">
         <button id="lang-en" class="lang-btn active">EN</button>
         <button id="lang-fr" class="lang-btn">FR</button>
@@ -226,6 +516,8 @@ def generate_spa_index(articles_data: Dict[str, Any], output_path: Path) -> None
   </nav>
 
   <main>
+    <section id="search-results" class="search-results" aria-live="polite" hidden></section>
+
     <section class="daily-articles">
       <h2 class="section-title" data-en="Today's Releases" data-fr="Publications du jour">Today's Releases</h2>
       <div id="articles-container">
@@ -257,167 +549,442 @@ def generate_spa_index(articles_data: Dict[str, Any], output_path: Path) -> None
   </footer>
 
   <script src="js/navigation.js"></script>
+  <script src="js/search.js"></script>
 </body>
 </html>
 """
 
-    output_path.parent.mkdir(parents=True, exist_ok=True)
-    with open(output_path, "w", encoding="utf-8") as f:
-        f.write(html)
-    print(f"Generated: {output_path}")
-
-
-def generate_archive_html(articles_data: Dict[str, Any], output_path: Path) -> None:
-    """Generate the archive page with all articles grouped by month."""
-
-    # Group by month
-    months: Dict[str, Dict] = {}
-    for date in articles_data.get("dates", []):
+    if write_if_changed(output_path, html):
+        print(f"Generated: {output_path}")
+    else:
+        print(f"Unchanged: {output_path}")
+
+
+# Month pages live at site/archive/<lang>/<YYYY-MM>.html; archive.html indexes them
+ARCHIVE_DIR = "archive"
+# Bump when the archive page markup changes so every month page is rewritten
+ARCHIVE_VERSION = 1
+ARCHIVE_LANGS = ("en", "fr")
+
+ARCHIVE_TEXT = {
+    "en": {
+        "title": "Article Archive",
+        "tagline": "AI-generated statistical bulletins from Statistics Canada data",
+        "latest": "Latest",
+        "archive": "Archive",
+        "back": "All months",
+        "count": "{n} articles published",
+        "disclosure_label": "AI Disclosure:",
+        "disclosure": "Articles on this site are generated by an experimental AI system.\n"
+                      "      Data comes from official Statistics Canada sources. Please verify important figures with",
+        "statcan": "Statistics Canada",
+        "copyright": "Data source: Statistics Canada. Generated by The D-AI-LY.",
+    },
+    "fr": {
+        "title": "Archives des articles",
+        "tagline": "Bulletins statistiques produits par l'IA à partir des données de Statistique Canada",
+        "latest": "Dernières publications",
+        "archive": "Archives",
+        "back": "Tous les mois",
+        "count": "{n} articles publiés",
+        "disclosure_label": "Divulgation relative à l'IA :",
+        "disclosure": "Les articles sur ce site sont générés par un système d'IA expérimental.\n"
+                      "      Les données proviennent de sources officielles de Statistique Canada. "
+                      "Veuillez vérifier les chiffres importants auprès de",
+        "statcan": "Statistique Canada",
+        "copyright": "Source des données : Statistique Canada. Généré par Le D-AI-LY.",
+    },
+}
+
+LANG_NAMES = {"en": "English", "fr": "Français"}
+
+
+def group_dates_by_month(dates: List[str]) -> Dict[str, List[str]]:
+    """Map "YYYY-MM" (or "unknown") to its dates, newest first."""
+    months: Dict[str, List[str]] = {}
+    for date in sorted(dates, reverse=True):
         try:
-            dt = datetime.strptime(date, "%Y-%m-%d")
-            month_key = dt.strftime("%Y-%m")
-            month_label = dt.strftime("%B %Y")
+            month_key = datetime.strptime(date, "%Y-%m-%d").strftime("%Y-%m")
         except ValueError:
             month_key = "unknown"
-            month_label = "Unknown Date"
-
-        if month_key not in months:
-            months[month_key] = {"label": month_label, "dates": []}
-        months[month_key]["dates"].append(date)
-
-    # Build archive content
-    archive_content = ""
-    for month_key in sorted(months.keys(), reverse=True):
-        month_data = months[month_key]
-        archive_content += f"""
-      <section class="archive-month">
-        <h2>{month_data['label']}</h2>
-        <ul class="article-list">
-"""
-        for date in sorted(month_data["dates"], reverse=True):
-            articles = articles_data["articles"].get(date, {})
-            en_articles = articles.get("en", [])
-            for article in en_articles:
-                try:
-                    dt = datetime.strptime(date, "%Y-%m-%d")
-                    display_date = dt.strftime("%B %d, %Y")
-                except ValueError:
-                    display_date = date
-                archive_content += f"""          <li>
-            <a href="articles/en/{article['filename']}">{article['title']}</a>
-            <span class="date">{display_date}</span>
-          </li>
-"""
-        archive_content += """        </ul>
-      </section>
-"""
-
-    total_articles = sum(
-        len(articles_data["articles"].get(d, {}).get("en", []))
-        for d in articles_data.get("dates", [])
-    )
-
-    html = f"""<!DOCTYPE html>
-<html lang="en">
+        months.setdefault(month_key, []).append(date)
+    return months
+
+
+def format_archive_month(month_key: str, ctx: RenderContext) -> str:
+    """'2025-11' -> 'November 2025' or 'novembre 2025'."""
+    try:
+        dt = datetime.strptime(month_key, "%Y-%m")
+    except ValueError:
+        return "Date inconnue" if ctx.lang == "fr" else "Unknown Date"
+    month = dt.strftime("%B")
+    return f"{ctx.t(f'months.{month}', month)} {dt.year}"
+
+
+def format_archive_date(date: str, ctx: RenderContext) -> str:
+    """'2025-11-03' -> 'November 03, 2025' or '3 novembre 2025'."""
+    try:
+        dt = datetime.strptime(date, "%Y-%m-%d")
+    except ValueError:
+        return date
+    if ctx.lang == "fr":
+        month = dt.strftime("%B")
+        return f"{dt.day} {ctx.t(f'months.{month}', month)} {dt.year}"
+    return dt.strftime("%B %d, %Y")
+
+
+def _archive_page(lang: str, title: str, body: str, root: str) -> str:
+    """Wrap an archive page body in the site chrome; root is the path to site/."""
+    text = ARCHIVE_TEXT[lang]
+    return "".join([
+        f"""<!DOCTYPE html>
+<html lang="{lang}">
 <head>
   <meta charset="UTF-8">
   <meta name="viewport" content="width=device-width, initial-scale=1.0">
-  <title>Archive - The D-AI-LY</title>
-  <link rel="stylesheet" href="css/style.css">
+  <title>{title} - The D-AI-LY</title>
+  <link rel="stylesheet" href="{root}css/style.css">
 </head>
 <body>
   <header class="site-header">
     <div class="masthead">
       <h1><a href="/">The D-AI-LY</a></h1>
-      <p class="tagline">AI-generated statistical bulletins from Statistics Canada data</p>
+      <p class="tagline">{text['tagline']}</p>
     </div>
     <nav>
-      <a href="/">Latest</a>
-      <a href="archive.html" class="active">Archive</a>
+      <a href="/">{text['latest']}</a>
+      <a href="{root}archive.html" class="active">{text['archive']}</a>
     </nav>
   </header>
 
   <main>
-    <h1 class="page-title">Article Archive</h1>
-    <p class="archive-count">{total_articles} articles published</p>
-
-    <div class="archive-content">
-{archive_content}
-    </div>
-  </main>
+""",
+        body,
+        f"""  </main>
 
   <footer>
     <div class="ai-disclosure">
-      <strong>AI Disclosure:</strong> Articles on this site are generated by an experimental AI system.
-      Data comes from official Statistics Canada sources. Please verify important figures with
-      <a href="https://www.statcan.gc.ca">Statistics Canada</a>.
+      <strong>{text['disclosure_label']}</strong> {text['disclosure']}
+      <a href="https://www.statcan.gc.ca">{text['statcan']}</a>.
     </div>
-    <p class="copyright">Data source: Statistics Canada. Generated by The D-AI-LY.</p>
+    <p class="copyright">{text['copyright']}</p>
   </footer>
 </body>
 </html>
-"""
+""",
+    ])
+
+
+def render_archive_month(month_key: str, dates: List[str],
+                         articles_data: Dict[str, Any], lang: str) -> str:
+    """One language's archive page for one month, built as a list of parts."""
+    ctx = RenderContext(lang)
+    text = ARCHIVE_TEXT[lang]
+    label = format_archive_month(month_key, ctx)
+    articles = articles_data["articles"]
+
+    items: List[str] = []
+    for date in dates:
+        display_date = format_archive_date(date, ctx)
+        for article in articles.get(date, {}).get(lang, []):
+            items.append(f"""          <li>
+            <a href="../../articles/{lang}/{article['filename']}">{article['title']}</a>
+            <span class="date">{display_date}</span>
+          </li>
+""")
 
-    output_path.parent.mkdir(parents=True, exist_ok=True)
-    with open(output_path, "w", encoding="utf-8") as f:
-        f.write(html)
-    print(f"Generated: {output_path}")
+    body = "".join([
+        f"""    <h1 class="page-title">{text['title']}</h1>
+    <p class="archive-count">{text['count'].format(n=len(items))} &middot; <a href="../../archive.html">{text['back']}</a></p>
 
+    <div class="archive-content">
+      <section class="archive-month">
+        <h2>{label}</h2>
+        <ul class="article-list">
+""",
+        *items,
+        """        </ul>
+      </section>
+    </div>
+""",
+    ])
+    return _archive_page(lang, f"{text['archive']} {label}", body, root="../../")
+
+
+def render_archive_index(months: Dict[str, List[str]], articles_data: Dict[str, Any]) -> str:
+    """archive.html: every month, newest first, linking to its page in each language."""
+    ctx = RenderContext("en")
+    articles = articles_data["articles"]
+    total = 0
+    rows: List[str] = []
+    for month_key, dates in months.items():
+        links = []
+        for lang in ARCHIVE_LANGS:
+            count = sum(len(articles.get(date, {}).get(lang, [])) for date in dates)
+            if lang == "en":
+                total += count
+            if count:
+                links.append(f'<a href="{ARCHIVE_DIR}/{lang}/{month_key}.html" hreflang="{lang}">'
+                             f'{LANG_NAMES[lang]} ({count})</a>')
+        rows.append(f"""          <li>
+            <span>{format_archive_month(month_key, ctx)}</span>
+            <span class="date">{" &middot; ".join(links)}</span>
+          </li>
+""")
 
-def copy_bilingual_articles(source_base: Path, dest_base: Path) -> int:
-    """Copy article HTML files to site directory, preserving language structure."""
-    copied = 0
+    text = ARCHIVE_TEXT["en"]
+    body = "".join([
+        f"""    <h1 class="page-title">{text['title']}</h1>
+    <p class="archive-count">{text['count'].format(n=total)}</p>
 
+    <div class="archive-content">
+      <section class="archive-month">
+        <ul class="article-list">
+""",
+        *rows,
+        """        </ul>
+      </section>
+    </div>
+""",
+    ])
+    return _archive_page("en", text["title"], body, root="")
+
+
+def archive_month_signature(month_key: str, dates: List[str],
+                            articles_data: Dict[str, Any], lang: str) -> str:
+    """Hash of everything a month page shows, to tell whether it needs rebuilding."""
+    articles = articles_data["articles"]
+    content = [ARCHIVE_VERSION, lang, month_key,
+               [[date, articles.get(date, {}).get(lang, [])] for date in dates]]
+    return hashlib.sha256(json_backend.dumps(content).encode("utf-8")).hexdigest()
+
+
+def generate_archive(articles_data: Dict[str, Any], site_dir: Path,
+                     manifest: Optional[BuildManifest] = None) -> None:
+    """
+    Generate archive.html and one page per month and language.
+
+    With a manifest, a month page whose articles are the same as in the last
+    build (and which still exists) is not rebuilt at all; month pages whose
+    month no longer has articles in that language are deleted.
+    """
+    months = group_dates_by_month(articles_data.get("dates", []))
+    written = unchanged = removed = 0
+
+    for lang in ARCHIVE_LANGS:
+        lang_dir = site_dir / ARCHIVE_DIR / lang
+        current = set()
+        for month_key, dates in months.items():
+            if not any(articles_data["articles"].get(date, {}).get(lang) for date in dates):
+                continue
+            page = lang_dir / f"{month_key}.html"
+            current.add(page.name)
+            if manifest is not None:
+                signature = archive_month_signature(month_key, dates, articles_data, lang)
+                if manifest.page_unchanged(f"{ARCHIVE_DIR}/{lang}/{page.name}", signature) \
+                        and page.exists():
+                    unchanged += 1
+                    continue
+            if write_if_changed(page, render_archive_month(month_key, dates, articles_data, lang)):
+                written += 1
+            else:
+                unchanged += 1
+
+        if lang_dir.exists():
+            for stale in lang_dir.glob("*.html"):
+                if stale.name not in current:
+                    stale.unlink()
+                    removed += 1
+
+    index_path = site_dir / "archive.html"
+    if write_if_changed(index_path, render_archive_index(months, articles_data)):
+        print(f"Generated: {index_path}")
+    else:
+        print(f"Unchanged: {index_path}")
+    print(f"Archive: {written} month page(s) written, {unchanged} unchanged, {removed} removed")
+
+
+def _published_files(directory: Path) -> Dict[str, os.stat_result]:
+    """Articles and full-series sidecars directly inside directory, by file name."""
+    files: Dict[str, os.stat_result] = {}
+    try:
+        with os.scandir(directory) as entries:
+            for entry in entries:
+                if (entry.name.endswith((".html", FULL_SERIES_SUFFIX))
+                        and entry.is_file(follow_symlinks=False)):
+                    files[entry.name] = entry.stat(follow_symlinks=False)
+    except FileNotFoundError:
+        pass
+    return files
+
+
+def _hardlink(source: Path, dest: Path) -> bool:
+    """
+    Publish source at dest as a hardlink, atomically replacing any old file.
+    Returns False if linking is not possible (e.g. another filesystem).
+
+    Linking is safe because every generator replaces its output with a new
+    file (atomic_write) instead of rewriting it in place, so a published
+    link keeps the content it was synced with.
+    """
+    tmp = dest.with_name(f".{dest.name}.link")
+    try:
+        if os.path.lexists(tmp):
+            os.unlink(tmp)
+        os.link(source, tmp)
+        os.replace(tmp, dest)
+        return True
+    except OSError:
+        if os.path.lexists(tmp):
+            os.unlink(tmp)
+        return False
+
+
+def copy_bilingual_articles(source_base: Path, dest_base: Path,
+                            manifest: Optional[BuildManifest] = None) -> int:
+    """
+    Sync article HTML files (and full-series sidecars) into the site directory,
+    preserving the en/ and fr/ structure.
+
+    Both sides are listed once. A destination file with the same size and
+    mtime as its source (or the same inode) is left alone; new or changed
+    files are hardlinked when possible and copied otherwise. Articles in the
+    root of source_base are published to en/ unless en/ has one of the same
+    name. Returns the number of files published.
+
+    With a manifest, the published files are recorded in it, and a file in
+    the destination whose source is gone is deleted only if the last sync
+    published it; files that were put in the site directory some other way
+    (e.g. committed with the site) are never touched.
+    """
+    # Destination path relative to dest_base -> source file and its stat
+    wanted: Dict[str, Tuple[Path, os.stat_result]] = {}
+    for name, stat in _published_files(source_base).items():
+        if name.endswith(".html"):
+            wanted[f"en/{name}"] = (source_base / name, stat)
     for lang in ["en", "fr"]:
-        source_dir = source_base / lang
-        dest_dir = dest_base / lang
-
-        if source_dir.exists():
-            dest_dir.mkdir(parents=True, exist_ok=True)
-            for html_file in source_dir.glob("*.html"):
-                dest_file = dest_dir / html_file.name
-                shutil.copy2(html_file, dest_file)
-                copied += 1
-
-    # Also copy from root for backwards compatibility
-    root_articles = list(source_base.glob("*.html"))
-    if root_articles:
-        # Copy to en/ by default
-        dest_en = dest_base / "en"
-        dest_en.mkdir(parents=True, exist_ok=True)
-        for html_file in root_articles:
-            if html_file.parent.name not in ["en", "fr"]:
-                dest_file = dest_en / html_file.name
-                if not dest_file.exists():  # Don't overwrite
-                    shutil.copy2(html_file, dest_file)
-                    copied += 1
-
-    print(f"Copied {copied} articles to {dest_base}")
-    return copied
-
-
-def save_articles_json(articles_data: Dict[str, Any], output_path: Path) -> None:
-    """Save article metadata as JSON for navigation."""
-    with open(output_path, "w", encoding="utf-8") as f:
-        json.dump(articles_data, f, indent=2, ensure_ascii=False)
-    print(f"Saved metadata: {output_path}")
-
-
-def build_site(project_dir: Path = None) -> None:
-    """Build the complete static site."""
+        for name, stat in _published_files(source_base / lang).items():
+            wanted[f"{lang}/{name}"] = (source_base / lang / name, stat)
+
+    present: Dict[str, os.stat_result] = {}
+    for lang in ["en", "fr"]:
+        for name, stat in _published_files(dest_base / lang).items():
+            present[f"{lang}/{name}"] = stat
+
+    copied = linked = unchanged = removed = 0
+    bytes_moved = 0
+    for rel_path, (source, stat) in sorted(wanted.items()):
+        current = present.get(rel_path)
+        if current is not None and (
+                (current.st_ino == stat.st_ino and current.st_dev == stat.st_dev)
+                or (current.st_size == stat.st_size and current.st_mtime_ns == stat.st_mtime_ns)):
+            unchanged += 1
+            continue
+
+        dest = dest_base / rel_path
+        dest.parent.mkdir(parents=True, exist_ok=True)
+        if _hardlink(source, dest):
+            linked += 1
+        elif copy_if_changed(source, dest):
+            copied += 1
+            bytes_moved += stat.st_size
+        else:
+            # Same bytes under another mtime: align it so the next sync skips the file
+            os.utime(dest, ns=(stat.st_atime_ns, stat.st_mtime_ns))
+            unchanged += 1
+
+    if manifest is not None:
+        for rel_path in sorted(set(present) - set(wanted)):
+            if rel_path in manifest.previous_published:
+                (dest_base / rel_path).unlink()
+                removed += 1
+        manifest.published = sorted(wanted)
+
+    print(f"Synced articles to {dest_base}: {copied} copied ({bytes_moved:,} bytes), "
+          f"{linked} linked, {unchanged} unchanged, {removed} removed")
+    return copied + linked
+
+
+def shard_articles_json(articles_data: Dict[str, Any]) -> Tuple[Dict[str, Any], Dict[str, Dict]]:
+    """
+    Split the articles.json structure into a small index and per-month shards.
+
+    Returns (index, shards). The index holds every date (newest first) and
+    maps each month ("YYYY-MM", the first 7 characters of its dates) to its
+    shard file. A shard holds the same date-keyed articles as before, for
+    the dates of one month only.
+    """
+    shards: Dict[str, Dict] = {}
+    for date in articles_data["dates"]:
+        month = date[:7]
+        shard = shards.setdefault(month, {"month": month, "articles": {}})
+        shard["articles"][date] = articles_data["articles"].get(date, {})
+
+    index = {
+        "version": ARTICLES_JSON_VERSION,
+        "dates": articles_data["dates"],
+        "shards": {month: f"{SHARD_DIR}/{month}.json" for month in shards},
+    }
+    return index, shards
+
+
+def save_articles_json(articles_data: Dict[str, Any], output_path: Path,
+                       compact: bool = True) -> None:
+    """
+    Save article metadata for navigation (compact unless compact=False):
+    the index at output_path and one shard per month in SHARD_DIR beside it.
+    Only shards whose content changed are rewritten; shards of months that
+    no longer have articles are deleted.
+    """
+    index, shards = shard_articles_json(articles_data)
+    shard_dir = output_path.parent / SHARD_DIR
+
+    written = 0
+    for month, shard in shards.items():
+        written += json_backend.dump(shard, shard_dir / f"{month}.json", compact=compact)
+    removed = 0
+    if shard_dir.exists():
+        for stale in shard_dir.glob("*.json"):
+            if stale.stem not in shards:
+                stale.unlink()
+                removed += 1
+
+    if json_backend.dump(index, output_path, compact=compact):
+        print(f"Saved metadata: {output_path}")
+    else:
+        print(f"Unchanged: {output_path}")
+    print(f"Metadata shards: {written} written, {len(shards) - written} unchanged, {removed} removed")
+
+
+def build_site(project_dir: Path = None, full: bool = False,
+               workers: int = 1, executor: str = "process") -> None:
+    """
+    Build the complete static site.
+
+    Args:
+        project_dir: Project root (default: this file's directory)
+        full: Ignore the build manifest and search index state and re-parse every article
+        workers: Pool size for scanning changed articles (1 scans in-process)
+        executor: "process" (default) or "thread" pool for the article scan
+    """
     if project_dir is None:
         project_dir = Path(__file__).parent
 
     articles_source = project_dir / "output" / "articles"
     site_dir = project_dir / "site"
+    manifest_path = project_dir / "output" / MANIFEST_NAME
 
     print("Building The D-AI-LY site (bilingual)...")
     print(f"Source: {articles_source}")
     print(f"Output: {site_dir}")
     print()
 
+    manifest = BuildManifest(manifest_path, load=not full)
+
     # Get all articles from both languages
-    date_grouped = get_bilingual_articles(articles_source)
+    date_grouped = get_bilingual_articles(articles_source, manifest,
+                                          workers=workers, executor=executor)
+    print(f"Metadata: {manifest.hits} cached, {manifest.misses} parsed")
 
     total_articles = sum(
         len(langs.get("en", [])) + len(langs.get("fr", []))
@@ -434,18 +1001,34 @@ def build_site(project_dir: Path = None) -> None:
 
     # Generate pages
     generate_spa_index(articles_data, site_dir / "index.html")
-    generate_archive_html(articles_data, site_dir / "archive.html")
+    generate_archive(articles_data, site_dir, manifest)
 
     # Copy articles (bilingual structure)
-    copy_bilingual_articles(articles_source, site_dir / "articles")
+    copy_bilingual_articles(articles_source, site_dir / "articles", manifest)
 
     # Save metadata
     save_articles_json(articles_data, site_dir / "articles.json")
 
+    # Search index, updated from the articles that changed since the last build
+    build_search_index(date_grouped, site_dir, project_dir / "output" / SEARCH_STATE_NAME,
+                       full=full)
+
+    # Record this build for the next incremental run
+    manifest.save()
+
     print()
     print("Site build complete!")
     print(f"View at: file://{site_dir}/index.html")
 
 
 if __name__ == "__main__":
-    build_site()
+    parser = argparse.ArgumentParser(description="Build The D-AI-LY static site")
+    parser.add_argument("--full", action="store_true",
+                        help="Ignore the build manifest and rebuild every article")
+    parser.add_argument("--workers", type=int, default=1,
+                        help="Parallel workers for scanning changed articles (default: 1)")
+    parser.add_argument("--executor", choices=["process", "thread"], default="process",
+                        help="Pool type used with --workers (default: process)")
+    args = parser.parse_args()
+
+    build_site(full=args.full, workers=args.workers, executor=args.executor)
@@ -6,12 +6,15 @@ Generates Statistics Canada "The Daily"-style articles from CANSIM data.
 Uses The Daily voice: neutral, clinical, inverted pyramid structure.
 """
 
-import json
-import re
 from pathlib import Path
 from datetime import datetime
 from typing import Dict, List, Any
 
+import json_backend
+from atomic_write import write_if_changed
+from series_frame import SeriesFrame
+from template_engine import render_template
+
 
 def format_month_year(ref_date: str) -> str:
     """Convert '2025-11' to 'November 2025'."""
@@ -39,12 +42,13 @@ def format_change(value: float, is_percentage: bool = False) -> str:
         return f"{direction} {value:.1f}"
 
 
-def generate_headline(data: Dict[str, Any]) -> str:
+def generate_headline(frame: SeriesFrame) -> str:
     """Generate a headline (max 15 words) with key number first."""
-    latest = data["latest"]
-    metadata = data["metadata"]
+    frame = SeriesFrame.of(frame)
+    latest = frame.latest
+    metadata = frame.metadata
     period = format_month_year(latest["ref_date"])
-    series_name = metadata.get("series_name", "")
+    series_name = frame.series_name
 
     mom_change = latest.get("mom_pct_change", 0)
     yoy_change = latest.get("yoy_pct_change", 0)
@@ -94,13 +98,12 @@ def format_value(value: float, series_name: str) -> str:
             return f"{value:.1f}"
 
 
-def generate_highlights(data: Dict[str, Any]) -> List[str]:
+def generate_highlights(frame: SeriesFrame) -> List[str]:
     """Generate 3-5 highlight bullets."""
-    latest = data["latest"]
-    comparison = data["comparison"]
-    time_series = data["time_series"]
-    metadata = data["metadata"]
-    series_name = metadata.get("series_name", "")
+    frame = SeriesFrame.of(frame)
+    latest = frame.latest
+    comparison = frame.comparison
+    series_name = frame.series_name
 
     highlights = []
 
@@ -162,8 +165,8 @@ def generate_highlights(data: Dict[str, Any]) -> List[str]:
                 )
 
     # Trend context (compare to 3 months ago)
-    if len(time_series) >= 4:
-        three_months_ago = time_series[-4]
+    if len(frame) >= 4:
+        three_months_ago = frame.period(-4)
         three_month_yoy = three_months_ago.get("yoy_pct_change")
         if three_month_yoy is not None and yoy is not None:
             diff = yoy - three_month_yoy
@@ -177,13 +180,12 @@ def generate_highlights(data: Dict[str, Any]) -> List[str]:
     return highlights[:5]  # Max 5 highlights
 
 
-def generate_sections(data: Dict[str, Any]) -> List[str]:
+def generate_sections(frame: SeriesFrame) -> List[str]:
     """Generate article body sections."""
-    latest = data["latest"]
-    comparison = data["comparison"]
-    metadata = data["metadata"]
-    time_series = data["time_series"]
-    series_name = metadata.get("series_name", "")
+    frame = SeriesFrame.of(frame)
+    latest = frame.latest
+    comparison = frame.comparison
+    series_name = frame.series_name
 
     sections = []
 
@@ -221,8 +223,8 @@ def generate_sections(data: Dict[str, Any]) -> List[str]:
             sections.append(mom_section)
 
         # Historical context for retail
-        if len(time_series) >= 12:
-            yoy_rates = [d["yoy_pct_change"] for d in time_series if d.get("yoy_pct_change") is not None]
+        if len(frame) >= 12:
+            yoy_rates = [r for r in frame.series("yoy_pct_change") if r is not None]
             if yoy_rates:
                 max_yoy = max(yoy_rates)
                 min_yoy = min(yoy_rates)
@@ -264,8 +266,8 @@ def generate_sections(data: Dict[str, Any]) -> List[str]:
             sections.append(mom_section)
 
         # Historical context
-        if len(time_series) >= 12:
-            yoy_rates = [d["yoy_pct_change"] for d in time_series if d.get("yoy_pct_change") is not None]
+        if len(frame) >= 12:
+            yoy_rates = [r for r in frame.series("yoy_pct_change") if r is not None]
 
             if yoy_rates:
                 max_yoy = max(yoy_rates)
@@ -281,10 +283,9 @@ def generate_sections(data: Dict[str, Any]) -> List[str]:
     return sections
 
 
-def generate_note_to_readers(data: Dict[str, Any]) -> str:
+def generate_note_to_readers(frame: SeriesFrame) -> str:
     """Generate the methodology/notes section."""
-    metadata = data["metadata"]
-    series_name = metadata.get("series_name", "")
+    series_name = SeriesFrame.of(frame).series_name
 
     if series_name == "Retail Sales":
         return (
@@ -304,67 +305,45 @@ def generate_note_to_readers(data: Dict[str, Any]) -> str:
 
 def generate_article(data_path: str, output_path: str) -> str:
     """Generate a complete article from data JSON."""
-    # Load data
-    with open(data_path, "r") as f:
-        data = json.load(f)
+    # Load data straight into the typed view; every generator below reads from it
+    frame = json_backend.load_frame(data_path)
 
     # Generate content
-    headline = generate_headline(data)
-    highlights = generate_highlights(data)
-    sections = generate_sections(data)
-    note = generate_note_to_readers(data)
-    series_name = data["metadata"].get("series_name", "")
+    headline = generate_headline(frame)
+    highlights = generate_highlights(frame)
+    sections = generate_sections(frame)
+    note = generate_note_to_readers(frame)
+    series_name = frame.series_name
+    start_period = format_month_year(frame.ref_dates[0])
+    period = format_month_year(frame.latest["ref_date"])
 
     # Chart title and y-axis based on series type
     if series_name == "Retail Sales":
-        chart_title = f"Retail Sales, {format_month_year(data['time_series'][0]['ref_date'])} to {format_month_year(data['latest']['ref_date'])}"
+        chart_title = f"Retail Sales, {start_period} to {period}"
         chart_y_label = "Sales ($ millions)"
     else:
-        chart_title = f"Consumer Price Index, {format_month_year(data['time_series'][0]['ref_date'])} to {format_month_year(data['latest']['ref_date'])}"
+        chart_title = f"Consumer Price Index, {start_period} to {period}"
         chart_y_label = "Index (2002=100)"
 
-    # Load template
+    # Render template in a single pass
     template_path = Path(__file__).parent / "templates" / "article.html"
-    with open(template_path, "r") as f:
-        template = f.read()
-
-    # Replace placeholders
-    # Convert time series to JSON for embedding
-    time_series_json = json.dumps(data["time_series"])
-
-    # Simple template substitution
-    html = template
-    html = html.replace("{{headline}}", headline)
-    html = html.replace("{{release_date}}", datetime.now().strftime("%B %d, %Y"))
-    html = html.replace("{{chart_title}}", chart_title)
-    html = html.replace("{{chart_y_label}}", chart_y_label)
-    html = html.replace("{{note_to_readers}}", note)
-    html = html.replace("{{table_number}}", data["metadata"]["table_number"])
-    html = html.replace("{{reference_period}}", format_month_year(data["latest"]["ref_date"]))
-    html = html.replace("{{time_series_json}}", time_series_json)
-
-    # Handle highlights (mustache-style list)
-    highlights_html = "\n".join(f"      <li>{h}</li>" for h in highlights)
-    html = re.sub(
-        r'\{\{#highlights\}\}.*?\{\{/highlights\}\}',
-        highlights_html,
-        html,
-        flags=re.DOTALL
-    )
-
-    # Handle sections
-    sections_html = "\n".join(f"    <p>{s}</p>" for s in sections)
-    html = re.sub(
-        r'\{\{#sections\}\}.*?\{\{/sections\}\}',
-        sections_html,
-        html,
-        flags=re.DOTALL
-    )
+    html = render_template(template_path, {
+        "headline": headline,
+        "release_date": datetime.now().strftime("%B %d, %Y"),
+        "chart_title": chart_title,
+        "chart_y_label": chart_y_label,
+        "series_name": series_name,
+        "note_to_readers": note,
+        "table_number": frame.metadata["table_number"],
+        "reference_period": period,
+        # Convert time series to JSON for embedding
+        "time_series_json": json_backend.dumps(frame.raw["time_series"]),
+        "highlights": highlights,
+        "sections": sections,
+    })
 
     # Write output
-    Path(output_path).parent.mkdir(parents=True, exist_ok=True)
-    with open(output_path, "w") as f:
-        f.write(html)
+    write_if_changed(output_path, html)
 
     print(f"Article generated: {output_path}")
     print(f"Headline: {headline}")
@@ -10,51 +10,50 @@ Generates richer Statistics Canada "The Daily"-style articles with:
 """
 
 import argparse
-import json
-import re
+import os
 from pathlib import Path
 from datetime import datetime
-from typing import Dict, List, Any, Optional
-
-# Global translations dictionary (loaded at runtime)
-TRANSLATIONS: Dict[str, Any] = {}
-LANG: str = "en"
-
-
-def load_translations(lang: str = "en") -> Dict[str, Any]:
-    """Load translations for the specified language."""
-    global TRANSLATIONS, LANG
-    LANG = lang
-    translations_path = Path(__file__).parent / "templates" / "translations.json"
-    with open(translations_path, "r", encoding="utf-8") as f:
-        all_translations = json.load(f)
-    TRANSLATIONS = all_translations.get(lang, all_translations["en"])
-    return TRANSLATIONS
-
-
-def t(key_path: str, default: str = "") -> str:
-    """Get a translation by dot-notation path (e.g., 'article.highlights')."""
-    keys = key_path.split(".")
-    value = TRANSLATIONS
-    for key in keys:
-        if isinstance(value, dict) and key in value:
-            value = value[key]
-        else:
-            return default
-    return value if isinstance(value, str) else default
-
-
-def format_month_year(ref_date: str, lang: str = None) -> str:
+from typing import Dict, List, Any, Optional, Tuple
+
+import json_backend
+import series_frame
+import template_engine
+import translations
+from atomic_write import write_if_changed
+from render_cache import RenderCache, default_cache, digest_bytes
+from series_frame import SeriesFrame
+from template_engine import render_template
+from translations import RenderContext
+
+TEMPLATE_PATH = Path(__file__).parent / "templates" / "article_enhanced.html"
+
+# Files an article depends on besides its data; their hashes stand in for
+# the generator version in render cache keys
+RENDER_INPUTS = (
+    Path(__file__),
+    Path(json_backend.__file__),
+    Path(series_frame.__file__),
+    Path(template_engine.__file__),
+    Path(translations.__file__),
+    TEMPLATE_PATH,
+    translations.TRANSLATIONS_PATH,
+)
+
+# Most points the main chart embeds; longer series are downsampled and the
+# full series is written next to the article as a separate download
+DEFAULT_MAX_POINTS = 240
+FULL_SERIES_SUFFIX = ".series.json"
+
+
+def format_month_year(ref_date: str, ctx: RenderContext) -> str:
     """Convert '2025-11' to 'November 2025' (or French equivalent)."""
-    if lang is None:
-        lang = LANG
     try:
         date = datetime.strptime(ref_date, "%Y-%m")
         month_en = date.strftime("%B")
         year = date.strftime("%Y")
         # Translate month name
-        month_translated = t(f"months.{month_en}", month_en)
-        if lang == "fr":
+        month_translated = ctx.t(f"months.{month_en}", month_en)
+        if ctx.lang == "fr":
             return f"{month_translated} {year}"
         return f"{month_translated} {year}"
     except ValueError:
@@ -76,18 +75,19 @@ def format_value(value: float, series_name: str) -> str:
             return f"{value:.1f}"
 
 
-def generate_headline(data: Dict[str, Any]) -> str:
+def generate_headline(frame: SeriesFrame, ctx: RenderContext) -> str:
     """Generate a headline (max 15 words) with key number first."""
-    latest = data["latest"]
-    metadata = data["metadata"]
-    period = format_month_year(latest["ref_date"])
-    series_name = metadata.get("series_name", "")
+    frame = SeriesFrame.of(frame)
+    latest = frame.latest
+    metadata = frame.metadata
+    period = format_month_year(latest["ref_date"], ctx)
+    series_name = frame.series_name
 
     mom_change = latest.get("mom_pct_change", 0)
     yoy_change = latest.get("yoy_pct_change", 0)
 
     if series_name == "Consumer Price Index":
-        if LANG == "fr":
+        if ctx.lang == "fr":
             if yoy_change > 0:
                 return f"Les prix à la consommation en hausse de {yoy_change:.1f} % d'une année à l'autre en {period}"
             elif yoy_change < 0:
@@ -103,7 +103,7 @@ def generate_headline(data: Dict[str, Any]) -> str:
                 return f"Consumer prices unchanged in {period}"
 
     elif series_name == "Retail Sales":
-        if LANG == "fr":
+        if ctx.lang == "fr":
             if mom_change > 0:
                 return f"Les ventes au détail en hausse de {mom_change:.1f} % en {period}"
             elif mom_change < 0:
@@ -122,25 +122,24 @@ def generate_headline(data: Dict[str, Any]) -> str:
         title_short = metadata["table_title"].split(",")[0]
         if mom_change != 0:
             direction = "up" if mom_change > 0 else "down"
-            if LANG == "fr":
+            if ctx.lang == "fr":
                 direction = "en hausse de" if mom_change > 0 else "en baisse de"
                 return f"{title_short} {direction} {abs(mom_change):.1f} % en {period}"
             return f"{title_short} {direction} {abs(mom_change):.1f}% in {period}"
         return f"{title_short}: {period}"
 
 
-def generate_highlights(data: Dict[str, Any]) -> List[str]:
+def generate_highlights(frame: SeriesFrame, ctx: RenderContext) -> List[str]:
     """Generate 3-5 highlight bullets."""
-    latest = data["latest"]
-    comparison = data["comparison"]
-    time_series = data["time_series"]
-    metadata = data["metadata"]
-    series_name = metadata.get("series_name", "")
-    subseries = data.get("subseries")
-    provincial = data.get("provincial")
+    frame = SeriesFrame.of(frame)
+    latest = frame.latest
+    comparison = frame.comparison
+    series_name = frame.series_name
+    subseries = frame.subseries
+    provincial = frame.provincial
 
     highlights = []
-    period = format_month_year(latest["ref_date"])
+    period = format_month_year(latest["ref_date"], ctx)
     value = latest["value"]
     yoy = latest.get("yoy_pct_change", 0)
     mom = latest.get("mom_pct_change", 0)
@@ -148,7 +147,7 @@ def generate_highlights(data: Dict[str, Any]) -> List[str]:
     if series_name == "Consumer Price Index":
         # Main YoY finding
         if yoy is not None:
-            if LANG == "fr":
+            if ctx.lang == "fr":
                 if yoy > 0:
                     highlights.append(
                         f"L'Indice des prix à la consommation a augmenté de {yoy:.1f} % d'une année à l'autre en {period}."
@@ -176,16 +175,11 @@ def generate_highlights(data: Dict[str, Any]) -> List[str]:
                     )
 
         # Leading contributor from subseries
-        if subseries and "category" in subseries and len(subseries["category"]) > 0:
-            max_idx = 0
-            max_yoy = subseries["yoy_pct_change"][0] if subseries["yoy_pct_change"] else 0
-            for i, yoy_val in enumerate(subseries.get("yoy_pct_change", [])):
-                if yoy_val and yoy_val > max_yoy:
-                    max_yoy = yoy_val
-                    max_idx = i
-            if max_yoy > 0:
-                cat = subseries['category'][max_idx]
-                if LANG == "fr":
+        leaders = subseries.ranking("yoy_pct_change").top(1) if subseries is not None else []
+        if leaders:
+            cat, max_yoy = leaders[0]
+            if (max_yoy or 0) > 0:
+                if ctx.lang == "fr":
                     highlights.append(
                         f"Les prix de la catégorie {cat.lower()} ont augmenté de {max_yoy:.1f} %, la plus forte hausse parmi les principales composantes."
                     )
@@ -196,8 +190,8 @@ def generate_highlights(data: Dict[str, Any]) -> List[str]:
 
         # Month-over-month
         if mom is not None:
-            prev_period = format_month_year(comparison["previous_period"]["ref_date"])
-            if LANG == "fr":
+            prev_period = format_month_year(comparison["previous_period"]["ref_date"], ctx)
+            if ctx.lang == "fr":
                 if mom > 0:
                     highlights.append(
                         f"D'un mois à l'autre, l'IPC a augmenté de {mom:.1f} % par rapport à {prev_period}."
@@ -217,16 +211,11 @@ def generate_highlights(data: Dict[str, Any]) -> List[str]:
                     )
 
         # Provincial highlight
-        if provincial and "category" in provincial and len(provincial["category"]) > 0:
-            max_idx = 0
-            max_yoy = provincial["yoy_pct_change"][0] if provincial["yoy_pct_change"] else 0
-            for i, yoy_val in enumerate(provincial.get("yoy_pct_change", [])):
-                if yoy_val and yoy_val > max_yoy:
-                    max_yoy = yoy_val
-                    max_idx = i
-            if max_yoy > 0:
-                prov = provincial['category'][max_idx]
-                if LANG == "fr":
+        leaders = provincial.ranking("yoy_pct_change").top(1) if provincial is not None else []
+        if leaders:
+            prov, max_yoy = leaders[0]
+            if (max_yoy or 0) > 0:
+                if ctx.lang == "fr":
                     highlights.append(
                         f"{prov} a enregistré la hausse annuelle la plus élevée, soit {max_yoy:.1f} %."
                     )
@@ -237,7 +226,7 @@ def generate_highlights(data: Dict[str, Any]) -> List[str]:
 
     elif series_name == "Retail Sales":
         value_str = format_value(value, series_name)
-        if LANG == "fr":
+        if ctx.lang == "fr":
             if mom is not None and mom != 0:
                 direction = "ont augmenté" if mom > 0 else "ont diminué"
                 highlights.append(
@@ -269,7 +258,7 @@ def generate_highlights(data: Dict[str, Any]) -> List[str]:
     else:
         # Generic highlights
         if yoy is not None and yoy != 0:
-            if LANG == "fr":
+            if ctx.lang == "fr":
                 direction = "a augmenté" if yoy > 0 else "a diminué"
                 highlights.append(f"L'indicateur {direction} de {abs(yoy):.1f} % d'une année à l'autre en {period}.")
             else:
@@ -279,22 +268,21 @@ def generate_highlights(data: Dict[str, Any]) -> List[str]:
     return highlights[:5]
 
 
-def generate_sections(data: Dict[str, Any]) -> List[str]:
+def generate_sections(frame: SeriesFrame, ctx: RenderContext) -> List[str]:
     """Generate article body sections."""
-    latest = data["latest"]
-    comparison = data["comparison"]
-    metadata = data["metadata"]
-    time_series = data["time_series"]
-    series_name = metadata.get("series_name", "")
+    frame = SeriesFrame.of(frame)
+    latest = frame.latest
+    comparison = frame.comparison
+    series_name = frame.series_name
 
     sections = []
-    period = format_month_year(latest["ref_date"])
+    period = format_month_year(latest["ref_date"], ctx)
     value = latest["value"]
     yoy = latest.get("yoy_pct_change", 0)
     mom = latest.get("mom_pct_change", 0)
 
     if series_name == "Consumer Price Index":
-        if LANG == "fr":
+        if ctx.lang == "fr":
             # Lede (French)
             lede = f"L'Indice des prix à la consommation (IPC) s'établissait à {value:.1f} en {period}"
             if yoy is not None and yoy != 0:
@@ -309,7 +297,7 @@ def generate_sections(data: Dict[str, Any]) -> List[str]:
             # Month-over-month (French)
             if mom is not None:
                 prev_value = comparison["previous_period"]["value"]
-                prev_period = format_month_year(comparison["previous_period"]["ref_date"])
+                prev_period = format_month_year(comparison["previous_period"]["ref_date"], ctx)
                 if mom != 0:
                     direction = "a augmenté" if mom > 0 else "a diminué"
                     sections.append(
@@ -318,8 +306,8 @@ def generate_sections(data: Dict[str, Any]) -> List[str]:
                     )
 
             # Historical context (French)
-            if len(time_series) >= 12:
-                yoy_rates = [d["yoy_pct_change"] for d in time_series if d.get("yoy_pct_change") is not None]
+            if len(frame) >= 12:
+                yoy_rates = [r for r in frame.series("yoy_pct_change") if r is not None]
                 if yoy_rates:
                     max_yoy = max(yoy_rates)
                     min_yoy = min(yoy_rates)
@@ -343,7 +331,7 @@ def generate_sections(data: Dict[str, Any]) -> List[str]:
             # Month-over-month (English)
             if mom is not None:
                 prev_value = comparison["previous_period"]["value"]
-                prev_period = format_month_year(comparison["previous_period"]["ref_date"])
+                prev_period = format_month_year(comparison["previous_period"]["ref_date"], ctx)
                 if mom != 0:
                     direction = "increased" if mom > 0 else "decreased"
                     sections.append(
@@ -352,8 +340,8 @@ def generate_sections(data: Dict[str, Any]) -> List[str]:
                     )
 
             # Historical context (English)
-            if len(time_series) >= 12:
-                yoy_rates = [d["yoy_pct_change"] for d in time_series if d.get("yoy_pct_change") is not None]
+            if len(frame) >= 12:
+                yoy_rates = [r for r in frame.series("yoy_pct_change") if r is not None]
                 if yoy_rates:
                     max_yoy = max(yoy_rates)
                     min_yoy = min(yoy_rates)
@@ -365,7 +353,7 @@ def generate_sections(data: Dict[str, Any]) -> List[str]:
 
     elif series_name == "Retail Sales":
         value_str = format_value(value, series_name)
-        if LANG == "fr":
+        if ctx.lang == "fr":
             lede = f"Les ventes au détail ont totalisé {value_str} en {period}"
             if mom is not None and mom != 0:
                 direction = "en hausse de" if mom > 0 else "en baisse de"
@@ -379,7 +367,7 @@ def generate_sections(data: Dict[str, Any]) -> List[str]:
             if comparison.get("previous_period"):
                 prev_value = comparison["previous_period"]["value"]
                 prev_value_str = format_value(prev_value, series_name)
-                prev_period = format_month_year(comparison["previous_period"]["ref_date"])
+                prev_period = format_month_year(comparison["previous_period"]["ref_date"], ctx)
                 if mom != 0:
                     direction = "ont augmenté" if mom > 0 else "ont diminué"
                     sections.append(
@@ -400,7 +388,7 @@ def generate_sections(data: Dict[str, Any]) -> List[str]:
             if comparison.get("previous_period"):
                 prev_value = comparison["previous_period"]["value"]
                 prev_value_str = format_value(prev_value, series_name)
-                prev_period = format_month_year(comparison["previous_period"]["ref_date"])
+                prev_period = format_month_year(comparison["previous_period"]["ref_date"], ctx)
                 if mom != 0:
                     direction = "increased" if mom > 0 else "decreased"
                     sections.append(
@@ -411,43 +399,36 @@ def generate_sections(data: Dict[str, Any]) -> List[str]:
     return sections
 
 
-def generate_subseries_narrative(data: Dict[str, Any]) -> str:
+def generate_subseries_narrative(frame: SeriesFrame, ctx: RenderContext) -> str:
     """Generate narrative about subseries/component breakdown."""
-    subseries = data.get("subseries")
-    series_name = data["metadata"].get("series_name", "")
-    period = format_month_year(data["latest"]["ref_date"])
+    frame = SeriesFrame.of(frame)
+    subseries = frame.subseries
+    series_name = frame.series_name
 
-    if not subseries or "category" not in subseries:
+    if subseries is None:
         return ""
 
-    categories = subseries["category"]
-    yoy_changes = subseries.get("yoy_pct_change", [])
+    ranking = subseries.ranking("yoy_pct_change")
 
-    if not categories or not yoy_changes:
+    if not ranking:
         return ""
 
     # Find highest and lowest
-    sorted_indices = sorted(range(len(yoy_changes)), key=lambda i: yoy_changes[i] or 0, reverse=True)
-
     if series_name == "Consumer Price Index":
-        top_cat = categories[sorted_indices[0]]
-        top_yoy = yoy_changes[sorted_indices[0]]
-        bottom_cat = categories[sorted_indices[-1]]
-        bottom_yoy = yoy_changes[sorted_indices[-1]]
+        top_cat, top_yoy = ranking.top(1)[0]
+        bottom_cat, bottom_yoy = ranking.bottom(1)[0]
 
-        if LANG == "fr":
+        if ctx.lang == "fr":
             narrative = f"<p>Parmi les principales composantes, les prix de la catégorie {top_cat.lower()} ont enregistré la plus forte hausse annuelle, soit {top_yoy:.1f} %"
-            if len(sorted_indices) > 1 and sorted_indices[1] < len(categories):
-                second_cat = categories[sorted_indices[1]]
-                second_yoy = yoy_changes[sorted_indices[1]]
+            if len(ranking) > 1:
+                second_cat, second_yoy = ranking.top(2)[1]
                 narrative += f", suivie de la catégorie {second_cat.lower()} ({second_yoy:.1f} %)"
             narrative += ".</p>"
             narrative += f"<p>Les prix de la catégorie {bottom_cat.lower()} ont affiché la plus faible hausse, soit {bottom_yoy:.1f} %.</p>"
         else:
             narrative = f"<p>Among major components, {top_cat.lower()} prices recorded the largest year-over-year increase at {top_yoy:.1f}%"
-            if len(sorted_indices) > 1 and sorted_indices[1] < len(categories):
-                second_cat = categories[sorted_indices[1]]
-                second_yoy = yoy_changes[sorted_indices[1]]
+            if len(ranking) > 1:
+                second_cat, second_yoy = ranking.top(2)[1]
                 narrative += f", followed by {second_cat.lower()} ({second_yoy:.1f}%)"
             narrative += ".</p>"
             narrative += f"<p>{bottom_cat} prices showed the smallest increase at {bottom_yoy:.1f}%.</p>"
@@ -456,30 +437,25 @@ def generate_subseries_narrative(data: Dict[str, Any]) -> str:
     return ""
 
 
-def generate_provincial_narrative(data: Dict[str, Any]) -> str:
+def generate_provincial_narrative(frame: SeriesFrame, ctx: RenderContext) -> str:
     """Generate narrative about provincial breakdown."""
-    provincial = data.get("provincial")
-    series_name = data["metadata"].get("series_name", "")
-    period = format_month_year(data["latest"]["ref_date"])
+    frame = SeriesFrame.of(frame)
+    provincial = frame.provincial
+    series_name = frame.series_name
 
-    if not provincial or "category" not in provincial:
+    if provincial is None:
         return ""
 
-    categories = provincial["category"]
-    yoy_changes = provincial.get("yoy_pct_change", [])
+    ranking = provincial.ranking("yoy_pct_change")
 
-    if not categories or not yoy_changes:
+    if not ranking:
         return ""
 
-    sorted_indices = sorted(range(len(yoy_changes)), key=lambda i: yoy_changes[i] or 0, reverse=True)
-
     if series_name == "Consumer Price Index":
-        top_prov = categories[sorted_indices[0]]
-        top_yoy = yoy_changes[sorted_indices[0]]
-        bottom_prov = categories[sorted_indices[-1]]
-        bottom_yoy = yoy_changes[sorted_indices[-1]]
+        top_prov, top_yoy = ranking.top(1)[0]
+        bottom_prov, bottom_yoy = ranking.bottom(1)[0]
 
-        if LANG == "fr":
+        if ctx.lang == "fr":
             narrative = f"<p>Les hausses de prix d'une année à l'autre ont varié d'une province à l'autre. "
             narrative += f"{top_prov} a enregistré la hausse la plus élevée, soit {top_yoy:.1f} %, "
             narrative += f"tandis que {bottom_prov} a affiché la plus faible, soit {bottom_yoy:.1f} %.</p>"
@@ -491,19 +467,19 @@ def generate_provincial_narrative(data: Dict[str, Any]) -> str:
     return ""
 
 
-def generate_note_to_readers(data: Dict[str, Any]) -> str:
+def generate_note_to_readers(frame: SeriesFrame, ctx: RenderContext) -> str:
     """Generate the methodology/notes section."""
-    series_name = data["metadata"].get("series_name", "")
+    series_name = SeriesFrame.of(frame).series_name
 
     if series_name == "Retail Sales":
-        return t("retail.note_methodology",
+        return ctx.t("retail.note_methodology",
             "Retail trade sales represent the value of all sales made through retail channels, "
             "including both in-store and online transactions. Data are seasonally adjusted to "
             "account for regular seasonal patterns. Values are expressed in current dollars. "
             "For more information, consult Statistics Canada's retail trade portal."
         )
     else:
-        return t("cpi.note_methodology",
+        return ctx.t("cpi.note_methodology",
             "The Consumer Price Index (CPI) measures the rate of price change experienced by "
             "Canadian consumers. It is calculated by comparing the cost of a fixed basket of "
             "goods and services purchased by consumers over time. The CPI is not seasonally adjusted. "
@@ -511,33 +487,131 @@ def generate_note_to_readers(data: Dict[str, Any]) -> str:
         )
 
 
-def generate_article(data_path: str, output_path: str, lang: str = "en") -> str:
-    """Generate a complete enhanced article from data JSON."""
-    # Load translations for the specified language
-    load_translations(lang)
-
-    # Load data
-    with open(data_path, "r") as f:
-        data = json.load(f)
+def lttb_indices(values: List[float], max_points: int) -> List[int]:
+    """
+    Indices of at most max_points values chosen by Largest-Triangle-Three-
+    Buckets: the first and last points are kept, and each bucket in between
+    keeps the point forming the largest triangle with the previously kept
+    point and the next bucket's average, which preserves peaks and troughs.
+    Points are treated as evenly spaced.
+    """
+    n = len(values)
+    if max_points >= n or max_points < 3:
+        return list(range(n))
+
+    every = (n - 2) / (max_points - 2)
+    kept = [0]
+    a = 0
+    for bucket in range(max_points - 2):
+        start = int(bucket * every) + 1
+        end = int((bucket + 1) * every) + 1
+        next_end = min(int((bucket + 2) * every) + 1, n)
+        avg_x = (end + next_end - 1) / 2
+        avg_y = sum(values[end:next_end]) / (next_end - end)
+
+        best, best_area = start, -1.0
+        for i in range(start, end):
+            area = abs((a - avg_x) * (values[i] - values[a]) - (a - i) * (avg_y - values[a]))
+            if area > best_area:
+                best, best_area = i, area
+        kept.append(best)
+        a = best
+    kept.append(n - 1)
+    return kept
+
+
+def chart_series(frame: SeriesFrame,
+                 max_points: int = DEFAULT_MAX_POINTS) -> Tuple[List[Dict[str, Any]], bool]:
+    """
+    Points embedded for the main chart: only the date and value it plots.
+
+    Periods without a value are kept as null points, which the chart draws as
+    gaps. When more than max_points periods have a value (0 keeps every
+    point), those are downsampled with LTTB, and the first null point of each
+    gap before, between or after the kept points is kept.
+
+    Returns:
+        (points, downsampled)
+    """
+    rows = [{"date": row.get("date"), "value": row.get("value")}
+            for row in frame.raw["time_series"]]
+    valued = [i for i, row in enumerate(rows) if row["value"] is not None]
+    if max_points <= 0 or len(valued) <= max_points:
+        return rows, False
+
+    kept = [valued[i] for i in lttb_indices([rows[i]["value"] for i in valued], max_points)]
+    points = []
+    previous = -1
+    for position in kept + [len(rows)]:
+        gap = next((j for j in range(previous + 1, position) if rows[j]["value"] is None), None)
+        if gap is not None:
+            points.append(rows[gap])
+        if position < len(rows):
+            points.append(rows[position])
+        previous = position
+    return points, True
+
+
+def full_series_path(output_path: str) -> Path:
+    """Sidecar file holding the complete time series of a downsampled article."""
+    output_path = Path(output_path)
+    return output_path.with_name(f"{output_path.stem}{FULL_SERIES_SUFFIX}")
+
+
+def generate_article(data_path: str, output_path: str, lang: str = "en",
+                     cache: Optional[RenderCache] = None,
+                     max_points: int = DEFAULT_MAX_POINTS) -> str:
+    """
+    Generate a complete enhanced article from data JSON.
+
+    With a render cache, an article whose data, template, translations,
+    generator code and options are unchanged is reused instead of rendered.
+    A time series with more than max_points values is embedded downsampled (see
+    chart_series) and written in full to a .series.json file beside the
+    article, linked from under the chart.
+    """
+    # Language and translation catalog for this article
+    ctx = RenderContext(lang)
+
+    # Load data straight into the typed view; every generator below reads from it
+    with open(data_path, "rb") as f:
+        raw = f.read()
+    if cache is not None:
+        key = cache.key("enhanced", digest_bytes(raw), RENDER_INPUTS, {
+            "output_path": os.path.abspath(output_path),
+            "lang": lang,
+            "max_points": max_points,
+            # Articles are stamped with the day they were rendered
+            "release_date": datetime.now().strftime("%Y-%m-%d"),
+            # Backends may format the embedded JSON's numbers differently
+            "json_backend": json_backend.BACKEND,
+        })
+        entry = cache.fetch(key)
+        if entry is not None:
+            state = "restored from cache" if entry.get("restored") else "unchanged (cached)"
+            print(f"Enhanced article {state}: {output_path}")
+            return output_path
+    frame = SeriesFrame(json_backend.loads(raw))
+    data = frame.raw
 
     # Generate content
-    headline = generate_headline(data)
-    highlights = generate_highlights(data)
-    sections = generate_sections(data)
-    note = generate_note_to_readers(data)
-    series_name = data["metadata"].get("series_name", "")
-    period = format_month_year(data['latest']['ref_date'])
-    start_period = format_month_year(data['time_series'][0]['ref_date'])
+    headline = generate_headline(frame, ctx)
+    highlights = generate_highlights(frame, ctx)
+    sections = generate_sections(frame, ctx)
+    note = generate_note_to_readers(frame, ctx)
+    series_name = frame.series_name
+    period = format_month_year(frame.latest["ref_date"], ctx)
+    start_period = format_month_year(frame.ref_dates[0], ctx)
 
     # Chart configuration (bilingual)
     if series_name == "Retail Sales":
         if lang == "fr":
             chart_title = f"Ventes au détail, {start_period} à {period}"
-            chart_y_label = t("retail.sales_label", "Ventes (en millions de dollars)")
-            subseries_title = t("sections.sales_by_subsector", "Ventes selon le sous-secteur du commerce de détail")
-            subseries_column_header = t("tables.subsector", "Sous-secteur")
+            chart_y_label = ctx.t("retail.sales_label", "Ventes (en millions de dollars)")
+            subseries_title = ctx.t("sections.sales_by_subsector", "Ventes selon le sous-secteur du commerce de détail")
+            subseries_column_header = ctx.t("tables.subsector", "Sous-secteur")
             subseries_table_caption = f"Ventes au détail selon le sous-secteur, {period}"
-            subseries_chart_title = t("sections.yoy_by_subsector", "Variation annuelle selon le sous-secteur")
+            subseries_chart_title = ctx.t("sections.yoy_by_subsector", "Variation annuelle selon le sous-secteur")
         else:
             chart_title = f"Retail Sales, {start_period} to {period}"
             chart_y_label = "Sales ($ millions)"
@@ -548,11 +622,11 @@ def generate_article(data_path: str, output_path: str, lang: str = "en") -> str:
     else:
         if lang == "fr":
             chart_title = f"Indice des prix à la consommation, {start_period} à {period}"
-            chart_y_label = t("cpi.index_label", "Indice (2002=100)")
-            subseries_title = t("sections.prices_by_component", "Prix selon les principales composantes")
-            subseries_column_header = t("tables.component", "Composante")
+            chart_y_label = ctx.t("cpi.index_label", "Indice (2002=100)")
+            subseries_title = ctx.t("sections.prices_by_component", "Prix selon les principales composantes")
+            subseries_column_header = ctx.t("tables.component", "Composante")
             subseries_table_caption = f"Indice des prix à la consommation selon la composante principale, {period}"
-            subseries_chart_title = t("sections.yoy_by_component", "Variation annuelle selon la composante")
+            subseries_chart_title = ctx.t("sections.yoy_by_component", "Variation annuelle selon la composante")
         else:
             chart_title = f"Consumer Price Index, {start_period} to {period}"
             chart_y_label = "Index (2002=100)"
@@ -562,61 +636,46 @@ def generate_article(data_path: str, output_path: str, lang: str = "en") -> str:
             subseries_chart_title = "Year-over-year change by component"
 
     # Check for subseries and provincial data
-    has_subseries = data.get("subseries") and "category" in data.get("subseries", {}) and len(data["subseries"]["category"]) > 0
-    has_provincial = data.get("provincial") and "category" in data.get("provincial", {}) and len(data["provincial"]["category"]) > 0
+    has_subseries = frame.subseries is not None and len(frame.subseries) > 0
+    has_provincial = frame.provincial is not None and len(frame.provincial) > 0
 
     # Generate subseries and provincial narratives
-    subseries_narrative = generate_subseries_narrative(data) if has_subseries else ""
-    provincial_narrative = generate_provincial_narrative(data) if has_provincial else ""
-
-    # Load template
-    template_path = Path(__file__).parent / "templates" / "article_enhanced.html"
-    with open(template_path, "r") as f:
-        template = f.read()
-
-    # Prepare JSON data for embedding
-    time_series_json = json.dumps(data["time_series"])
-    subseries_json = json.dumps(data.get("subseries", {}))
-    provincial_json = json.dumps(data.get("provincial", {}))
+    subseries_narrative = generate_subseries_narrative(frame, ctx) if has_subseries else ""
+    provincial_narrative = generate_provincial_narrative(frame, ctx) if has_provincial else ""
+
+    # Prepare compact JSON data for embedding
+    series_points, downsampled = chart_series(frame, max_points)
+    time_series_json = json_backend.dumps(series_points)
+    full_series = full_series_path(output_path)
+    full_series_file = full_series_note = full_series_link = ""
+    if downsampled:
+        full_series_file = full_series.name
+        # Null points only mark gaps; they are not plotted periods
+        plotted = sum(1 for point in series_points if point["value"] is not None)
+        if lang == "fr":
+            full_series_note = (f"Le graphique montre {plotted} des "
+                                f"{len(data['time_series'])} périodes.")
+            full_series_link = "Télécharger la série complète (JSON)"
+        else:
+            full_series_note = (f"Chart shows {plotted} of "
+                                f"{len(data['time_series'])} periods.")
+            full_series_link = "Download the full series (JSON)"
+    subseries_json = json_backend.dumps(data.get("subseries", {}))
+    provincial_json = json_backend.dumps(data.get("provincial", {}))
 
     # Format release date bilingually
     now = datetime.now()
     if lang == "fr":
         month_en = now.strftime("%B")
-        month_fr = t(f"months.{month_en}", month_en)
+        month_fr = ctx.t(f"months.{month_en}", month_en)
         release_date_display = f"{now.day} {month_fr} {now.year}"
     else:
         release_date_display = now.strftime("%B %d, %Y")
 
-    # Template substitution
-    html = template
-    html = html.replace("{{headline}}", headline)
-    html = html.replace("{{release_date}}", release_date_display)
-    html = html.replace("{{chart_title}}", chart_title)
-    html = html.replace("{{chart_y_label}}", chart_y_label)
-    html = html.replace("{{series_name}}", series_name)
-    html = html.replace("{{note_to_readers}}", note)
-    html = html.replace("{{table_number}}", data["metadata"]["table_number"])
-    html = html.replace("{{reference_period}}", period)
-
     # StatCan metadata and URLs
-    urls = data.get("urls", {})
-    metadata = data["metadata"]
-    html = html.replace("{{table_viewer_url}}", urls.get("table_viewer", ""))
-    html = html.replace("{{csv_download_url}}", urls.get("csv_download", ""))
-
-    # Legacy CANSIM ID (conditional)
-    cansim_id = metadata.get("cansim_id", "")
-    if cansim_id:
-        html = re.sub(r'\{\{#cansim_id\}\}', '', html)
-        html = re.sub(r'\{\{/cansim_id\}\}', '', html)
-        html = html.replace("{{cansim_id}}", cansim_id)
-    else:
-        html = re.sub(r'\{\{#cansim_id\}\}.*?\{\{/cansim_id\}\}', '', html, flags=re.DOTALL)
-
-    # Survey info
+    urls = frame.urls
+    metadata = frame.metadata
     survey_code = metadata.get("survey_code", "")
-    html = html.replace("{{survey_code}}", survey_code)
 
     # Map survey codes to survey names (bilingual)
     if lang == "fr":
@@ -634,7 +693,6 @@ def generate_article(data_path: str, output_path: str, lang: str = "en") -> str:
         }
         default_survey = "Statistics Canada survey"
     survey_name = survey_names.get(survey_code, default_survey)
-    html = html.replace("{{survey_name}}", survey_name)
 
     # Release date from metadata (bilingual)
     release_time = metadata.get("release_time", "")
@@ -643,73 +701,65 @@ def generate_article(data_path: str, output_path: str, lang: str = "en") -> str:
             release_dt = datetime.strptime(release_time[:10], "%Y-%m-%d")
             if lang == "fr":
                 src_month_en = release_dt.strftime("%B")
-                src_month_fr = t(f"months.{src_month_en}", src_month_en)
+                src_month_fr = ctx.t(f"months.{src_month_en}", src_month_en)
                 release_date_source = f"{release_dt.day} {src_month_fr} {release_dt.year}"
             else:
                 release_date_source = release_dt.strftime("%B %d, %Y")
-            html = html.replace("{{release_date_source}}", release_date_source)
         except ValueError:
-            html = html.replace("{{release_date_source}}", release_time)
+            release_date_source = release_time
     else:
-        not_available = "Non disponible" if lang == "fr" else "Not available"
-        html = html.replace("{{release_date_source}}", not_available)
-    html = html.replace("{{time_series_json}}", time_series_json)
-    html = html.replace("{{subseries_json}}", subseries_json)
-    html = html.replace("{{provincial_json}}", provincial_json)
-
-    # Subseries configuration
-    html = html.replace("{{subseries_title}}", subseries_title)
-    html = html.replace("{{subseries_column_header}}", subseries_column_header)
-    html = html.replace("{{subseries_table_caption}}", subseries_table_caption)
-    html = html.replace("{{subseries_chart_title}}", subseries_chart_title)
-    html = html.replace("{{subseries_narrative}}", subseries_narrative)
+        release_date_source = "Non disponible" if lang == "fr" else "Not available"
 
     # Provincial configuration (bilingual)
     if lang == "fr":
         provincial_table_caption = f"Indice des prix à la consommation selon la province, {period}"
     else:
         provincial_table_caption = f"Consumer Price Index by province, {period}"
-    html = html.replace("{{provincial_table_caption}}", provincial_table_caption)
-    html = html.replace("{{provincial_narrative}}", provincial_narrative)
-
-    # Handle conditional sections
-    if has_subseries:
-        html = re.sub(r'\{\{#has_subseries\}\}', '', html)
-        html = re.sub(r'\{\{/has_subseries\}\}', '', html)
-    else:
-        html = re.sub(r'\{\{#has_subseries\}\}.*?\{\{/has_subseries\}\}', '', html, flags=re.DOTALL)
-
-    if has_provincial:
-        html = re.sub(r'\{\{#has_provincial\}\}', '', html)
-        html = re.sub(r'\{\{/has_provincial\}\}', '', html)
-    else:
-        html = re.sub(r'\{\{#has_provincial\}\}.*?\{\{/has_provincial\}\}', '', html, flags=re.DOTALL)
-
-    # Handle definitions (simplified - not in enhanced data yet)
-    html = re.sub(r'\{\{#has_definitions\}\}.*?\{\{/has_definitions\}\}', '', html, flags=re.DOTALL)
-
-    # Handle highlights (mustache-style list)
-    highlights_html = "\n".join(f"      <li>{h}</li>" for h in highlights)
-    html = re.sub(
-        r'\{\{#highlights\}\}.*?\{\{/highlights\}\}',
-        highlights_html,
-        html,
-        flags=re.DOTALL
-    )
-
-    # Handle sections
-    sections_html = "\n".join(f"    <p>{s}</p>" for s in sections)
-    html = re.sub(
-        r'\{\{#sections\}\}.*?\{\{/sections\}\}',
-        sections_html,
-        html,
-        flags=re.DOTALL
-    )
 
-    # Write output
-    Path(output_path).parent.mkdir(parents=True, exist_ok=True)
-    with open(output_path, "w") as f:
-        f.write(html)
+    # Render template in a single pass
+    html = render_template(TEMPLATE_PATH, {
+        "headline": headline,
+        "release_date": release_date_display,
+        "chart_title": chart_title,
+        "chart_y_label": chart_y_label,
+        "series_name": series_name,
+        "note_to_readers": note,
+        "table_number": metadata["table_number"],
+        "reference_period": period,
+        "table_viewer_url": urls.get("table_viewer", ""),
+        "csv_download_url": urls.get("csv_download", ""),
+        # Legacy CANSIM ID (conditional)
+        "cansim_id": metadata.get("cansim_id", ""),
+        "survey_code": survey_code,
+        "survey_name": survey_name,
+        "release_date_source": release_date_source,
+        "time_series_json": time_series_json,
+        "full_series_file": full_series_file,
+        "full_series_note": full_series_note,
+        "full_series_link": full_series_link,
+        "subseries_json": subseries_json,
+        "provincial_json": provincial_json,
+        "subseries_title": subseries_title,
+        "subseries_column_header": subseries_column_header,
+        "subseries_table_caption": subseries_table_caption,
+        "subseries_chart_title": subseries_chart_title,
+        "subseries_narrative": subseries_narrative,
+        "provincial_table_caption": provincial_table_caption,
+        "provincial_narrative": provincial_narrative,
+        "has_subseries": has_subseries,
+        "has_provincial": has_provincial,
+        # Definitions are not in enhanced data yet
+        "has_definitions": False,
+        "highlights": highlights,
+        "sections": sections,
+    })
+
+    # Write output; the full series is only kept while the chart is downsampled
+    write_if_changed(output_path, html)
+    if full_series_file:
+        write_if_changed(full_series, json_backend.dumps(data["time_series"]))
+    elif full_series.exists():
+        full_series.unlink()
 
     print(f"Enhanced article generated: {output_path}")
     print(f"Headline: {headline}")
@@ -718,6 +768,8 @@ def generate_article(data_path: str, output_path: str, lang: str = "en") -> str:
     print(f"Has subseries table: {has_subseries}")
     print(f"Has provincial table: {has_provincial}")
 
+    if cache is not None:
+        cache.put(key, output_path, attachments=[full_series] if full_series_file else [])
     return output_path
 
 
@@ -730,7 +782,14 @@ if __name__ == "__main__":
                         help="Output HTML file path (default: output/article_enhanced.html)")
     parser.add_argument("--lang", choices=["en", "fr"], default="en",
                         help="Language for article generation (default: en)")
+    parser.add_argument("--no-cache", action="store_true",
+                        help="Render even if the inputs are unchanged since the last run")
+    parser.add_argument("--max-points", type=int, default=DEFAULT_MAX_POINTS,
+                        help="Downsample the embedded chart series above this many points; "
+                             f"0 embeds every point (default: {DEFAULT_MAX_POINTS})")
 
     args = parser.parse_args()
 
-    generate_article(args.data_path, args.output_path, lang=args.lang)
+    generate_article(args.data_path, args.output_path, lang=args.lang,
+                     cache=None if args.no_cache else default_cache(),
+                     max_points=args.max_points)
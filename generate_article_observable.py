@@ -7,14 +7,28 @@ Outputs to docs/en/ or docs/fr/ directories for the Observable site.
 """
 
 import argparse
-import json
+import contextlib
+import glob
+import os
 import re
+import time
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor, as_completed
 from pathlib import Path
 from datetime import datetime
-from typing import Dict, List, Any, Optional
+from functools import lru_cache
+from typing import Any, Callable, Dict, List, Optional, Tuple
 import logging
 import sys
 
+import json_backend
+import series_frame
+import spans
+import translations
+from atomic_write import write_if_changed
+from render_cache import RenderCache, default_cache, digest_bytes
+from series_frame import PeriodIndex, RebasedData, SeriesFrame, SeriesView
+from translations import RenderContext
+
 # Set up logging
 logging.basicConfig(
     level=logging.INFO,
@@ -22,9 +36,6 @@ logging.basicConfig(
 )
 logger = logging.getLogger(__name__)
 
-# Global translations dictionary (loaded at runtime)
-TRANSLATIONS: Dict[str, Any] = {}
-LANG: str = "en"
 
 
 # =============================================================================
@@ -43,17 +54,20 @@ class ReviewError(Exception):
 
 class ValidationResult:
     """Result of data validation with errors and warnings."""
-    def __init__(self):
+    def __init__(self, log: bool = True):
         self.errors: List[str] = []
         self.warnings: List[str] = []
+        self.log = log
 
     def add_error(self, msg: str):
         self.errors.append(msg)
-        logger.error(msg)
+        if self.log:
+            logger.error(msg)
 
     def add_warning(self, msg: str):
         self.warnings.append(msg)
-        logger.warning(msg)
+        if self.log:
+            logger.warning(msg)
 
     @property
     def is_valid(self) -> bool:
@@ -68,163 +82,265 @@ class ValidationResult:
             return f"Validation FAILED: {len(self.errors)} error(s), {len(self.warnings)} warning(s)"
 
 
-def validate_data(data: Dict[str, Any], strict: bool = False) -> ValidationResult:
+# Issue severities for validation rules
+ERROR = "error"
+WARNING = "warning"
+
+# Declarative validation schema for data_*.json, checked in order. Each rule is
+# (kind, *params); compile_validator() turns the list into a flat sequence of
+# check functions once, so validating a file is just running those checks.
+#
+#   ("required", fields)                       top-level fields that must exist
+#                                              and be non-null; validation stops
+#                                              here if any are missing
+#   ("truthy", section, field, severity, msg)  section[field] must be truthy
+#                                              (section "" is the top level)
+#   ("not_null", section, field, severity, msg)
+#   ("freshness", field, error_months, warning_months)
+#                                              age of latest[field] ("YYYY-MM")
+#   ("min_length", field, error_below, warning_below)
+#   ("r_validation",)                          copy the R fetcher's own results
+#   ("range", series_name, lo, hi, msg)        latest value bounds for a series
+#   ("max_abs", field, limit, severity, msg)   |latest[field]| must not exceed limit
+#
+# "range" and "max_abs" are sanity checks and only run when the latest value
+# is present. Messages are str.format templates.
+VALIDATION_SCHEMA: List[Tuple] = [
+    ("required", ("metadata", "latest", "time_series")),
+    ("truthy", "metadata", "table_number", ERROR, "Missing metadata field: table_number"),
+    ("truthy", "metadata", "table_title", ERROR, "Missing metadata field: table_title"),
+    ("truthy", "metadata", "reference_period", ERROR, "Missing metadata field: reference_period"),
+    ("not_null", "latest", "value", ERROR, "Latest value is missing or null"),
+    ("not_null", "latest", "ref_date", ERROR, "Latest ref_date is missing"),
+    ("not_null", "latest", "mom_pct_change", WARNING, "Month-over-month change is missing"),
+    ("not_null", "latest", "yoy_pct_change", WARNING, "Year-over-year change is missing"),
+    ("freshness", "ref_date", 6, 3),
+    ("min_length", "time_series", 6, 12),
+    ("truthy", "", "subseries", WARNING, "No subseries breakdown data available"),
+    ("truthy", "", "provincial", WARNING, "No provincial breakdown data available"),
+    ("r_validation",),
+    ("range", "Consumer Price Index", 50, 300,
+     "CPI value {value:.1f} outside expected range (50-300)"),
+    ("max_abs", "mom_pct_change", 15, WARNING, "Large month-over-month change: {value:.1f}%"),
+    ("max_abs", "yoy_pct_change", 50, WARNING, "Large year-over-year change: {value:.1f}%"),
+]
+
+REF_MONTH_RE = re.compile(r"(\d{4})-(1[0-2]|0[1-9]|[1-9])")
+
+
+@lru_cache(maxsize=1024)
+def parse_ref_month(ref_date: str) -> datetime:
+    """Parse 'YYYY-MM' like datetime.strptime(ref_date, "%Y-%m"), memoized."""
+    match = REF_MONTH_RE.fullmatch(ref_date)
+    if not match:
+        raise ValueError(f"time data {ref_date!r} does not match format '%Y-%m'")
+    return datetime(int(match.group(1)), int(match.group(2)), 1)
+
+
+def _issue(result: ValidationResult, severity: str, msg: str) -> None:
+    if severity == ERROR:
+        result.add_error(msg)
+    else:
+        result.add_warning(msg)
+
+
+def _compile_rule(rule: Tuple) -> Callable:
+    """Turn one schema rule into check(data, latest, now, result)."""
+    kind = rule[0]
+
+    if kind == "truthy" or kind == "not_null":
+        _, section, field, severity, msg = rule
+        if kind == "truthy":
+            def failed(value):
+                return not value
+        else:
+            def failed(value):
+                return value is None
+
+        if not section:
+            def check(data, latest, now, result):
+                if failed(data.get(field)):
+                    _issue(result, severity, msg)
+        elif section == "latest":
+            def check(data, latest, now, result):
+                if failed(latest.get(field)):
+                    _issue(result, severity, msg)
+        else:
+            def check(data, latest, now, result):
+                if failed(data.get(section, {}).get(field)):
+                    _issue(result, severity, msg)
+        return check
+
+    if kind == "freshness":
+        _, field, error_months, warning_months = rule
+
+        def check(data, latest, now, result):
+            ref_date = latest.get(field)
+            if not ref_date:
+                return
+            try:
+                age_months = (now - parse_ref_month(ref_date)).days / 30
+            except (TypeError, ValueError):
+                result.add_warning(f"Could not parse ref_date: {ref_date}")
+                return
+            if age_months > error_months:
+                result.add_error(f"Data is too old: {age_months:.1f} months (max {error_months})")
+            elif age_months > warning_months:
+                result.add_warning(f"Data is {age_months:.1f} months old")
+        return check
+
+    if kind == "min_length":
+        _, field, error_below, warning_below = rule
+
+        def check(data, latest, now, result):
+            series = data.get(field, [])
+            if not isinstance(series, (list, SeriesView)):
+                result.add_error("Time series is not a list")
+            elif len(series) < error_below:
+                result.add_error(f"Time series too short: {len(series)} points (min {error_below})")
+            elif len(series) < warning_below:
+                result.add_warning(f"Time series has only {len(series)} points (recommend {warning_below}+)")
+        return check
+
+    if kind == "r_validation":
+        def check(data, latest, now, result):
+            r_validation = data.get("validation", {})
+            if not r_validation:
+                return
+            if not r_validation.get("passed", True):
+                r_errors = r_validation.get("errors", {})
+                for key, msg in r_errors.items() if isinstance(r_errors, dict) else []:
+                    result.add_error(f"R validation error ({key}): {msg}")
+
+            r_warnings = r_validation.get("warnings", {})
+            if isinstance(r_warnings, dict):
+                for key, msg in r_warnings.items():
+                    result.add_warning(f"R validation warning ({key}): {msg}")
+            elif isinstance(r_warnings, list):
+                for msg in r_warnings:
+                    result.add_warning(f"R validation: {msg}")
+        return check
+
+    if kind == "range":
+        _, series_name, lo, hi, msg = rule
+
+        def check(data, latest, now, result):
+            value = latest.get("value")
+            if value is None or data["metadata"].get("series_name", "") != series_name:
+                return
+            if value < lo or value > hi:
+                result.add_error(msg.format(value=value))
+        return check
+
+    if kind == "max_abs":
+        _, field, limit, severity, msg = rule
+
+        def check(data, latest, now, result):
+            if latest.get("value") is None:
+                return
+            value = latest.get(field)
+            if value is not None and abs(value) > limit:
+                _issue(result, severity, msg.format(value=value))
+        return check
+
+    raise ValueError(f"Unknown validation rule: {kind}")
+
+
+class CompiledValidator:
+    """A validation schema compiled into an ordered list of check functions."""
+
+    def __init__(self, schema: List[Tuple]):
+        if not schema or schema[0][0] != "required":
+            raise ValueError("Validation schema must start with a 'required' rule")
+        self.required: Tuple[str, ...] = tuple(schema[0][1])
+        self.checks: List[Callable] = [_compile_rule(rule) for rule in schema[1:]]
+
+    def validate(self, data: Dict[str, Any], strict: bool = False,
+                 log: bool = True) -> ValidationResult:
+        result = ValidationResult(log=log)
+
+        for field in self.required:
+            if field not in data:
+                result.add_error(f"Missing required field: {field}")
+            elif data[field] is None:
+                result.add_error(f"Field '{field}' is null")
+
+        if not result.is_valid:
+            return result  # Can't continue without these fields
+
+        latest = data.get("latest", {})
+        now = datetime.now()
+        for check in self.checks:
+            check(data, latest, now, result)
+
+        # Convert warnings to errors if strict mode
+        if strict and result.warnings:
+            for warning in result.warnings:
+                result.errors.append(f"[strict] {warning}")
+            result.warnings.clear()
+
+        return result
+
+
+DATA_VALIDATOR = CompiledValidator(VALIDATION_SCHEMA)
+
+
+def validate_data(data: Dict[str, Any], strict: bool = False,
+                  log: bool = True) -> ValidationResult:
     """
     Validate JSON data before article generation.
 
     Args:
         data: The loaded JSON data from R script
         strict: If True, treat warnings as errors
+        log: Log each issue as it is found
 
     Returns:
         ValidationResult with errors and warnings
     """
-    result = ValidationResult()
-
-    # 1. Check required top-level fields
-    required_fields = ["metadata", "latest", "time_series"]
-    for field in required_fields:
-        if field not in data:
-            result.add_error(f"Missing required field: {field}")
-        elif data[field] is None:
-            result.add_error(f"Field '{field}' is null")
-
-    if not result.is_valid:
-        return result  # Can't continue without these fields
-
-    # 2. Validate metadata
-    metadata = data.get("metadata", {})
-    required_metadata = ["table_number", "table_title", "reference_period"]
-    for field in required_metadata:
-        if not metadata.get(field):
-            result.add_error(f"Missing metadata field: {field}")
-
-    # 3. Validate latest data point
-    latest = data.get("latest", {})
-    if latest.get("value") is None:
-        result.add_error("Latest value is missing or null")
-    if latest.get("ref_date") is None:
-        result.add_error("Latest ref_date is missing")
-
-    if latest.get("mom_pct_change") is None:
-        result.add_warning("Month-over-month change is missing")
-    if latest.get("yoy_pct_change") is None:
-        result.add_warning("Year-over-year change is missing")
-
-    # 4. Validate date freshness
-    if latest.get("ref_date"):
-        try:
-            ref_date = datetime.strptime(latest["ref_date"], "%Y-%m")
-            age_days = (datetime.now() - ref_date).days
-            age_months = age_days / 30
-
-            if age_months > 6:
-                result.add_error(f"Data is too old: {age_months:.1f} months (max 6)")
-            elif age_months > 3:
-                result.add_warning(f"Data is {age_months:.1f} months old")
-        except ValueError:
-            result.add_warning(f"Could not parse ref_date: {latest['ref_date']}")
-
-    # 5. Validate time series length
-    time_series = data.get("time_series", [])
-    if isinstance(time_series, list):
-        ts_length = len(time_series)
-        if ts_length < 6:
-            result.add_error(f"Time series too short: {ts_length} points (min 6)")
-        elif ts_length < 12:
-            result.add_warning(f"Time series has only {ts_length} points (recommend 12+)")
-    else:
-        result.add_error("Time series is not a list")
-
-    # 6. Check for subseries and provincial data (optional but informative)
-    if not data.get("subseries"):
-        result.add_warning("No subseries breakdown data available")
-    if not data.get("provincial"):
-        result.add_warning("No provincial breakdown data available")
-
-    # 7. Check R script validation results if present
-    r_validation = data.get("validation", {})
-    if r_validation:
-        if not r_validation.get("passed", True):
-            r_errors = r_validation.get("errors", {})
-            for key, msg in r_errors.items() if isinstance(r_errors, dict) else []:
-                result.add_error(f"R validation error ({key}): {msg}")
-
-        r_warnings = r_validation.get("warnings", {})
-        if isinstance(r_warnings, dict):
-            for key, msg in r_warnings.items():
-                result.add_warning(f"R validation warning ({key}): {msg}")
-        elif isinstance(r_warnings, list):
-            for msg in r_warnings:
-                result.add_warning(f"R validation: {msg}")
-
-    # 8. Sanity check values
-    if latest.get("value") is not None:
-        value = latest["value"]
-        series_name = metadata.get("series_name", "")
-
-        if series_name == "Consumer Price Index":
-            if value < 50 or value > 300:
-                result.add_error(f"CPI value {value:.1f} outside expected range (50-300)")
-
-        if latest.get("mom_pct_change") is not None:
-            mom = latest["mom_pct_change"]
-            if abs(mom) > 15:
-                result.add_warning(f"Large month-over-month change: {mom:.1f}%")
-
-        if latest.get("yoy_pct_change") is not None:
-            yoy = latest["yoy_pct_change"]
-            if abs(yoy) > 50:
-                result.add_warning(f"Large year-over-year change: {yoy:.1f}%")
-
-    # Convert warnings to errors if strict mode
-    if strict and result.warnings:
-        for warning in result.warnings:
-            result.errors.append(f"[strict] {warning}")
-        result.warnings.clear()
-
-    return result
+    return DATA_VALIDATOR.validate(data, strict=strict, log=log)
 
 
 # =============================================================================
 # DATA REBASING FOR HISTORICAL PERIODS
 # =============================================================================
 
-def rebase_data_to_period(data: Dict[str, Any], target_ref_date: str) -> Dict[str, Any]:
+def rebase_data_to_period(data: Dict[str, Any], target_ref_date: str,
+                          index: Optional[PeriodIndex] = None) -> RebasedData:
     """
     Rebase data to a historical reference period.
 
-    Finds the target period in time_series and updates the 'latest' object
-    to point to that period's values.
+    Finds the target period in time_series and returns a read-only view of
+    the data whose 'latest' points to that period's values and whose
+    time_series ends at it. Nothing is copied: with a prebuilt index each
+    rebase is a lookup, a bisection and a new 'latest'.
 
     Args:
-        data: Original data dictionary
+        data: Original data dictionary (not mutated)
         target_ref_date: Target reference date (e.g., "2025-10")
+        index: PeriodIndex of data's time_series, for callers rebasing the
+            same data to many periods (built here if omitted)
 
     Returns:
-        Modified data dictionary with 'latest' pointing to target period
+        RebasedData view with 'latest' pointing to target period
 
     Raises:
         ValueError: If target period not found in time_series
     """
-    import copy
-    data = copy.deepcopy(data)  # Don't mutate original
-
     time_series = data.get("time_series", [])
 
     # Find the target period in time series
-    target_entry = None
-    for entry in time_series:
-        if entry.get("ref_date") == target_ref_date:
-            target_entry = entry
-            break
+    if index is None:
+        index = PeriodIndex(time_series)
+    position = index.position(target_ref_date)
 
-    if not target_entry:
+    if position is None:
         available = [e.get("ref_date") for e in time_series[-12:]]
         raise ValueError(
             f"Reference date '{target_ref_date}' not found in time series. "
             f"Recent available periods: {available}"
         )
+    target_entry = time_series[position]
 
     # Build new 'latest' object from the target entry
     new_latest = {
@@ -236,21 +352,24 @@ def rebase_data_to_period(data: Dict[str, Any], target_ref_date: str) -> Dict[st
         "yoy_change": target_entry.get("yoy_change", target_entry.get("value", 0) * target_entry.get("yoy_pct_change", 0) / 100),
         "yoy_pct_change": target_entry.get("yoy_pct_change", 0),
     }
+    overrides: Dict[str, Any] = {"latest": new_latest}
 
-    data["latest"] = new_latest
-
-    # Update metadata reference_period
+    # Update metadata reference_period (shallow overlay, original untouched)
     if "metadata" in data:
-        data["metadata"]["reference_period"] = target_ref_date
+        overrides["metadata"] = dict(data["metadata"], reference_period=target_ref_date)
 
     # Trim time_series to end at target period
-    trimmed_series = [e for e in time_series if e.get("ref_date", "") <= target_ref_date]
-    data["time_series"] = trimmed_series
+    stop = index.stop(target_ref_date)
+    if stop is not None:
+        overrides["time_series"] = SeriesView(time_series, stop)
+    else:
+        # Unsorted series: keep every entry dated on or before the target
+        overrides["time_series"] = [e for e in time_series if e.get("ref_date", "") <= target_ref_date]
 
     logger.info(f"Rebased data to reference period: {target_ref_date}")
     logger.info(f"  Value: {new_latest['value']}, YoY: {new_latest['yoy_pct_change']}%")
 
-    return data
+    return RebasedData(data, overrides)
 
 
 # =============================================================================
@@ -292,7 +411,126 @@ class ReviewResult:
             return f"Self-review: found {total} issue(s), fixed {fixed}, {unfixed} unfixed"
 
 
-def review_and_fix_article(markdown: str, data: Dict[str, Any], lang: str = "en") -> tuple:
+# Placeholder patterns checked by the reviewer, with a lowercase trigger
+# substring that must be present for the pattern to be able to match
+PLACEHOLDER_PATTERNS = [
+    (re.compile(r'\| [^|]*— [^|]*\|', re.IGNORECASE), 'em-dash placeholder in table', '—'),
+    (re.compile(r'\| [^|]*—\|', re.IGNORECASE), 'em-dash placeholder in table', '—'),
+    (re.compile(r'\bTBD\b', re.IGNORECASE), 'TBD placeholder', 'tbd'),
+    (re.compile(r'\bTODO\b', re.IGNORECASE), 'TODO placeholder', 'todo'),
+    (re.compile(r'\[placeholder\]', re.IGNORECASE), 'placeholder marker', '[placeholder]'),
+    (re.compile(r'\[TBD\]', re.IGNORECASE), 'TBD marker', 'tbd'),
+    (re.compile(r'\$0\.0 billion', re.IGNORECASE), 'zero dollar value', '$0.0 billion'),
+    (re.compile(r'\+0\.0%\s*\|', re.IGNORECASE), 'zero percent in table (may be intentional)', '+0.0%'),
+]
+
+
+TABLE_SEPARATOR_RE = re.compile(r'\|[-|]+\|')
+HIGHLIGHTS_MARKERS = ('**Highlights**', '**Faits saillants**')
+
+
+class MarkdownScan:
+    """
+    One-pass line tokenization of article markdown for the reviewer.
+
+    Records the headings, paragraphs, table bodies and highlights list the
+    review rules look at, so each rule reads this structure instead of
+    re-scanning the whole document. Lines follow str.split("\n"): every line
+    but the last is newline-terminated.
+    """
+
+    def __init__(self, markdown: str):
+        self.lines = markdown.split("\n")
+        # (line index, title) for lines containing "## " with text after it
+        self.headings: List[tuple] = []
+        # Lines of 51+ chars after a blank line, not starting with # or <
+        self.paragraphs: List[str] = []
+        # Body rows of pipe tables, one list of rows per table
+        self.tables: List[List[str]] = []
+        # Bullet lines under the first highlights marker, or None if absent
+        self.highlights: Optional[List[str]] = None
+
+        lines = self.lines
+        last = len(lines) - 1
+        table_resume = 0
+
+        for i, line in enumerate(lines):
+            marker = line.find("## ")
+            if marker != -1 and len(line) > marker + 3:
+                self.headings.append((i, line[marker + 3:]))
+
+            if (i >= 2 and not lines[i - 1] and len(line) > 50
+                    and line[0] not in "#<"):
+                self.paragraphs.append(line)
+
+            if i >= table_resume and line.endswith("|") and self._is_table_header(i):
+                rows = []
+                j = i + 2
+                while j < last and self._is_table_row(lines[j]):
+                    rows.append(lines[j])
+                    j += 1
+                self.tables.append(rows)
+                table_resume = j
+
+            if (self.highlights is None and i + 1 < last and not lines[i + 1]
+                    and line.endswith(HIGHLIGHTS_MARKERS)):
+                bullets = []
+                j = i + 2
+                while j < last and lines[j].startswith("- ") and len(lines[j]) > 2:
+                    bullets.append(lines[j])
+                    j += 1
+                self.highlights = bullets
+
+    @staticmethod
+    def _is_table_row(line: str) -> bool:
+        return len(line) > 2 and line[0] == "|" and line[-1] == "|"
+
+    def _is_table_header(self, i: int) -> bool:
+        lines = self.lines
+        if i + 2 >= len(lines) - 1:
+            return False
+        line = lines[i]
+        pipe = line.find("|")
+        return (line.endswith("|") and pipe != -1 and pipe <= len(line) - 3
+                and TABLE_SEPARATOR_RE.fullmatch(lines[i + 1]) is not None
+                and self._is_table_row(lines[i + 2]))
+
+    def empty_sections(self) -> List[str]:
+        """Headings followed by a blank line and then another heading, a <div, or the end."""
+        lines = self.lines
+        last = len(lines) - 1
+        found = []
+        resume = 0
+        for i, title in self.headings:
+            if i < resume or i + 1 >= last or lines[i + 1]:
+                continue
+            rest = i + 2
+            nxt = rest
+            while nxt <= last and not lines[nxt]:
+                nxt += 1
+            if (lines[rest].startswith("## ") or nxt > last
+                    or lines[nxt].startswith("<div")):
+                found.append(title)
+                resume = i + 2
+        return found
+
+    def short_sections(self) -> List[tuple]:
+        """(title, content) for headings whose section is one line of at most 50 chars."""
+        lines = self.lines
+        last = len(lines) - 1
+        found = []
+        resume = 0
+        for i, title in self.headings:
+            if (i < resume or i + 3 >= last or lines[i + 1] or lines[i + 3]
+                    or not 1 <= len(lines[i + 2]) <= 50):
+                continue
+            if lines[i + 4].startswith(("## ", "<div")):
+                found.append((title, lines[i + 2]))
+                resume = i + 4
+        return found
+
+
+def review_and_fix_article(markdown: str, data: SeriesFrame, lang: str = "en") -> tuple:
     """
     Review generated article markdown and fix common issues.
 
@@ -302,9 +540,14 @@ def review_and_fix_article(markdown: str, data: Dict[str, Any], lang: str = "en"
     - Tables with missing values
     - Incomplete data that could be filled from source
 
+    Placeholder regexes only run when their literal trigger occurs; the structural checks
+    all run over one MarkdownScan of the (fixed) markdown, so review cost
+    grows with article length rather than with the number of rules.
+
     Args:
         markdown: The generated article markdown
-        data: The source data JSON (for filling missing values)
+        data: The source data, as a SeriesFrame or raw JSON dict (for filling
+            missing values)
         lang: Language code for formatting
 
     Returns:
@@ -313,66 +556,50 @@ def review_and_fix_article(markdown: str, data: Dict[str, Any], lang: str = "en"
     result = ReviewResult()
     fixed_md = markdown
 
-    # Pattern definitions for common issues
-    placeholder_patterns = [
-        (r'\| [^|]*— [^|]*\|', 'em-dash placeholder in table'),
-        (r'\| [^|]*—\|', 'em-dash placeholder in table'),
-        (r'\bTBD\b', 'TBD placeholder'),
-        (r'\bTODO\b', 'TODO placeholder'),
-        (r'\[placeholder\]', 'placeholder marker'),
-        (r'\[TBD\]', 'TBD marker'),
-        (r'\$0\.0 billion', 'zero dollar value'),
-        (r'\+0\.0%\s*\|', 'zero percent in table (may be intentional)'),
-    ]
-
-    # Check for placeholder patterns
-    for pattern, description in placeholder_patterns:
-        matches = re.findall(pattern, fixed_md, re.IGNORECASE)
+    # Check for placeholder patterns; a clean article only pays for the
+    # lowercase copy and a literal substring search per trigger
+    md_lower = fixed_md.lower()
+    for pattern, description, trigger in PLACEHOLDER_PATTERNS:
+        if trigger not in md_lower:
+            continue
+        matches = pattern.findall(fixed_md)
         if matches:
             result.add_found(f"{description} ({len(matches)} occurrence(s))")
 
             # Attempt to fix based on pattern type
             if 'em-dash' in description:
-                fixed_md, fixed_count = _fix_table_placeholders(fixed_md, data, lang, result)
+                fixed_md, fixed_count = _fix_table_placeholders(
+                    fixed_md, SeriesFrame.of(data), lang, result)
+
+    scan = MarkdownScan(fixed_md)
 
     # Check for empty sections
-    empty_section_pattern = r'## ([^\n]+)\n\n(?=## |\n*$|\n*<div)'
-    empty_matches = re.findall(empty_section_pattern, fixed_md)
-    for section_title in empty_matches:
+    for section_title in scan.empty_sections():
         result.add_found(f"Empty section: '{section_title}'")
         # Can't auto-fix empty sections - need content generation
         result.add_unfixed(f"Empty section '{section_title}'", "requires content generation")
 
     # Check for very short content sections (less than 50 chars between headers)
-    short_section_pattern = r'## ([^\n]+)\n\n(.{1,50})\n\n(?=## |<div)'
-    short_matches = re.findall(short_section_pattern, fixed_md)
-    for section_title, content in short_matches:
+    for section_title, content in scan.short_sections():
         if not content.strip().startswith('```'):  # Ignore if it's just a code block
             result.add_found(f"Very short section: '{section_title}' ({len(content)} chars)")
 
     # Check for tables with all placeholder values
-    table_pattern = r'\|[^\n]+\|\n\|[-|]+\|\n((?:\|[^\n]+\|\n)+)'
-    for match in re.finditer(table_pattern, fixed_md):
-        table_content = match.group(1)
-        placeholder_count = table_content.count('—')
-        row_count = table_content.count('\n')
+    for rows in scan.tables:
+        placeholder_count = sum(row.count('—') for row in rows)
+        row_count = len(rows)
         if placeholder_count > 0 and placeholder_count >= row_count:
             result.add_found(f"Table with many placeholders ({placeholder_count} in {row_count} rows)")
 
     # Check for missing highlights
-    if '**Highlights**' in fixed_md or '**Faits saillants**' in fixed_md:
-        highlights_pattern = r'\*\*(Highlights|Faits saillants)\*\*\n\n((?:- [^\n]+\n)*)'
-        match = re.search(highlights_pattern, fixed_md)
-        if match:
-            highlights_content = match.group(2)
-            highlight_count = highlights_content.count('- ')
-            if highlight_count < 2:
-                result.add_found(f"Too few highlights ({highlight_count})")
+    if scan.highlights is not None:
+        highlight_count = sum(line.count('- ') for line in scan.highlights)
+        if highlight_count < 2:
+            result.add_found(f"Too few highlights ({highlight_count})")
 
     # Check for duplicate content
-    paragraphs = re.findall(r'\n\n([^#<\n][^\n]{50,})', fixed_md)
     seen_paragraphs = {}
-    for para in paragraphs:
+    for para in scan.paragraphs:
         para_normalized = para.strip().lower()[:100]
         if para_normalized in seen_paragraphs:
             result.add_found(f"Duplicate paragraph starting with: '{para[:50]}...'")
@@ -381,7 +608,7 @@ def review_and_fix_article(markdown: str, data: Dict[str, Any], lang: str = "en"
     return fixed_md, result
 
 
-def _fix_table_placeholders(markdown: str, data: Dict[str, Any], lang: str, result: ReviewResult) -> tuple:
+def _fix_table_placeholders(markdown: str, frame: SeriesFrame, lang: str, result: ReviewResult) -> tuple:
     """
     Attempt to fix table placeholder values using source data.
 
@@ -406,16 +633,12 @@ def _fix_table_placeholders(markdown: str, data: Dict[str, Any], lang: str, resu
         pattern = rf'\| {re.escape(display_name)} \| — \| — \|'
         if re.search(pattern, fixed_md):
             # Try to find the value in subseries data
-            subseries = data.get('subseries', {})
-            if subseries and 'category' in subseries:
-                categories = subseries.get('category', [])
-                values = subseries.get('value', [])
-                mom_changes = subseries.get('mom_pct_change', [])
-
-                for i, cat in enumerate(categories):
+            subseries = frame.subseries
+            if subseries is not None:
+                for i, cat in enumerate(subseries.categories):
                     if lookup_name.lower() in cat.lower():
-                        value = values[i] if i < len(values) else None
-                        mom = mom_changes[i] if i < len(mom_changes) else None
+                        value = subseries.value('value', i)
+                        mom = subseries.value('mom_pct_change', i)
 
                         if value is not None and mom is not None:
                             if lang == 'fr':
@@ -440,8 +663,8 @@ def _fix_table_placeholders(markdown: str, data: Dict[str, Any], lang: str, resu
     provincial_vs_pattern = r'\| ([^|]+) \| \+?(\d+[.,]\d+) %? \| — \|'
     matches = list(re.finditer(provincial_vs_pattern, fixed_md))
 
-    if matches and data.get('latest', {}).get('yoy_pct_change') is not None:
-        national_rate = data['latest']['yoy_pct_change']
+    if matches and frame.latest is not None and frame.latest.get('yoy_pct_change') is not None:
+        national_rate = frame.latest['yoy_pct_change']
 
         for match in matches:
             province = match.group(1).strip()
@@ -488,55 +711,31 @@ def _fix_table_placeholders(markdown: str, data: Dict[str, Any], lang: str, resu
     return fixed_md, fix_count
 
 
-def load_translations(lang: str = "en") -> Dict[str, Any]:
-    """Load translations for the specified language."""
-    global TRANSLATIONS, LANG
-    LANG = lang
-    translations_path = Path(__file__).parent / "templates" / "translations.json"
-    with open(translations_path, "r", encoding="utf-8") as f:
-        all_translations = json.load(f)
-    TRANSLATIONS = all_translations.get(lang, all_translations["en"])
-    return TRANSLATIONS
-
-
-def t(key_path: str, default: str = "") -> str:
-    """Get a translation by dot-notation path."""
-    keys = key_path.split(".")
-    value = TRANSLATIONS
-    for key in keys:
-        if isinstance(value, dict) and key in value:
-            value = value[key]
-        else:
-            return default
-    return value if isinstance(value, str) else default
-
-
-def format_month_year(ref_date: str, lang: str = None) -> str:
+def format_month_year(ref_date: str, ctx: RenderContext) -> str:
     """Convert '2025-11' to 'November 2025' (or French equivalent)."""
-    if lang is None:
-        lang = LANG
     try:
         date = datetime.strptime(ref_date, "%Y-%m")
         month_en = date.strftime("%B")
         year = date.strftime("%Y")
-        month_translated = t(f"months.{month_en}", month_en)
+        month_translated = ctx.t(f"months.{month_en}", month_en)
         return f"{month_translated} {year}"
     except ValueError:
         return ref_date
 
 
-def generate_headline(data: Dict[str, Any]) -> str:
+def generate_headline(frame: SeriesFrame, ctx: RenderContext) -> str:
     """Generate a headline with key number first."""
-    latest = data["latest"]
-    metadata = data["metadata"]
-    period = format_month_year(latest["ref_date"])
-    series_name = metadata.get("series_name", "")
+    frame = SeriesFrame.of(frame)
+    latest = frame.latest
+    metadata = frame.metadata
+    period = format_month_year(latest["ref_date"], ctx)
+    series_name = frame.series_name
 
     mom_change = latest.get("mom_pct_change", 0)
     yoy_change = latest.get("yoy_pct_change", 0)
 
     if series_name == "Consumer Price Index":
-        if LANG == "fr":
+        if ctx.lang == "fr":
             if yoy_change > 0:
                 return f"Les prix à la consommation en hausse de {yoy_change:.1f} % d'une année à l'autre en {period}"
             elif yoy_change < 0:
@@ -552,7 +751,7 @@ def generate_headline(data: Dict[str, Any]) -> str:
                 return f"Consumer prices unchanged in {period}"
 
     elif series_name == "Retail Sales":
-        if LANG == "fr":
+        if ctx.lang == "fr":
             if mom_change > 0:
                 return f"Les ventes au détail en hausse de {mom_change:.1f} % en {period}"
             elif mom_change < 0:
@@ -568,7 +767,7 @@ def generate_headline(data: Dict[str, Any]) -> str:
                 return f"Retail sales unchanged in {period}"
 
     elif series_name == "Manufacturing Sales":
-        if LANG == "fr":
+        if ctx.lang == "fr":
             if mom_change > 0:
                 return f"Les ventes du secteur de la fabrication en hausse de {mom_change:.1f} % en {period}"
             elif mom_change < 0:
@@ -587,17 +786,18 @@ def generate_headline(data: Dict[str, Any]) -> str:
         title_short = metadata["table_title"].split(",")[0]
         if mom_change != 0:
             direction = "up" if mom_change > 0 else "down"
-            if LANG == "fr":
+            if ctx.lang == "fr":
                 direction = "en hausse de" if mom_change > 0 else "en baisse de"
                 return f"{title_short} {direction} {abs(mom_change):.1f} % en {period}"
             return f"{title_short} {direction} {abs(mom_change):.1f}% in {period}"
         return f"{title_short}: {period}"
 
 
-def generate_slug(data: Dict[str, Any]) -> str:
+def generate_slug(frame: SeriesFrame, ctx: RenderContext) -> str:
     """Generate a URL-friendly slug from the data."""
-    series_name = data["metadata"].get("series_name", "")
-    ref_date = data["latest"]["ref_date"]
+    frame = SeriesFrame.of(frame)
+    series_name = frame.series_name
+    ref_date = frame.latest["ref_date"]
 
     try:
         date = datetime.strptime(ref_date, "%Y-%m")
@@ -608,15 +808,15 @@ def generate_slug(data: Dict[str, Any]) -> str:
         year = ref_date
 
     if series_name == "Consumer Price Index":
-        if LANG == "fr":
+        if ctx.lang == "fr":
             return f"ipc-{month}-{year}"
         return f"cpi-{month}-{year}"
     elif series_name == "Retail Sales":
-        if LANG == "fr":
+        if ctx.lang == "fr":
             return f"ventes-detail-{month}-{year}"
         return f"retail-sales-{month}-{year}"
     elif series_name == "Manufacturing Sales":
-        if LANG == "fr":
+        if ctx.lang == "fr":
             return f"fabrication-{month}-{year}"
         return f"manufacturing-{month}-{year}"
     else:
@@ -624,10 +824,11 @@ def generate_slug(data: Dict[str, Any]) -> str:
         return f"{slug}-{month}-{year}"
 
 
-def generate_metric_value(data: Dict[str, Any]) -> str:
+def generate_metric_value(frame: SeriesFrame, ctx: RenderContext) -> str:
     """Generate the big metric value for the metric box."""
-    latest = data["latest"]
-    series_name = data["metadata"].get("series_name", "")
+    frame = SeriesFrame.of(frame)
+    latest = frame.latest
+    series_name = frame.series_name
     yoy_change = latest.get("yoy_pct_change", 0)
     mom_change = latest.get("mom_pct_change", 0)
 
@@ -641,44 +842,46 @@ def generate_metric_value(data: Dict[str, Any]) -> str:
         return f"{latest['value']:.1f}"
 
 
-def generate_metric_label(data: Dict[str, Any]) -> str:
+def generate_metric_label(frame: SeriesFrame, ctx: RenderContext) -> str:
     """Generate the label for the metric box."""
-    period = format_month_year(data["latest"]["ref_date"])
-    series_name = data["metadata"].get("series_name", "")
+    frame = SeriesFrame.of(frame)
+    period = format_month_year(frame.latest["ref_date"], ctx)
+    series_name = frame.series_name
 
     if series_name == "Consumer Price Index":
-        if LANG == "fr":
+        if ctx.lang == "fr":
             return f"Variation d'une année à l'autre de l'Indice des prix à la consommation, {period}"
         return f"Year-over-year change in Consumer Price Index, {period}"
     elif series_name == "Retail Sales":
-        if LANG == "fr":
+        if ctx.lang == "fr":
             return f"Variation mensuelle des ventes au détail, {period}"
         return f"Month-over-month change in retail sales, {period}"
     else:
         return f"{series_name}, {period}"
 
 
-def generate_lede(data: Dict[str, Any]) -> str:
+def generate_lede(frame: SeriesFrame, ctx: RenderContext) -> str:
     """Generate the opening paragraph."""
-    latest = data["latest"]
-    comparison = data["comparison"]
-    series_name = data["metadata"].get("series_name", "")
-    period = format_month_year(latest["ref_date"])
+    frame = SeriesFrame.of(frame)
+    latest = frame.latest
+    comparison = frame.comparison
+    series_name = frame.series_name
+    period = format_month_year(latest["ref_date"], ctx)
     value = latest["value"]
     yoy = latest.get("yoy_pct_change", 0)
     mom = latest.get("mom_pct_change", 0)
 
     if series_name == "Consumer Price Index":
-        if LANG == "fr":
+        if ctx.lang == "fr":
             lede = f"L'Indice des prix à la consommation (IPC) a augmenté de {yoy:.1f} % en {period} par rapport au même mois un an plus tôt."
             lede += f" L'indice s'établissait à {value:.1f}"
             if comparison.get("year_ago"):
                 year_ago_value = comparison["year_ago"]["value"]
-                year_ago_period = format_month_year(comparison["year_ago"]["ref_date"])
+                year_ago_period = format_month_year(comparison["year_ago"]["ref_date"], ctx)
                 lede += f", en hausse par rapport à {year_ago_value:.1f} en {year_ago_period}"
             lede += "."
             if mom is not None and mom != 0:
-                prev_period = format_month_year(comparison["previous_period"]["ref_date"])
+                prev_period = format_month_year(comparison["previous_period"]["ref_date"], ctx)
                 direction = "augmenté" if mom > 0 else "diminué"
                 lede += f" Sur une base mensuelle, les prix ont {direction} de {abs(mom):.1f} % par rapport à {prev_period}."
         else:
@@ -686,24 +889,24 @@ def generate_lede(data: Dict[str, Any]) -> str:
             lede += f" The index stood at {value:.1f}"
             if comparison.get("year_ago"):
                 year_ago_value = comparison["year_ago"]["value"]
-                year_ago_period = format_month_year(comparison["year_ago"]["ref_date"])
+                year_ago_period = format_month_year(comparison["year_ago"]["ref_date"], ctx)
                 lede += f", up from {year_ago_value:.1f} in {year_ago_period}"
             lede += "."
             if mom is not None and mom != 0:
-                prev_period = format_month_year(comparison["previous_period"]["ref_date"])
+                prev_period = format_month_year(comparison["previous_period"]["ref_date"], ctx)
                 direction = "increased" if mom > 0 else "decreased"
                 lede += f" On a monthly basis, prices {direction} {abs(mom):.1f}% from {prev_period}."
         return lede
 
     elif series_name == "Retail Sales":
         value_str = f"${value/1000:.1f} billion"
-        if LANG == "fr":
+        if ctx.lang == "fr":
             return f"Les ventes au détail ont totalisé {value_str} en {period}."
         return f"Retail sales totalled {value_str} in {period}."
 
     elif series_name == "Manufacturing Sales":
         value_str = f"${value/1000:.1f} billion"
-        if LANG == "fr":
+        if ctx.lang == "fr":
             direction = "augmenté" if mom > 0 else "diminué"
             lede = f"Les ventes du secteur de la fabrication ont {direction} de {abs(mom):.1f} % en {period}"
             lede += f", totalisant {value_str}."
@@ -721,54 +924,51 @@ def generate_lede(data: Dict[str, Any]) -> str:
     return ""
 
 
-def generate_highlights(data: Dict[str, Any]) -> List[str]:
+def generate_highlights(frame: SeriesFrame, ctx: RenderContext) -> List[str]:
     """Generate 3-5 highlight bullets."""
-    latest = data["latest"]
-    series_name = data["metadata"].get("series_name", "")
-    period = format_month_year(latest["ref_date"])
+    frame = SeriesFrame.of(frame)
+    latest = frame.latest
+    series_name = frame.series_name
+    period = format_month_year(latest["ref_date"], ctx)
     yoy = latest.get("yoy_pct_change", 0)
-    subseries = data.get("subseries")
-    provincial = data.get("provincial")
+    subseries = frame.subseries
+    provincial = frame.provincial
 
     highlights = []
 
     if series_name == "Consumer Price Index":
         # Main YoY finding
-        if LANG == "fr":
+        if ctx.lang == "fr":
             highlights.append(f"L'Indice des prix à la consommation a augmenté de {yoy:.1f} % d'une année à l'autre en {period}")
         else:
             highlights.append(f"The Consumer Price Index rose {yoy:.1f}% year over year in {period}")
 
         # Leading contributors from subseries
-        if subseries and "category" in subseries:
-            categories = subseries["category"]
-            yoy_changes = subseries.get("yoy_pct_change", [])
-            if categories and yoy_changes:
-                # Sort by yoy change descending
-                sorted_items = sorted(zip(categories, yoy_changes), key=lambda x: x[1] or 0, reverse=True)
-                if sorted_items:
-                    top_cat, top_yoy = sorted_items[0]
-                    if LANG == "fr":
+        if subseries is not None:
+            if subseries.categories and subseries.has("yoy_pct_change"):
+                # Two largest yoy changes
+                leaders = subseries.ranking("yoy_pct_change").top(2)
+                if leaders:
+                    top_cat, top_yoy = leaders[0]
+                    if ctx.lang == "fr":
                         highlights.append(f"Les coûts du {top_cat.lower()} ont augmenté de {top_yoy:.1f} %, la plus forte hausse")
                     else:
                         highlights.append(f"{top_cat} costs increased {top_yoy:.1f}%, the largest contributor to inflation")
 
-                    if len(sorted_items) > 1:
-                        second_cat, second_yoy = sorted_items[1]
-                        if LANG == "fr":
+                    if len(leaders) > 1:
+                        second_cat, second_yoy = leaders[1]
+                        if ctx.lang == "fr":
                             highlights.append(f"Les prix des {second_cat.lower()} ont augmenté de {second_yoy:.1f} % par rapport à {period.split()[0]} l'an dernier")
                         else:
                             highlights.append(f"{second_cat} prices rose {second_yoy:.1f}% compared to {period.split()[0]} last year")
 
         # Provincial highlight
-        if provincial and "category" in provincial:
-            categories = provincial["category"]
-            yoy_changes = provincial.get("yoy_pct_change", [])
-            if categories and yoy_changes:
-                sorted_items = sorted(zip(categories, yoy_changes), key=lambda x: x[1] or 0, reverse=True)
-                if sorted_items:
-                    top_prov, top_yoy = sorted_items[0]
-                    if LANG == "fr":
+        if provincial is not None:
+            if provincial.categories and provincial.has("yoy_pct_change"):
+                leaders = provincial.ranking("yoy_pct_change").top(1)
+                if leaders:
+                    top_prov, top_yoy = leaders[0]
+                    if ctx.lang == "fr":
                         highlights.append(f"{top_prov} a enregistré la hausse la plus élevée à {top_yoy:.1f} %")
                     else:
                         highlights.append(f"{top_prov} recorded the highest increase at {top_yoy:.1f}%")
@@ -776,25 +976,88 @@ def generate_highlights(data: Dict[str, Any]) -> List[str]:
     return highlights[:5]
 
 
-def generate_trend_chart_js(data: Dict[str, Any]) -> str:
-    """Generate Observable Plot code for the trend chart."""
-    time_series = data["time_series"]
-    series_name = data["metadata"].get("series_name", "")
+# Chart data lives in one file per article under docs/data/charts/, shared by
+# the EN and FR pages and loaded with FileAttachment, instead of being pasted
+# into each page as JS literals.
+CHART_DATA_DIR = Path("data") / "charts"
 
-    # Get last 6 months for recent trend
-    recent = time_series[-6:] if len(time_series) >= 6 else time_series
 
-    if series_name == "Consumer Price Index":
-        data_points = []
-        for item in recent:
-            ref_date = item["ref_date"]
-            yoy = item.get("yoy_pct_change")
-            if yoy is not None:
-                data_points.append(f'  {{date: new Date("{ref_date}"), rate: {yoy:.1f}}}')
+def _trend_points(frame: SeriesFrame) -> Optional[List[Dict[str, Any]]]:
+    """Points of the trend chart, or None if the series has no trend chart."""
+    if frame.series_name != "Consumer Price Index":
+        return None
+    # Last 6 months for recent trend
+    points = []
+    for i in frame.tail(6):
+        yoy = frame.period(i).yoy_pct_change
+        if yoy is not None:
+            points.append({"date": frame.ref_dates[i], "rate": round(yoy, 1)})
+    return points
+
+
+def _component_points(frame: SeriesFrame) -> Optional[List[Dict[str, Any]]]:
+    """Bars of the component chart, or None if there is no component chart."""
+    subseries = frame.subseries
+    if subseries is None or not subseries.categories or not subseries.has("yoy_pct_change"):
+        return None
+    return [{"name": cat, "change": round(yoy, 1)}
+            for cat, yoy in subseries.pairs("yoy_pct_change") if yoy is not None]
+
+
+_NAME_SPLIT_RE = re.compile(r"[^a-z0-9]+")
+
+
+def chart_data_name(frame: SeriesFrame) -> str:
+    """
+    File name of an article's chart data: its table number, latest period and
+    series name, the same things that identify the article's pages. Series of
+    one table released for the same period get their own files, and a data
+    revision rewrites its article's file instead of leaving the old one behind.
+    """
+    frame = SeriesFrame.of(frame)
+    series = _NAME_SPLIT_RE.sub("-", frame.series_name.lower()).strip("-") or "series"
+    return f"{frame.metadata['table_number']}_{frame.latest['ref_date']}_{series}.json"
+
+
+def chart_data_attachment(frame: SeriesFrame) -> str:
+    """FileAttachment path of the chart data from a page at <lang>/<slug>/index.md."""
+    return f"../../{CHART_DATA_DIR.as_posix()}/{chart_data_name(frame)}"
+
+
+def generate_chart_data(frame: SeriesFrame) -> Dict[str, List[Dict[str, Any]]]:
+    """
+    Data for every chart of an article, keyed by chart ("trend", "components").
+    Language-independent, so both language pages load the same file.
+    """
+    frame = SeriesFrame.of(frame)
+    charts = {"trend": _trend_points(frame), "components": _component_points(frame)}
+    return {name: points for name, points in charts.items() if points is not None}
+
+
+_ATTACHMENT_RE = re.compile(r'FileAttachment\("([^"]+)"\)')
+
 
-        data_js = ",\n".join(data_points)
+def article_attachments(markdown_path: str) -> List[str]:
+    """Files a generated page loads with FileAttachment, as paths from the cwd."""
+    page = Path(markdown_path)
+    found = _ATTACHMENT_RE.findall(page.read_text(encoding="utf-8"))
+    return [os.path.normpath(page.parent / rel) for rel in dict.fromkeys(found)]
 
-        if LANG == "fr":
+
+def generate_trend_chart_js(frame: SeriesFrame, ctx: RenderContext,
+                            chart_data: Optional[Dict[str, Any]] = None) -> str:
+    """
+    Generate Observable Plot code for the trend chart. Pass the article's
+    generate_chart_data() result to avoid building it again.
+    """
+    frame = SeriesFrame.of(frame)
+    if chart_data is None:
+        chart_data = generate_chart_data(frame)
+
+    if "trend" in chart_data:
+        attachment = chart_data_attachment(frame)
+
+        if ctx.lang == "fr":
             title = "Taux d'inflation d'une année à l'autre (%)"
             y_label = "Pourcentage"
         else:
@@ -804,9 +1067,8 @@ def generate_trend_chart_js(data: Dict[str, Any]) -> str:
         return f'''```js
 import * as Plot from "npm:@observablehq/plot";
 
-const inflationData = [
-{data_js}
-];
+const inflationData = (await FileAttachment("{attachment}").json()).trend
+  .map(d => ({{date: new Date(d.date), rate: d.rate}}));
 
 display(Plot.plot({{
   title: "{title}",
@@ -826,27 +1088,20 @@ display(Plot.plot({{
     return ""
 
 
-def generate_component_chart_js(data: Dict[str, Any]) -> str:
-    """Generate Observable Plot code for the component breakdown chart."""
-    subseries = data.get("subseries")
-    if not subseries or "category" not in subseries:
-        return ""
-
-    categories = subseries["category"]
-    yoy_changes = subseries.get("yoy_pct_change", [])
-
-    if not categories or not yoy_changes:
+def generate_component_chart_js(frame: SeriesFrame, ctx: RenderContext,
+                                chart_data: Optional[Dict[str, Any]] = None) -> str:
+    """
+    Generate Observable Plot code for the component breakdown chart. Pass the
+    article's generate_chart_data() result to avoid building it again.
+    """
+    frame = SeriesFrame.of(frame)
+    if chart_data is None:
+        chart_data = generate_chart_data(frame)
+    if "components" not in chart_data:
         return ""
+    attachment = chart_data_attachment(frame)
 
-    # Build data array
-    data_points = []
-    for cat, yoy in zip(categories, yoy_changes):
-        if yoy is not None:
-            data_points.append(f'  {{name: "{cat}", change: {yoy:.1f}}}')
-
-    data_js = ",\n".join(data_points)
-
-    if LANG == "fr":
+    if ctx.lang == "fr":
         title = "Variation annuelle selon la composante (%)"
         x_label = "Variation en pourcentage"
     else:
@@ -854,9 +1109,7 @@ def generate_component_chart_js(data: Dict[str, Any]) -> str:
         x_label = "Percent change"
 
     return f'''```js
-const components = [
-{data_js}
-];
+const components = (await FileAttachment("{attachment}").json()).components;
 
 display(Plot.plot({{
   title: "{title}",
@@ -885,22 +1138,19 @@ display(Plot.plot({{
 ```'''
 
 
-def generate_provincial_table(data: Dict[str, Any]) -> str:
+def generate_provincial_table(frame: SeriesFrame, ctx: RenderContext) -> str:
     """Generate markdown table for provincial data."""
-    provincial = data.get("provincial")
-    if not provincial or "category" not in provincial:
+    provincial = SeriesFrame.of(frame).provincial
+    if provincial is None:
         return ""
 
-    categories = provincial["category"]
-    yoy_changes = provincial.get("yoy_pct_change", [])
-
-    if not categories or not yoy_changes:
+    if not provincial.categories or not provincial.has("yoy_pct_change"):
         return ""
 
     # Sort by yoy descending
-    sorted_items = sorted(zip(categories, yoy_changes), key=lambda x: x[1] or 0, reverse=True)
+    sorted_items = provincial.ranking("yoy_pct_change").items()
 
-    if LANG == "fr":
+    if ctx.lang == "fr":
         header = "| Province | Variation annuelle |"
     else:
         header = "| Province | Year-over-year change |"
@@ -915,12 +1165,12 @@ def generate_provincial_table(data: Dict[str, Any]) -> str:
     return "\n".join([header, separator] + rows)
 
 
-def generate_note_to_readers(data: Dict[str, Any]) -> str:
+def generate_note_to_readers(frame: SeriesFrame, ctx: RenderContext) -> str:
     """Generate the note to readers section."""
-    series_name = data["metadata"].get("series_name", "")
+    series_name = SeriesFrame.of(frame).series_name
 
     if series_name == "Consumer Price Index":
-        if LANG == "fr":
+        if ctx.lang == "fr":
             p1 = "L'Indice des prix à la consommation mesure le taux de variation des prix que subissent les consommateurs canadiens. Il est calculé en comparant le coût d'un panier fixe de biens et de services achetés par les consommateurs au fil du temps."
             p2 = "L'IPC n'est pas désaisonnalisé. Les variations d'un mois à l'autre peuvent refléter des tendances saisonnières en plus des tendances de prix sous-jacentes."
         else:
@@ -929,12 +1179,12 @@ def generate_note_to_readers(data: Dict[str, Any]) -> str:
         return f"{p1}\n\n{p2}"
 
     elif series_name == "Retail Sales":
-        if LANG == "fr":
+        if ctx.lang == "fr":
             return "Les ventes au détail représentent la valeur de toutes les ventes effectuées par l'intermédiaire des canaux de vente au détail. Les données sont désaisonnalisées."
         return "Retail sales represent the value of all sales made through retail channels. Data are seasonally adjusted."
 
     elif series_name == "Manufacturing Sales":
-        if LANG == "fr":
+        if ctx.lang == "fr":
             p1 = "L'enquête mensuelle sur les industries manufacturières mesure les ventes de biens fabriqués, les stocks et les commandes dans le secteur de la fabrication."
             p2 = "Les données sont désaisonnalisées pour tenir compte des variations saisonnières régulières."
             return f"{p1}\n\n{p2}"
@@ -946,29 +1196,27 @@ def generate_note_to_readers(data: Dict[str, Any]) -> str:
     return ""
 
 
-def generate_component_narrative(data: Dict[str, Any]) -> str:
+def generate_component_narrative(frame: SeriesFrame, ctx: RenderContext) -> str:
     """Generate narrative for the component breakdown section."""
-    subseries = data.get("subseries")
-    series_name = data["metadata"].get("series_name", "")
+    frame = SeriesFrame.of(frame)
+    subseries = frame.subseries
+    series_name = frame.series_name
 
-    if not subseries or "category" not in subseries:
+    if subseries is None:
         return ""
 
-    categories = subseries["category"]
-    yoy_changes = subseries.get("yoy_pct_change", [])
-
-    if not categories or not yoy_changes or series_name != "Consumer Price Index":
+    if not subseries.categories or not subseries.has("yoy_pct_change") or series_name != "Consumer Price Index":
         return ""
 
     # Find top contributors
-    sorted_items = sorted(zip(categories, yoy_changes), key=lambda x: x[1] or 0, reverse=True)
+    ranking = subseries.ranking("yoy_pct_change")
 
-    if len(sorted_items) < 2:
+    if len(ranking) < 2:
         return ""
 
-    top_cat, top_yoy = sorted_items[0]
+    top_cat, top_yoy = ranking.top(1)[0]
 
-    if LANG == "fr":
+    if ctx.lang == "fr":
         narrative = f"Parmi les huit principales composantes de l'IPC, les prix du {top_cat.lower()} ont affiché la plus forte hausse annuelle, soit {top_yoy:.1f} %."
         narrative += " Les coûts hypothécaires et les loyers ont continué d'exercer une pression à la hausse sur cette catégorie."
     else:
@@ -976,10 +1224,10 @@ def generate_component_narrative(data: Dict[str, Any]) -> str:
         narrative += " Mortgage interest costs and rent continued to put upward pressure on this category."
 
     # Add food narrative if available
-    food_items = [(cat, yoy) for cat, yoy in sorted_items if "food" in cat.lower() or "aliment" in cat.lower()]
+    food_items = [(cat, yoy) for cat, yoy in ranking.items() if "food" in cat.lower() or "aliment" in cat.lower()]
     if food_items:
         food_cat, food_yoy = food_items[0]
-        if LANG == "fr":
+        if ctx.lang == "fr":
             narrative += f"\n\nLes prix des {food_cat.lower()} ont augmenté de {food_yoy:.1f} %."
         else:
             narrative += f"\n\n{food_cat} prices rose {food_yoy:.1f}%."
@@ -987,36 +1235,61 @@ def generate_component_narrative(data: Dict[str, Any]) -> str:
     return narrative
 
 
-def generate_provincial_narrative(data: Dict[str, Any]) -> str:
+def generate_provincial_narrative(frame: SeriesFrame, ctx: RenderContext) -> str:
     """Generate narrative for provincial variation section."""
-    provincial = data.get("provincial")
+    provincial = SeriesFrame.of(frame).provincial
 
-    if not provincial or "category" not in provincial:
+    if provincial is None:
         return ""
 
-    categories = provincial["category"]
-    yoy_changes = provincial.get("yoy_pct_change", [])
-
-    if not categories or not yoy_changes:
+    if not provincial.categories or not provincial.has("yoy_pct_change"):
         return ""
 
-    sorted_items = sorted(zip(categories, yoy_changes), key=lambda x: x[1] or 0, reverse=True)
+    ranking = provincial.ranking("yoy_pct_change")
 
-    if len(sorted_items) < 2:
+    if len(ranking) < 2:
         return ""
 
-    top_prov, top_yoy = sorted_items[0]
-    bottom_prov, bottom_yoy = sorted_items[-1]
+    top_prov, top_yoy = ranking.top(1)[0]
+    bottom_prov, bottom_yoy = ranking.bottom(1)[0]
 
-    if LANG == "fr":
+    if ctx.lang == "fr":
         return f"Les hausses de prix ont varié d'une province à l'autre. {top_prov} a enregistré la hausse annuelle la plus élevée, soit {top_yoy:.1f} %, en raison de la hausse des coûts du logement et du transport. {bottom_prov} a affiché la plus faible hausse, soit {bottom_yoy:.1f} %."
     else:
         return f"Price increases varied across provinces and territories. {top_prov} recorded the highest year-over-year increase at {top_yoy:.1f}%, driven by rising shelter and transportation costs. {bottom_prov} showed the lowest increase at {bottom_yoy:.1f}%."
 
 
+# Files an article depends on besides its data; their hashes stand in for
+# the generator version in render cache keys
+RENDER_INPUTS = (
+    Path(__file__),
+    Path(json_backend.__file__),
+    Path(series_frame.__file__),
+    Path(translations.__file__),
+    translations.TRANSLATIONS_PATH,
+)
+
+
+def render_cache_key(cache: RenderCache, data_digest: str, output_dir: str, lang: str,
+                     strict: bool, skip_validation: bool, ref_date: Optional[str]) -> str:
+    """Render cache key for one article of a data file (see render_cache)."""
+    return cache.key("observable", data_digest, RENDER_INPUTS, {
+        "output_dir": os.path.abspath(output_dir),
+        "lang": lang,
+        "ref_date": ref_date,
+        "strict": strict,
+        "skip_validation": skip_validation,
+        # Articles are stamped with the day they were rendered
+        "release_date": datetime.now().strftime("%Y-%m-%d"),
+        # Backends may format the chart data JSON's numbers differently
+        "json_backend": json_backend.BACKEND,
+    })
+
+
 def generate_article(data_path: str, output_dir: str, lang: str = "en",
                      strict: bool = False, skip_validation: bool = False,
-                     ref_date: Optional[str] = None) -> str:
+                     ref_date: Optional[str] = None,
+                     cache: Optional[RenderCache] = None) -> str:
     """
     Generate a complete Observable markdown article from data JSON.
 
@@ -1027,6 +1300,7 @@ def generate_article(data_path: str, output_dir: str, lang: str = "en",
         strict: Treat validation warnings as errors
         skip_validation: Skip validation (not recommended)
         ref_date: Optional reference date to generate article for (e.g., "2025-10")
+        cache: Optional render cache; on a hit the data is not even parsed
 
     Returns:
         Path to the generated article
@@ -1034,20 +1308,76 @@ def generate_article(data_path: str, output_dir: str, lang: str = "en",
     Raises:
         ValidationError: If data validation fails
     """
-    load_translations(lang)
-
     # Load data
-    with open(data_path, "r") as f:
-        data = json.load(f)
+    with spans.span("load"):
+        with open(data_path, "rb") as f:
+            raw = f.read()
+
+    if cache is not None:
+        key = render_cache_key(cache, digest_bytes(raw), output_dir, lang,
+                               strict, skip_validation, ref_date)
+        with spans.span("cache"):
+            entry = cache.fetch(key)
+        if entry is not None:
+            state = "restored from cache" if entry.get("restored") else "unchanged (cached)"
+            print(f"Observable article {state}: {entry['output']}")
+            return entry["output"]
+
+    with spans.span("parse"):
+        data = json_backend.loads(raw)
+
+    with spans.span("article"):
+        output_path = generate_article_from_data(
+            data, output_dir, lang=lang, strict=strict,
+            skip_validation=skip_validation, ref_date=ref_date,
+            source=data_path
+        )
+    if cache is not None:
+        cache.put(key, output_path, attachments=article_attachments(output_path))
+    return output_path
+
+
+def generate_article_from_data(data: Dict[str, Any], output_dir: str, lang: str = "en",
+                               strict: bool = False, skip_validation: bool = False,
+                               ref_date: Optional[str] = None,
+                               source: str = "<data>",
+                               frame: Optional[SeriesFrame] = None) -> str:
+    """
+    Generate a complete Observable markdown article from already-loaded data.
+
+    Same as generate_article(), but lets callers that render several languages
+    from one data file parse the JSON only once. The data dict is not mutated.
+    Passing the same frame for every language also shares its memoized
+    rankings; it must be built from data after any rebase.
+
+    Args:
+        data: The loaded JSON data from R script
+        output_dir: Output directory for Observable site
+        lang: Language for article generation ('en' or 'fr')
+        strict: Treat validation warnings as errors
+        skip_validation: Skip validation (not recommended)
+        ref_date: Optional reference date to generate article for (e.g., "2025-10")
+        source: Label for the data in log messages (usually its path)
+        frame: Optional prebuilt SeriesFrame of data (only valid without ref_date)
+
+    Returns:
+        Path to the generated article
+
+    Raises:
+        ValidationError: If data validation fails
+    """
+    ctx = RenderContext(lang)
 
     # Rebase to historical period if requested
     if ref_date:
-        data = rebase_data_to_period(data, ref_date)
+        with spans.span("rebase"):
+            data = rebase_data_to_period(data, ref_date)
 
     # Run pre-generation validation
     if not skip_validation:
-        logger.info(f"Validating data from {data_path}...")
-        validation = validate_data(data, strict=strict)
+        logger.info(f"Validating data from {source}...")
+        with spans.span("validate"):
+            validation = validate_data(data, strict=strict)
         logger.info(validation.summary())
 
         if not validation.is_valid:
@@ -1056,24 +1386,42 @@ def generate_article(data_path: str, output_dir: str, lang: str = "en",
                 "Use --skip-validation to bypass (not recommended)"
             )
 
-    # Generate content
-    headline = generate_headline(data)
-    slug = generate_slug(data)
-    metric_value = generate_metric_value(data)
-    metric_label = generate_metric_label(data)
-    lede = generate_lede(data)
-    highlights = generate_highlights(data)
-    trend_chart = generate_trend_chart_js(data)
-    component_chart = generate_component_chart_js(data)
-    provincial_table = generate_provincial_table(data)
-    note = generate_note_to_readers(data)
-    component_narrative = generate_component_narrative(data)
-    provincial_narrative = generate_provincial_narrative(data)
+    # Build the typed view once; every generator below reads from it
+    if frame is None or ref_date:
+        with spans.span("frame"):
+            frame = SeriesFrame(data)
+
+    # Generate content, one timing span per section
+    with spans.span("section.headline"):
+        headline = generate_headline(frame, ctx)
+    with spans.span("section.slug"):
+        slug = generate_slug(frame, ctx)
+    with spans.span("section.metric"):
+        metric_value = generate_metric_value(frame, ctx)
+        metric_label = generate_metric_label(frame, ctx)
+    with spans.span("section.lede"):
+        lede = generate_lede(frame, ctx)
+    with spans.span("section.highlights"):
+        highlights = generate_highlights(frame, ctx)
+    with spans.span("section.chart_data"):
+        chart_data = generate_chart_data(frame)
+    with spans.span("section.trend_chart"):
+        trend_chart = generate_trend_chart_js(frame, ctx, chart_data)
+    with spans.span("section.component_chart"):
+        component_chart = generate_component_chart_js(frame, ctx, chart_data)
+    with spans.span("section.provincial_table"):
+        provincial_table = generate_provincial_table(frame, ctx)
+    with spans.span("section.note"):
+        note = generate_note_to_readers(frame, ctx)
+    with spans.span("section.component_narrative"):
+        component_narrative = generate_component_narrative(frame, ctx)
+    with spans.span("section.provincial_narrative"):
+        provincial_narrative = generate_provincial_narrative(frame, ctx)
 
     # Get metadata
-    table_number = data["metadata"]["table_number"]
-    period = format_month_year(data["latest"]["ref_date"])
-    series_name = data["metadata"].get("series_name", "")
+    table_number = frame.metadata["table_number"]
+    period = format_month_year(frame.latest["ref_date"], ctx)
+    series_name = frame.series_name
     release_date = datetime.now().strftime("%Y-%m-%d")
 
     # Build section titles
@@ -1177,7 +1525,8 @@ title: {headline}
 
     # Run self-review and attempt fixes
     logger.info("Running self-review...")
-    md, review_result = review_and_fix_article(md, data, lang)
+    with spans.span("review"):
+        md, review_result = review_and_fix_article(md, frame, lang)
     logger.info(review_result.summary())
 
     if review_result.issues_fixed:
@@ -1192,10 +1541,13 @@ title: {headline}
 
     # Write output
     output_path = Path(output_dir) / lang / slug / "index.md"
-    output_path.parent.mkdir(parents=True, exist_ok=True)
-
-    with open(output_path, "w") as f:
-        f.write(md)
+    with spans.span("write"):
+        # Identical content keeps its mtime so Observable does not rebuild the page
+        write_if_changed(output_path, md)
+        if chart_data:
+            # The other language's page usually wrote these same bytes already
+            write_if_changed(Path(output_dir) / CHART_DATA_DIR / chart_data_name(frame),
+                             json_backend.dumps(chart_data))
 
     print(f"Observable article generated: {output_path}")
     print(f"Headline: {headline}")
@@ -1205,30 +1557,390 @@ title: {headline}
     return str(output_path)
 
 
+# =============================================================================
+# BATCH GENERATION
+# =============================================================================
+
+BATCH_LANGS = ("en", "fr")
+
+
+class BatchItemResult:
+    """Outcome of generating one (data file, language) article in batch mode."""
+    def __init__(self, data_path: str, lang: str):
+        self.data_path = data_path
+        self.lang = lang
+        self.output_path: Optional[str] = None
+        self.error: Optional[str] = None
+        self.cached = False
+        self.spans: List[spans.Record] = []
+
+    @property
+    def ok(self) -> bool:
+        return self.error is None
+
+    def summary(self) -> str:
+        name = Path(self.data_path).name
+        if self.ok:
+            cached = " (cached)" if self.cached else ""
+            return f"OK    {name} [{self.lang}] -> {self.output_path}{cached}"
+        return f"FAIL  {name} [{self.lang}]: {self.error}"
+
+
+def find_data_files(source: str) -> List[str]:
+    """
+    Resolve a batch source to a sorted list of data files.
+
+    A directory is searched for data_*.json; anything else is treated as a
+    glob pattern (e.g. "output/data_18_*.json").
+    """
+    if os.path.isdir(source):
+        pattern = os.path.join(source, "data_*.json")
+    else:
+        pattern = source
+    return sorted(p for p in glob.glob(pattern) if os.path.isfile(p))
+
+
+def _generate_batch_item(data_path: str, output_dir: str, langs: List[str],
+                         strict: bool, skip_validation: bool,
+                         ref_date: Optional[str],
+                         timed: bool = False,
+                         use_cache: bool = False) -> List[BatchItemResult]:
+    """
+    Worker: parse one data file and render it in every requested language.
+
+    With timed=True, stage timing spans are recorded on the results. Spans
+    shared by every language (load, rebase, frame) go on the first item only,
+    so aggregating over all items counts them once. With use_cache=True,
+    languages found in the render cache are not rendered, and the data is
+    not parsed at all when every language is a hit.
+    """
+    results = [BatchItemResult(data_path, lang) for lang in langs]
+    cache = default_cache() if use_cache else None
+    with spans.collecting(source=data_path) if timed else contextlib.nullcontext() as collector:
+        _render_batch_item(results, data_path, output_dir, strict,
+                           skip_validation, ref_date, collector, cache)
+
+    if collector is not None:
+        for item in results:
+            item.spans = [r for r in collector.records if r.get("lang") == item.lang]
+        if results:
+            results[0].spans[:0] = [r for r in collector.records if "lang" not in r]
+    return results
+
+
+def _render_batch_item(results: List[BatchItemResult], data_path: str, output_dir: str,
+                       strict: bool, skip_validation: bool, ref_date: Optional[str],
+                       collector: Optional[spans.SpanCollector],
+                       cache: Optional[RenderCache]) -> None:
+    try:
+        with spans.span("load"):
+            with open(data_path, "rb") as f:
+                raw = f.read()
+    except OSError as e:
+        for item in results:
+            item.error = f"could not load data: {e}"
+        return
+
+    keys: Dict[str, str] = {}
+    pending = results
+    if cache is not None:
+        data_digest = digest_bytes(raw)
+        pending = []
+        for item in results:
+            keys[item.lang] = render_cache_key(cache, data_digest, output_dir, item.lang,
+                                               strict, skip_validation, ref_date)
+            with spans.span("cache"):
+                entry = cache.fetch(keys[item.lang])
+            if entry is None:
+                pending.append(item)
+            else:
+                item.output_path = entry["output"]
+                item.cached = True
+        if not pending:
+            return
+
+    try:
+        with spans.span("parse"):
+            data = json_backend.loads(raw)
+    except ValueError as e:
+        for item in pending:
+            item.error = f"could not load data: {e}"
+        return
+
+    # Rebase and build the frame once so every language shares its rankings
+    try:
+        if ref_date:
+            with spans.span("rebase"):
+                data = rebase_data_to_period(data, ref_date)
+        with spans.span("frame"):
+            frame = SeriesFrame(data)
+    except Exception as e:
+        for item in pending:
+            item.error = f"{type(e).__name__}: {e}"
+        return
+
+    for item in pending:
+        try:
+            with collector.bound(lang=item.lang) if collector else contextlib.nullcontext():
+                with spans.span("article"):
+                    item.output_path = generate_article_from_data(
+                        data, output_dir, lang=item.lang, strict=strict,
+                        skip_validation=skip_validation, source=data_path,
+                        frame=frame
+                    )
+            if cache is not None:
+                cache.put(keys[item.lang], item.output_path,
+                          attachments=article_attachments(item.output_path))
+        except Exception as e:
+            item.error = f"{type(e).__name__}: {e}"
+
+
+def generate_batch(data_paths: List[str], output_dir: str,
+                   langs: List[str] = BATCH_LANGS, workers: Optional[int] = None,
+                   strict: bool = False, skip_validation: bool = False,
+                   ref_date: Optional[str] = None,
+                   executor: str = "process",
+                   timed: bool = False,
+                   use_cache: bool = False) -> List[BatchItemResult]:
+    """
+    Generate articles for many data files over a process or thread pool.
+
+    Each data file is loaded once and rendered in every language in `langs`.
+    A failure in one file or language is recorded in its BatchItemResult and
+    does not stop the rest of the run.
+
+    Args:
+        data_paths: Data JSON files to render
+        output_dir: Output directory for Observable site
+        langs: Languages to render for each file
+        workers: Pool size (default: CPU count; 1 runs in-process)
+        strict: Treat validation warnings as errors
+        skip_validation: Skip validation (not recommended)
+        ref_date: Optional reference date applied to every file
+        executor: "process" or "thread"; rendering keeps no module-level
+            state, so threads can share one warm interpreter and its caches
+        timed: Record stage timing spans on each result and print a
+            per-stage summary across the whole batch
+        use_cache: Reuse unchanged articles from the render cache
+
+    Returns:
+        One BatchItemResult per (data file, language), in input order
+    """
+    langs = list(langs)
+    workers = workers or os.cpu_count() or 1
+    start = time.perf_counter()
+    by_path: Dict[str, List[BatchItemResult]] = {}
+
+    if workers == 1 or len(data_paths) <= 1:
+        for data_path in data_paths:
+            by_path[data_path] = _generate_batch_item(
+                data_path, output_dir, langs, strict, skip_validation, ref_date,
+                timed, use_cache
+            )
+            for item in by_path[data_path]:
+                print(item.summary())
+    else:
+        pool_class = ProcessPoolExecutor if executor == "process" else ThreadPoolExecutor
+        with pool_class(max_workers=min(workers, len(data_paths))) as pool:
+            futures = {
+                pool.submit(_generate_batch_item, data_path, output_dir, langs,
+                            strict, skip_validation, ref_date, timed, use_cache): data_path
+                for data_path in data_paths
+            }
+            for future in as_completed(futures):
+                data_path = futures[future]
+                try:
+                    by_path[data_path] = future.result()
+                except Exception as e:
+                    # Worker died (e.g. process killed); mark all its languages failed
+                    by_path[data_path] = [BatchItemResult(data_path, lang) for lang in langs]
+                    for item in by_path[data_path]:
+                        item.error = f"worker failed: {type(e).__name__}: {e}"
+                for item in by_path[data_path]:
+                    print(item.summary())
+
+    elapsed = time.perf_counter() - start
+    results = [item for data_path in data_paths for item in by_path[data_path]]
+    succeeded = sum(1 for item in results if item.ok)
+    cached = sum(1 for item in results if item.cached)
+    rate = len(results) / elapsed if elapsed > 0 else 0.0
+
+    print()
+    print(f"Batch complete: {succeeded}/{len(results)} articles from "
+          f"{len(data_paths)} data file(s) in {elapsed:.2f}s "
+          f"({rate:.1f} articles/s, {workers} {executor} worker(s))")
+    if use_cache:
+        print(f"Render cache: {cached} unchanged, {len(results) - cached} rendered")
+
+    if timed:
+        print()
+        spans.print_span_table(r for item in results for r in item.spans)
+
+    return results
+
+
+# =============================================================================
+# MULTI-FILE VALIDATION
+# =============================================================================
+
+class FileValidation:
+    """Outcome of validating one data file in validate-many mode."""
+    def __init__(self, data_path: str):
+        self.data_path = data_path
+        self.result: Optional[ValidationResult] = None
+        self.error: Optional[str] = None
+
+    @property
+    def ok(self) -> bool:
+        return self.error is None and self.result is not None and self.result.is_valid
+
+    @property
+    def first_issue(self) -> str:
+        if self.error:
+            return self.error
+        issues = self.result.errors or self.result.warnings
+        return issues[0] if issues else ""
+
+
+def _validate_file(data_path: str, strict: bool) -> FileValidation:
+    """Worker: load and validate one data file without logging each issue."""
+    item = FileValidation(data_path)
+    try:
+        data = json_backend.load(data_path)
+    except (OSError, ValueError) as e:
+        item.error = f"could not load data: {e}"
+        return item
+    try:
+        item.result = validate_data(data, strict=strict, log=False)
+    except Exception as e:
+        item.error = f"{type(e).__name__}: {e}"
+    return item
+
+
+def print_validation_table(items: List[FileValidation], width: int = 72) -> None:
+    """Print one compact row per file: status, error/warning counts, first issue."""
+    name_width = max([len("File")] + [len(Path(item.data_path).name) for item in items])
+    print(f"{'File':<{name_width}}  Status  Errors  Warnings  First issue")
+    for item in items:
+        errors = len(item.result.errors) if item.result else 1
+        warnings = len(item.result.warnings) if item.result else 0
+        issue = item.first_issue
+        if len(issue) > width:
+            issue = issue[:width - 3] + "..."
+        status = "OK" if item.ok else "FAIL"
+        print(f"{Path(item.data_path).name:<{name_width}}  {status:<6}  {errors:>6}  {warnings:>8}  {issue}")
+
+
+def validate_many(data_paths: List[str], strict: bool = False,
+                  workers: Optional[int] = None,
+                  executor: str = "process") -> List[FileValidation]:
+    """
+    Validate many data files in parallel and print a summary table.
+
+    Args:
+        data_paths: Data JSON files to validate
+        strict: Treat validation warnings as errors
+        workers: Pool size (default: CPU count; 1 runs in-process)
+        executor: "process" or "thread"
+
+    Returns:
+        One FileValidation per data file, in input order
+    """
+    workers = workers or os.cpu_count() or 1
+    start = time.perf_counter()
+
+    if workers == 1 or len(data_paths) <= 1:
+        items = [_validate_file(data_path, strict) for data_path in data_paths]
+    else:
+        pool_class = ProcessPoolExecutor if executor == "process" else ThreadPoolExecutor
+        with pool_class(max_workers=min(workers, len(data_paths))) as pool:
+            items = list(pool.map(_validate_file, data_paths, [strict] * len(data_paths)))
+
+    elapsed = time.perf_counter() - start
+    print_validation_table(items)
+    passed = sum(1 for item in items if item.ok)
+    print()
+    print(f"Validated {len(items)} data file(s) in {elapsed:.2f}s: "
+          f"{passed} passed, {len(items) - passed} failed")
+
+    return items
+
+
 if __name__ == "__main__":
     parser = argparse.ArgumentParser(
         description="Generate Observable markdown articles from Statistics Canada data"
     )
-    parser.add_argument("data_path", help="Path to the data JSON file")
+    parser.add_argument("data_path",
+                        help="Path to the data JSON file (with --batch or --validate-many: "
+                             "a directory or glob of data_*.json)")
     parser.add_argument("--output-dir", default="docs",
                         help="Output directory for Observable site (default: docs)")
-    parser.add_argument("--lang", choices=["en", "fr"], default="en",
-                        help="Language for article generation (default: en)")
+    parser.add_argument("--lang", choices=["en", "fr"], default=None,
+                        help="Language for article generation (default: en; both en and fr with --batch)")
     parser.add_argument("--strict", action="store_true",
                         help="Treat validation warnings as errors")
     parser.add_argument("--skip-validation", action="store_true",
                         help="Skip data validation (not recommended)")
     parser.add_argument("--validate-only", action="store_true",
                         help="Only validate data, don't generate article")
+    parser.add_argument("--validate-many", action="store_true",
+                        help="Validate every data file matched by data_path in parallel and print a summary table")
     parser.add_argument("--ref-date", type=str, default=None,
                         help="Reference date for article (e.g., 2025-10). Defaults to latest available.")
+    parser.add_argument("--batch", action="store_true",
+                        help="Generate articles for every data file matched by data_path")
+    parser.add_argument("--workers", type=int, default=None,
+                        help="Workers for --batch and --validate-many (default: CPU count)")
+    parser.add_argument("--executor", choices=["process", "thread"], default="process",
+                        help="Pool type for --batch and --validate-many workers (default: process)")
+    parser.add_argument("--no-cache", action="store_true",
+                        help="Render every article even if its inputs are unchanged")
+    parser.add_argument("--spans", metavar="FILE", default=None,
+                        help="Time each stage, append the spans to FILE as JSON lines "
+                             "('-' for stdout) and print a per-stage summary")
+    parser.add_argument("--profile", metavar="FILE", default=None,
+                        help="Run under cProfile and save pstats output to FILE "
+                             "(--batch then runs in-process)")
 
     args = parser.parse_args()
 
+    # Batch mode
+    if args.batch:
+        data_paths = find_data_files(args.data_path)
+        if not data_paths:
+            logger.error(f"No data files found for: {args.data_path}")
+            sys.exit(1)
+        with spans.profiled(args.profile):
+            results = generate_batch(
+                data_paths,
+                args.output_dir,
+                langs=[args.lang] if args.lang else BATCH_LANGS,
+                # cProfile only sees the thread it runs in
+                workers=1 if args.profile else args.workers,
+                strict=args.strict,
+                skip_validation=args.skip_validation,
+                ref_date=args.ref_date,
+                executor=args.executor,
+                timed=bool(args.spans),
+                use_cache=not args.no_cache
+            )
+        if args.spans:
+            spans.write_jsonl((r for item in results for r in item.spans), args.spans)
+        sys.exit(0 if all(item.ok for item in results) else 1)
+
+    # Validate-many mode
+    if args.validate_many:
+        data_paths = find_data_files(args.data_path)
+        if not data_paths:
+            logger.error(f"No data files found for: {args.data_path}")
+            sys.exit(1)
+        items = validate_many(data_paths, strict=args.strict,
+                              workers=args.workers, executor=args.executor)
+        sys.exit(0 if all(item.ok for item in items) else 1)
+
     # Validate-only mode
     if args.validate_only:
-        with open(args.data_path, "r") as f:
-            data = json.load(f)
+        data = json_backend.load(args.data_path)
         result = validate_data(data, strict=args.strict)
         print(result.summary())
         if result.warnings:
@@ -1241,15 +1953,25 @@ if __name__ == "__main__":
                 print(f"  - {e}")
         sys.exit(0 if result.is_valid else 1)
 
+    lang = args.lang or "en"
+    collector = None
     try:
-        generate_article(
-            args.data_path,
-            args.output_dir,
-            lang=args.lang,
-            strict=args.strict,
-            skip_validation=args.skip_validation,
-            ref_date=args.ref_date
-        )
+        timing = spans.collecting(source=args.data_path, lang=lang) if args.spans else contextlib.nullcontext()
+        with spans.profiled(args.profile), timing as collector:
+            generate_article(
+                args.data_path,
+                args.output_dir,
+                lang=lang,
+                strict=args.strict,
+                skip_validation=args.skip_validation,
+                ref_date=args.ref_date,
+                cache=None if args.no_cache else default_cache()
+            )
     except (ValidationError, ValueError) as e:
         logger.error(str(e))
         sys.exit(1)
+    finally:
+        if collector is not None:
+            spans.write_jsonl(collector.records, args.spans)
+            print()
+            spans.print_span_table(collector.records)
@@ -0,0 +1,161 @@
+#!/usr/bin/env python3
+"""
+The D-AI-LY JSON Backend
+
+One place to read and write JSON, using the fastest library available:
+
+- orjson   (pip install orjson)
+- msgspec  (pip install msgspec)
+- json     (standard library fallback, always available)
+
+Set DAILY_JSON_BACKEND=orjson|msgspec|json to force a backend. Every backend
+produces the same data and raises ValueError on malformed input, so callers do
+not need to know which one is active.
+
+Output is compact by default (no indentation, no spaces after separators),
+which is what production artifacts such as articles.json and the data embedded
+in article HTML use. Pass compact=False for the indented form humans read.
+
+load_frame() reads a data_*.json file into the typed SeriesFrame used by the
+generators. It decodes to plain dicts and lists first and then builds the
+frame from them; no backend decodes into typed structs directly.
+"""
+
+import importlib
+import json
+import os
+from pathlib import Path
+from typing import Any, Callable, Dict, Union
+
+from atomic_write import write_if_changed
+from series_frame import SeriesFrame
+
+BACKEND_ENV = "DAILY_JSON_BACKEND"
+PREFERRED_BACKENDS = ("orjson", "msgspec", "json")
+
+PathLike = Union[str, Path]
+
+
+class JSONBackend:
+    """A named pair of loads/dumps functions."""
+
+    def __init__(self, name: str, loads: Callable[[Union[str, bytes]], Any],
+                 dumps: Callable[[Any, bool], str]):
+        self.name = name
+        self.loads = loads
+        self.dumps = dumps
+
+    def __repr__(self) -> str:
+        return f"JSONBackend({self.name!r})"
+
+
+def _stdlib_backend() -> JSONBackend:
+    def dumps(obj: Any, compact: bool = True) -> str:
+        if compact:
+            return json.dumps(obj, ensure_ascii=False, separators=(",", ":"))
+        return json.dumps(obj, ensure_ascii=False, indent=2)
+
+    return JSONBackend("json", json.loads, dumps)
+
+
+def _orjson_backend() -> JSONBackend:
+    orjson = importlib.import_module("orjson")
+
+    def dumps(obj: Any, compact: bool = True) -> str:
+        option = 0 if compact else orjson.OPT_INDENT_2
+        return orjson.dumps(obj, option=option).decode("utf-8")
+
+    # orjson.JSONDecodeError is a ValueError subclass
+    return JSONBackend("orjson", orjson.loads, dumps)
+
+
+def _msgspec_backend() -> JSONBackend:
+    msgspec = importlib.import_module("msgspec")
+    decoder = msgspec.json.Decoder()
+    encoder = msgspec.json.Encoder()
+
+    def loads(data: Union[str, bytes]) -> Any:
+        try:
+            return decoder.decode(data)
+        except msgspec.DecodeError as e:
+            raise ValueError(str(e)) from e
+
+    def dumps(obj: Any, compact: bool = True) -> str:
+        encoded = encoder.encode(obj)
+        if not compact:
+            encoded = msgspec.json.format(encoded, indent=2)
+        return encoded.decode("utf-8")
+
+    return JSONBackend("msgspec", loads, dumps)
+
+
+_FACTORIES: Dict[str, Callable[[], JSONBackend]] = {
+    "orjson": _orjson_backend,
+    "msgspec": _msgspec_backend,
+    "json": _stdlib_backend,
+}
+
+
+def get_backend(name: str) -> JSONBackend:
+    """
+    Build a backend by name.
+
+    Raises:
+        ImportError: If the backend's library is not installed
+        ValueError: If the name is unknown
+    """
+    if name not in _FACTORIES:
+        raise ValueError(f"Unknown JSON backend: {name} (expected one of {', '.join(_FACTORIES)})")
+    return _FACTORIES[name]()
+
+
+def _select_backend() -> JSONBackend:
+    requested = os.environ.get(BACKEND_ENV)
+    if requested:
+        return get_backend(requested)
+    for name in PREFERRED_BACKENDS:
+        try:
+            return get_backend(name)
+        except ImportError:
+            continue
+    return _stdlib_backend()
+
+
+_BACKEND = _select_backend()
+BACKEND = _BACKEND.name
+
+
+def loads(data: Union[str, bytes]) -> Any:
+    """Decode JSON text or bytes."""
+    return _BACKEND.loads(data)
+
+
+def dumps(obj: Any, compact: bool = True) -> str:
+    """Encode obj as JSON (compact unless compact=False; non-ASCII kept as-is)."""
+    return _BACKEND.dumps(obj, compact)
+
+
+def load(path: PathLike) -> Any:
+    """Read and decode a JSON file."""
+    with open(path, "rb") as f:
+        return _BACKEND.loads(f.read())
+
+
+def dump(obj: Any, path: PathLike, compact: bool = True) -> bool:
+    """
+    Encode obj and write it to path as UTF-8, atomically and only if the
+    encoded text differs from the file's current content. Returns True if
+    the file was written.
+    """
+    return write_if_changed(path, _BACKEND.dumps(obj, compact))
+
+
+def load_frame(path: PathLike) -> SeriesFrame:
+    """
+    Read a data_*.json file into a SeriesFrame.
+
+    This is a dict round-trip: the active backend decodes the file to plain
+    dicts and lists, and SeriesFrame then builds its records and columns
+    from them. It saves callers a step, not a pass over the data.
+    """
+    return SeriesFrame(load(path))
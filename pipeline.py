@@ -0,0 +1,429 @@
+#!/usr/bin/env python3
+"""
+The D-AI-LY Pipeline Orchestrator
+
+Runs the daily workflow as a dependency graph instead of a fixed shell chain:
+
+    discover ──> fetch:<table> ──┬──> generate:<table>:en ──┬──> build
+                                 └──> generate:<table>:fr ──┘
+
+Steps whose dependencies have finished run concurrently on a bounded pool
+(--jobs), so several --table fetches, and the EN and FR articles of each
+table, proceed in parallel. A failed step skips everything downstream of it;
+independent branches keep going. Every step's wall time is printed at the end
+and appended to output/pipeline_timings.jsonl.
+
+Usage:
+    python3 pipeline.py                          # discover -> fetch -> generate -> build
+    python3 pipeline.py --table 18-10-0004       # skip discovery
+    python3 pipeline.py --table 18-10-0004 --table 14-10-0287 --jobs 4
+    python3 pipeline.py --dry-run                # discovery only
+    python3 pipeline.py --prep-only              # discovery + fetch only
+    python3 pipeline.py --generator claude       # generate with Claude Code instead
+    python3 pipeline.py --table 18-10-0004 --generator legacy
+        # fetch_cansim_data.R -> generate_article.py -> output/articles/article_YYYYMMDD.html
+"""
+
+import argparse
+import logging
+import shutil
+import subprocess
+import sys
+import time
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, wait
+from pathlib import Path
+from typing import Any, Callable, Dict, List, Optional, Sequence
+
+import json_backend
+import spans
+
+PROJECT_DIR = Path(__file__).parent
+DEFAULT_JOBS = 4
+TIMINGS_NAME = "pipeline_timings.jsonl"
+
+# Stages in order; --dry-run stops after discover, --prep-only after fetch
+STAGES = ("discover", "fetch", "generate", "build")
+
+logger = logging.getLogger("pipeline")
+
+
+# =============================================================================
+# DEPENDENCY GRAPH
+# =============================================================================
+
+class StopPipeline(Exception):
+    """Raised by a step to end the run early without failing it (e.g. nothing new to publish)."""
+
+
+class Step:
+    """One node of the pipeline graph and, once run, its outcome."""
+    def __init__(self, name: str, action: Callable[[Dict[str, Any]], Any],
+                 deps: Sequence[str] = ()):
+        self.name = name
+        self.action = action
+        self.deps = tuple(deps)
+        self.status = "pending"  # pending | ok | failed | skipped | stopped
+        self.seconds: Optional[float] = None
+        self.result: Any = None
+        self.error: Optional[str] = None
+
+
+class Pipeline:
+    """
+    A DAG of steps run on a bounded thread pool.
+
+    Each action is called with the results of every finished step, keyed by
+    step name. Steps must be added after their dependencies, which keeps the
+    graph acyclic by construction.
+    """
+
+    def __init__(self, jobs: int = DEFAULT_JOBS):
+        self.jobs = max(1, jobs)
+        self.steps: Dict[str, Step] = {}
+        self.results: Dict[str, Any] = {}
+
+    def add(self, name: str, action: Callable[[Dict[str, Any]], Any],
+            deps: Sequence[str] = ()) -> Step:
+        if name in self.steps:
+            raise ValueError(f"Duplicate step: {name}")
+        missing = [dep for dep in deps if dep not in self.steps]
+        if missing:
+            raise ValueError(f"Step {name} depends on unknown step(s): {', '.join(missing)}")
+        step = self.steps[name] = Step(name, action, deps)
+        return step
+
+    def describe(self) -> List[str]:
+        """One "name <- deps" line per step, in insertion order."""
+        return [f"{step.name}" + (f" <- {', '.join(step.deps)}" if step.deps else "")
+                for step in self.steps.values()]
+
+    def _run_step(self, step: Step) -> None:
+        logger.info(f"▶ {step.name}")
+        start = time.perf_counter()
+        try:
+            step.result = step.action(self.results)
+            step.status = "ok"
+        except StopPipeline as e:
+            step.status = "stopped"
+            step.error = str(e)
+        except Exception as e:
+            step.status = "failed"
+            step.error = f"{type(e).__name__}: {e}"
+        step.seconds = time.perf_counter() - start
+
+        if step.status == "ok":
+            self.results[step.name] = step.result
+            logger.info(f"✓ {step.name} ({step.seconds:.2f}s)")
+        elif step.status == "stopped":
+            logger.info(f"■ {step.name}: {step.error}")
+        else:
+            logger.error(f"✗ {step.name} ({step.seconds:.2f}s): {step.error}")
+
+    def _skip_blocked(self, pending: Dict[str, Step]) -> None:
+        """Skip pending steps downstream of a failure, cascading until stable."""
+        changed = True
+        while changed:
+            changed = False
+            for step in list(pending.values()):
+                if any(self.steps[dep].status in ("failed", "skipped") for dep in step.deps):
+                    step.status = "skipped"
+                    del pending[step.name]
+                    logger.info(f"- {step.name}: skipped (upstream failure)")
+                    changed = True
+
+    def run(self) -> bool:
+        """
+        Run every step whose dependencies succeed.
+
+        Returns:
+            True unless a step failed (a StopPipeline ends the run successfully)
+        """
+        pending = dict(self.steps)
+        running: Dict[Future, Step] = {}
+        stopped = False
+
+        with ThreadPoolExecutor(max_workers=self.jobs) as pool:
+            while pending or running:
+                if stopped:
+                    for step in pending.values():
+                        step.status = "skipped"
+                    pending.clear()
+                else:
+                    self._skip_blocked(pending)
+                    for step in list(pending.values()):
+                        if len(running) >= self.jobs:
+                            break
+                        if all(self.steps[dep].status == "ok" for dep in step.deps):
+                            del pending[step.name]
+                            running[pool.submit(self._run_step, step)] = step
+
+                if not running:
+                    continue
+                done, _ = wait(running, return_when=FIRST_COMPLETED)
+                for future in done:
+                    if running.pop(future).status == "stopped":
+                        stopped = True
+
+        return not any(step.status == "failed" for step in self.steps.values())
+
+    def records(self, **fields: Any) -> List[spans.Record]:
+        """Per-step timing records in the spans JSON-lines format."""
+        return [
+            dict(fields, span=step.name, ms=round(step.seconds * 1e3, 1), status=step.status)
+            for step in self.steps.values() if step.seconds is not None
+        ]
+
+    def print_summary(self) -> None:
+        width = max([len("Step")] + [len(name) for name in self.steps])
+        print(f"{'Step':<{width}}  {'Status':<8}  {'Time':>8}")
+        for step in self.steps.values():
+            seconds = f"{step.seconds:.2f}s" if step.seconds is not None else "-"
+            print(f"{step.name:<{width}}  {step.status:<8}  {seconds:>8}")
+
+
+# =============================================================================
+# STEPS
+# =============================================================================
+
+def run_command(cmd: List[str], log_file: Optional[Path] = None) -> None:
+    """Run a command from the project root; its output goes to log_file if given."""
+    logger.info(f"  $ {' '.join(cmd)}")
+    if log_file is None:
+        subprocess.run(cmd, cwd=PROJECT_DIR, check=True)
+        return
+    with open(log_file, "a", encoding="utf-8") as log:
+        subprocess.run(cmd, cwd=PROJECT_DIR, stdout=log, stderr=subprocess.STDOUT, check=True)
+
+
+def data_file_for_table(output_dir: Path, table: str) -> Path:
+    """Path fetch_table.R writes a table's data to (18-10-0004 -> data_18_10_0004.json)."""
+    return output_dir / f"data_{table.replace('-', '_')}.json"
+
+
+def read_recommendation(results_path: Path) -> Optional[str]:
+    """Table number recommended by discover_topics.R, or None if nothing is newsworthy."""
+    recommendation = json_backend.load(results_path).get("recommendation")
+    return recommendation.get("table_number") if recommendation else None
+
+
+def discover(output_dir: Path, log_file: Optional[Path]) -> str:
+    run_command(["Rscript", "r-tools/discover_topics.R", "--configured", "--json",
+                 f"--output={output_dir}"], log_file)
+    results_path = output_dir / "discovery_results.json"
+    if not results_path.exists():
+        raise FileNotFoundError("Discovery failed - no results file")
+    table = read_recommendation(results_path)
+    if not table:
+        raise StopPipeline("No newsworthy updates found")
+    logger.info(f"  Recommended table: {table}")
+    return table
+
+
+def fetch(table: str, output_dir: Path, log_file: Optional[Path],
+          script: str = "r-tools/fetch_table.R") -> str:
+    run_command(["Rscript", script, table, str(output_dir)], log_file)
+    data_path = data_file_for_table(output_dir, table)
+    if not data_path.exists():
+        raise FileNotFoundError(f"Data fetch failed - no output file for {table}")
+    logger.info(f"  Data saved to: {data_path}")
+    return str(data_path)
+
+
+def generate_observable(data_path: str, docs_dir: Path, lang: str) -> str:
+    # Imported lazily: a --dry-run or --prep-only run never renders
+    from generate_article_observable import generate_article
+    return generate_article(data_path, str(docs_dir), lang=lang)
+
+
+def generate_legacy(data_path: str, output_dir: Path) -> str:
+    # The single-language HTML article, named by run date as run_pipeline.sh always did
+    from generate_article import generate_article
+    article_path = output_dir / "articles" / f"article_{time.strftime('%Y%m%d')}.html"
+    article_path.parent.mkdir(parents=True, exist_ok=True)
+    return generate_article(data_path, str(article_path))
+
+
+def generate_claude(table: str, log_file: Optional[Path]) -> None:
+    if shutil.which("claude") is None:
+        raise FileNotFoundError(
+            "Claude Code CLI not found. Install with: npm install -g @anthropic-ai/claude-code. "
+            f'To generate manually, run: claude "/the-daily-generator {table}"'
+        )
+    # --print runs non-interactively; the skill writes both languages
+    run_command(["claude", "--print", f"/the-daily-generator {table}"], log_file)
+
+
+def build_pipeline(tables: List[str], last_stage: str = "build",
+                   generator: str = "observable", langs: Sequence[str] = ("en", "fr"),
+                   output_dir: Path = PROJECT_DIR / "output",
+                   docs_dir: Path = PROJECT_DIR / "docs",
+                   log_file: Optional[Path] = None, jobs: int = DEFAULT_JOBS) -> Pipeline:
+    """
+    Build the step graph for a run.
+
+    Without tables, a discover step picks one and the downstream steps read it
+    from its result. Stages after last_stage are left out.
+
+    The legacy generator fetches with fetch_cansim_data.R and writes one HTML
+    article per table to output/articles/ with generate_article.py; it has no
+    site build step.
+    """
+    last = STAGES.index(last_stage)
+    pipeline = Pipeline(jobs)
+
+    def table_of(key: Optional[str]) -> Callable[[Dict[str, Any]], str]:
+        return (lambda results: results["discover"]) if key is None else (lambda results: key)
+
+    if tables:
+        keys: List[Optional[str]] = list(dict.fromkeys(tables))
+        upstream: List[str] = []
+    else:
+        pipeline.add("discover", lambda results: discover(output_dir, log_file))
+        keys = [None]
+        upstream = ["discover"]
+    if last < STAGES.index("fetch"):
+        return pipeline
+
+    generated: List[str] = []
+    for key in keys:
+        table = table_of(key)
+        label = key or "recommended"
+        fetch_step = f"fetch:{label}"
+        fetch_script = ("r-tools/fetch_cansim_data.R" if generator == "legacy"
+                        else "r-tools/fetch_table.R")
+        pipeline.add(fetch_step,
+                     lambda results, table=table: fetch(table(results), output_dir, log_file,
+                                                        fetch_script),
+                     upstream)
+        if last < STAGES.index("generate"):
+            continue
+
+        if generator == "legacy":
+            pipeline.add(f"generate:{label}",
+                         lambda results, fetch_step=fetch_step: generate_legacy(
+                             results[fetch_step], output_dir),
+                         [fetch_step])
+            continue
+
+        if generator == "claude":
+            name = f"generate:{label}"
+            pipeline.add(name, lambda results, table=table: generate_claude(table(results), log_file),
+                         [fetch_step])
+            generated.append(name)
+            continue
+        for lang in langs:
+            name = f"generate:{label}:{lang}"
+            pipeline.add(name,
+                         lambda results, fetch_step=fetch_step, lang=lang: generate_observable(
+                             results[fetch_step], docs_dir, lang),
+                         [fetch_step])
+            generated.append(name)
+
+    if last >= STAGES.index("build") and generated:
+        pipeline.add("build", lambda results: run_command(["npm", "run", "build"], log_file),
+                     generated)
+    return pipeline
+
+
+def _setup_logging(log_file: Optional[Path]) -> None:
+    formatter = logging.Formatter("[%(asctime)s] %(message)s", datefmt="%Y-%m-%d %H:%M:%S")
+    handlers: List[logging.Handler] = [logging.StreamHandler(sys.stdout)]
+    if log_file is not None:
+        log_file.parent.mkdir(parents=True, exist_ok=True)
+        handlers.append(logging.FileHandler(log_file, encoding="utf-8"))
+    for handler in handlers:
+        handler.setFormatter(formatter)
+        logger.addHandler(handler)
+    logger.setLevel(logging.INFO)
+    logger.propagate = False
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(
+        description="Run The D-AI-LY pipeline (discover -> fetch -> generate -> build)"
+    )
+    parser.add_argument("--table", action="append", default=[],
+                        help="Skip discovery and process this table (repeatable)")
+    parser.add_argument("--dry-run", action="store_true",
+                        help="Run discovery only, don't fetch, generate or build")
+    parser.add_argument("--prep-only", action="store_true",
+                        help="Discovery and fetch only, no article generation")
+    parser.add_argument("--no-build", action="store_true",
+                        help="Stop after generating articles")
+    parser.add_argument("--generator", choices=["observable", "claude", "legacy"],
+                        default="observable",
+                        help="observable: generate_article_observable.py per language; "
+                             "claude: the /the-daily-generator skill; "
+                             "legacy: fetch_cansim_data.R and generate_article.py into "
+                             "OUTPUT_DIR/articles, no build (default: observable)")
+    parser.add_argument("--lang", choices=["en", "fr"], default=None,
+                        help="Only generate this language (observable generator; default: en and fr)")
+    parser.add_argument("--jobs", type=int, default=DEFAULT_JOBS,
+                        help=f"Maximum steps running at once (default: {DEFAULT_JOBS})")
+    parser.add_argument("--output-dir", type=Path, default=PROJECT_DIR / "output",
+                        help="Data directory (default: output)")
+    parser.add_argument("--docs-dir", type=Path, default=PROJECT_DIR / "docs",
+                        help="Observable site directory (default: docs)")
+    parser.add_argument("--log-file", type=Path, default=None,
+                        help="Also write the log and all command output to this file")
+    parser.add_argument("--timings", default=None,
+                        help=f"Append per-step timings as JSON lines (default: OUTPUT_DIR/{TIMINGS_NAME})")
+
+    args = parser.parse_args()
+
+    _setup_logging(args.log_file)
+    args.output_dir.mkdir(parents=True, exist_ok=True)
+    started = time.strftime("%Y-%m-%dT%H:%M:%S")
+
+    if args.dry_run:
+        last_stage = "discover"
+    elif args.prep_only:
+        last_stage = "fetch"
+    elif args.no_build:
+        last_stage = "generate"
+    else:
+        last_stage = "build"
+
+    pipeline = build_pipeline(
+        args.table,
+        last_stage=last_stage,
+        generator=args.generator,
+        langs=[args.lang] if args.lang else ("en", "fr"),
+        output_dir=args.output_dir,
+        docs_dir=args.docs_dir,
+        log_file=args.log_file,
+        jobs=args.jobs
+    )
+
+    logger.info("═══════════════════════════════════════════════════════════════════")
+    logger.info("  THE D-AI-LY - Pipeline")
+    logger.info(f"  Started: {started}")
+    logger.info("═══════════════════════════════════════════════════════════════════")
+    if not pipeline.steps:
+        logger.info(f"Using specified table(s): {', '.join(args.table)}")
+        logger.info("Dry run mode - stopping before data fetch")
+        sys.exit(0)
+    logger.info(f"Plan ({last_stage} stage last, {pipeline.jobs} job(s)):")
+    for line in pipeline.describe():
+        logger.info(f"  {line}")
+    logger.info("")
+
+    start = time.perf_counter()
+    ok = pipeline.run()
+    elapsed = time.perf_counter() - start
+
+    print()
+    pipeline.print_summary()
+    print(f"\nPipeline {'complete' if ok else 'FAILED'} in {elapsed:.2f}s")
+    if args.log_file:
+        print(f"Log saved to: {args.log_file}")
+
+    timings = args.timings or str(args.output_dir / TIMINGS_NAME)
+    spans.write_jsonl(pipeline.records(run=started), timings)
+
+    if ok and last_stage in ("discover", "fetch"):
+        tables = args.table or [pipeline.results.get("discover")]
+        for table in filter(None, tables):
+            print(f'To generate the article manually, run: claude "/the-daily-generator {table}"')
+
+    sys.exit(0 if ok else 1)
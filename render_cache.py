@@ -0,0 +1,197 @@
+#!/usr/bin/env python3
+"""
+The D-AI-LY Render Cache
+
+Content-addressed cache of rendered articles. The key is a hash of everything
+a render depends on:
+
+- the data file's bytes
+- the input files (template, translations.json, and the generator's own
+  source and helper modules, which stand in for its version)
+- the render options (language, ref_date, output location, release date, ...)
+
+On a hit the cached article is reused: if the output file (and any data
+files it loads, stored with it as attachments) already holds exactly that
+content nothing is written at all, and if it is missing or different it is
+restored from the cache without rendering.
+
+Entries live as one JSON file per key under output/.render-cache/, written
+with a temp file and rename, so several batch workers can share the cache
+without locking. An entry's mtime is its last use; once the cache grows past
+its byte budget the least recently used entries are deleted.
+"""
+
+import hashlib
+import os
+import time
+from functools import lru_cache
+from pathlib import Path
+from typing import Any, Dict, Optional, Sequence, Tuple, Union
+
+import json_backend
+from atomic_write import write_if_changed
+
+CACHE_DIR = Path(__file__).parent / "output" / ".render-cache"
+DEFAULT_MAX_BYTES = 256 * 1024 * 1024
+# Bump to invalidate every entry when the entry format or key scheme changes
+CACHE_FORMAT = 1
+
+PathLike = Union[str, Path]
+
+# Input file digests keyed by path: (mtime_ns, size, sha256)
+_DIGESTS: Dict[str, Tuple[int, int, str]] = {}
+
+
+def digest_bytes(content: Union[str, bytes]) -> str:
+    if isinstance(content, str):
+        content = content.encode("utf-8")
+    return hashlib.sha256(content).hexdigest()
+
+
+def file_digest(path: PathLike) -> str:
+    """sha256 of a file, recomputed only when its mtime or size changes."""
+    key = os.path.abspath(path)
+    stat = os.stat(key)
+    cached = _DIGESTS.get(key)
+    if cached and cached[0] == stat.st_mtime_ns and cached[1] == stat.st_size:
+        return cached[2]
+    with open(key, "rb") as f:
+        digest = digest_bytes(f.read())
+    _DIGESTS[key] = (stat.st_mtime_ns, stat.st_size, digest)
+    return digest
+
+
+class RenderCache:
+    """A directory of rendered articles keyed by the hash of their inputs."""
+
+    def __init__(self, cache_dir: PathLike = CACHE_DIR, max_bytes: int = DEFAULT_MAX_BYTES):
+        self.cache_dir = Path(cache_dir)
+        self.max_bytes = max_bytes
+        self.hits = 0
+        self.misses = 0
+        # Running estimate of the cache size; None until the first scan
+        self._size: Optional[int] = None
+
+    def key(self, generator: str, data_digest: str, inputs: Sequence[PathLike],
+            options: Dict[str, Any]) -> str:
+        """
+        Build the cache key for one render.
+
+        Args:
+            generator: Generator name (e.g. "observable")
+            data_digest: sha256 of the data file's bytes
+            inputs: Files the output depends on besides the data
+            options: Render options; values must have a stable repr
+        """
+        parts = [f"format={CACHE_FORMAT}", generator, data_digest]
+        parts += [f"{Path(path).name}={file_digest(path)}" for path in inputs]
+        parts += [f"{name}={options[name]!r}" for name in sorted(options)]
+        return digest_bytes("\n".join(parts))
+
+    def _entry_path(self, key: str) -> Path:
+        return self.cache_dir / f"{key}.json"
+
+    def fetch(self, key: str) -> Optional[Dict[str, Any]]:
+        """
+        Return the entry for key with its output file in place, or None.
+
+        The output file is only written when it is missing or differs from
+        the cached content. A hit marks the entry as recently used.
+        """
+        entry_path = self._entry_path(key)
+        try:
+            entry = json_backend.load(entry_path)
+            output = Path(entry["output"])
+            content = entry["content"]
+        except (OSError, ValueError, KeyError, TypeError):
+            self.misses += 1
+            return None
+
+        restored = write_if_changed(output, content)
+        for path, attachment in entry.get("attachments", {}).items():
+            restored = write_if_changed(path, attachment) or restored
+        if restored:
+            entry["restored"] = True
+
+        try:
+            os.utime(entry_path)
+        except OSError:
+            pass
+        self.hits += 1
+        return entry
+
+    def put(self, key: str, output_path: PathLike, meta: Optional[Dict[str, Any]] = None,
+            attachments: Sequence[PathLike] = ()) -> None:
+        """
+        Store the file just rendered at output_path under key, along with any
+        attachments (data files the output loads) to restore with it.
+        """
+        with open(output_path, "r", encoding="utf-8") as f:
+            content = f.read()
+        entry = {
+            "output": str(output_path),
+            "sha256": digest_bytes(content),
+            "content": content,
+            "attachments": {str(path): Path(path).read_text(encoding="utf-8")
+                            for path in attachments},
+            "meta": meta or {},
+            "created": time.strftime("%Y-%m-%dT%H:%M:%S"),
+        }
+        encoded = json_backend.dumps(entry)
+        write_if_changed(self._entry_path(key), encoded)
+
+        if self._size is None:
+            self._size = self._scan_size()
+        else:
+            self._size += len(encoded)
+        if self._size > self.max_bytes:
+            self.evict()
+
+    def _scan_size(self) -> int:
+        total = 0
+        for entry in os.scandir(self.cache_dir):
+            if entry.name.endswith(".json"):
+                try:
+                    total += entry.stat().st_size
+                except OSError:
+                    pass
+        return total
+
+    def evict(self, target: Optional[int] = None) -> int:
+        """
+        Delete least recently used entries until the cache is under target
+        bytes (default: 90% of max_bytes). Returns the number removed.
+        """
+        if target is None:
+            target = int(self.max_bytes * 0.9)
+        entries = []
+        for entry in os.scandir(self.cache_dir):
+            if entry.name.endswith(".json"):
+                try:
+                    stat = entry.stat()
+                except OSError:
+                    continue
+                entries.append((stat.st_mtime_ns, stat.st_size, entry.path))
+
+        total = sum(size for _, size, _ in entries)
+        removed = 0
+        for _, size, path in sorted(entries):
+            if total <= target:
+                break
+            try:
+                os.remove(path)
+            except OSError:
+                continue
+            total -= size
+            removed += 1
+        self._size = total
+        return removed
+
+    def summary(self) -> str:
+        return f"Render cache: {self.hits} hit(s), {self.misses} miss(es)"
+
+
+@lru_cache(maxsize=None)
+def default_cache() -> RenderCache:
+    """The process-wide cache in CACHE_DIR, shared by every render in this process."""
+    return RenderCache()
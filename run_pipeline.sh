@@ -1,30 +1,12 @@
 #!/bin/bash
 # The D-AI-LY Pipeline
-# Fetches CANSIM data and generates a Daily-style article
+# Fetches CANSIM data (fetch_cansim_data.R) and generates a Daily-style HTML
+# article (generate_article.py) at output/articles/article_YYYYMMDD.html for
+# one table. See pipeline.py for the full graph.
 
 set -e
 
 TABLE_NUMBER="${1:-18-10-0004}"
-OUTPUT_DIR="output"
 
-echo "=== The D-AI-LY Pipeline ==="
-echo "Table: $TABLE_NUMBER"
-echo ""
-
-# Step 1: Fetch data from CANSIM
-echo "Step 1: Fetching data from Statistics Canada..."
-Rscript r-tools/fetch_cansim_data.R "$TABLE_NUMBER" "$OUTPUT_DIR"
-
-# Step 2: Generate article
-DATA_FILE="$OUTPUT_DIR/data_$(echo $TABLE_NUMBER | tr '-' '_').json"
-ARTICLE_FILE="$OUTPUT_DIR/articles/article_$(date +%Y%m%d).html"
-
-echo ""
-echo "Step 2: Generating article..."
-python3 generate_article.py "$DATA_FILE" "$ARTICLE_FILE"
-
-echo ""
-echo "=== Pipeline Complete ==="
-echo "Article: $ARTICLE_FILE"
-echo ""
-echo "Open in browser: open $ARTICLE_FILE"
+cd "$(dirname "${BASH_SOURCE[0]}")"
+exec python3 pipeline.py --table "$TABLE_NUMBER" --generator legacy
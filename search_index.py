@@ -0,0 +1,242 @@
+#!/usr/bin/env python3
+"""
+The D-AI-LY Search Index
+
+Prebuilt inverted index over the article archive, written by build_site so
+the front end (site/js/search.js) can search without downloading articles:
+
+    site/search/index.json             format, term rules and the shard list
+    site/search/<lang>/<prefix>.json   {term: [doc ids]} for terms starting with prefix
+    site/search/docs/<chunk>.json      {doc id: [lang, date, title, filename, table]}
+
+Terms come from each article's title, table number and series name. They are
+lowercased with accents stripped and indexed per language, and each shard holds
+the terms sharing their first PREFIX_LENGTH characters, so a query fetches the
+index, one shard per query term and the doc chunks of its hits.
+
+The index is built incrementally: output/.search-index.json keeps every
+article's document, terms and id from the last build, so only the shards
+containing a term of an added, changed or removed article and the doc chunks
+of those articles are rewritten. Doc ids are stable across builds.
+"""
+
+import re
+import unicodedata
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Set, Tuple
+
+import json_backend
+
+SEARCH_DIR = "search"
+STATE_NAME = ".search-index.json"
+# Bump when the file layout or tokenizer changes so the index is rebuilt
+SEARCH_VERSION = 1
+
+PREFIX_LENGTH = 2
+MIN_TERM_LENGTH = 2
+DOC_CHUNK_SIZE = 500
+
+STOP_WORDS = {
+    "en": ["and", "at", "by", "for", "from", "in", "of", "on", "the", "to"],
+    "fr": ["au", "aux", "d", "de", "des", "du", "en", "et", "l", "la", "le", "les", "par", "sur"],
+}
+
+_TERM_SPLIT_RE = re.compile(r"[^a-z0-9]+")
+
+# [lang, date, title, filename, table, series]; the first five are published
+Doc = List[Optional[str]]
+
+
+def normalize(text: str) -> str:
+    """Lowercase text and strip accents ("Électricité" -> "electricite")."""
+    decomposed = unicodedata.normalize("NFD", text)
+    return "".join(c for c in decomposed if not unicodedata.combining(c)).lower()
+
+
+def tokenize(text: str, lang: str) -> List[str]:
+    """Split text into index terms; search.js applies the same rules to queries."""
+    stop_words = STOP_WORDS.get(lang, ())
+    return [term for term in _TERM_SPLIT_RE.split(normalize(text))
+            if len(term) >= MIN_TERM_LENGTH and term not in stop_words]
+
+
+def document_terms(doc: Doc) -> List[str]:
+    """Distinct terms of a document's title, table number and series name."""
+    lang, _, title, _, table, series = doc
+    terms = set(tokenize(title or "", lang))
+    terms.update(tokenize(table or "", lang))
+    terms.update(tokenize(series or "", lang))
+    return sorted(terms)
+
+
+def documents_from(date_grouped: Dict[str, Dict[str, List[Dict]]]) -> Dict[str, Doc]:
+    """Search documents keyed by "<lang>/<filename>" from get_bilingual_articles() output."""
+    docs: Dict[str, Doc] = {}
+    for date in sorted(date_grouped):
+        for lang in ("en", "fr"):
+            for article in date_grouped[date].get(lang, []):
+                key = f"{lang}/{article['filename']}"
+                docs.setdefault(key, [lang, date, article["title"], article["filename"],
+                                      article.get("table_number"), article.get("series")])
+    return docs
+
+
+class SearchIndex:
+    """
+    The search files under site/search/ plus the state of the last build.
+
+    A missing or outdated state (or a missing index.json) makes the next
+    update() write every file.
+    """
+
+    def __init__(self, site_dir: Path, state_path: Optional[Path] = None, load: bool = True):
+        self.search_dir = site_dir / SEARCH_DIR
+        self.state_path = state_path
+        self.docs: Dict[str, Doc] = {}
+        self.terms: Dict[str, List[str]] = {}
+        self.ids: Dict[str, int] = {}
+
+        if (load and state_path is not None and state_path.exists()
+                and (self.search_dir / "index.json").exists()):
+            try:
+                state = json_backend.load(state_path)
+                if state.get("version") == SEARCH_VERSION:
+                    self.docs = state["docs"]
+                    self.terms = state["terms"]
+                    self.ids = state["ids"]
+            except (OSError, ValueError, KeyError) as e:
+                print(f"Warning: Ignoring unreadable search index state {state_path}: {e}")
+
+    def _assign_ids(self, docs: Dict[str, Doc]) -> Dict[str, int]:
+        """Keep the ids of known documents; new ones reuse freed ids first."""
+        ids = {key: doc_id for key, doc_id in self.ids.items() if key in docs}
+        used = set(ids.values())
+        next_id = max(used, default=-1) + 1
+        free = (i for i in range(next_id) if i not in used)
+        for key in sorted(docs):
+            if key in ids:
+                continue
+            doc_id = next(free, None)
+            if doc_id is None:
+                doc_id = next_id
+                next_id += 1
+            ids[key] = doc_id
+        return ids
+
+    def update(self, docs: Dict[str, Doc]) -> Dict[str, int]:
+        """
+        Bring the search files in line with docs, rewriting only what changed.
+
+        Returns counts of changed and removed documents and of shards and doc
+        chunks written.
+        """
+        rebuild = not self.docs
+        changed = {key for key, doc in docs.items() if self.docs.get(key) != doc}
+        removed = {key for key in self.docs if key not in docs}
+
+        ids = self._assign_ids(docs)
+        terms = {key: self.terms[key] if key in self.terms and key not in changed
+                 else document_terms(doc)
+                 for key, doc in docs.items()}
+
+        # Shards and doc chunks holding anything that changed
+        touched_shards: Set[Tuple[str, str]] = set()
+        touched_chunks: Set[int] = set()
+        for key in changed | removed:
+            for source_docs, source_terms, source_ids in ((self.docs, self.terms, self.ids),
+                                                          (docs, terms, ids)):
+                if key in source_docs:
+                    lang = source_docs[key][0]
+                    touched_shards.update((lang, term[:PREFIX_LENGTH])
+                                          for term in source_terms.get(key, []))
+                    touched_chunks.add(source_ids[key] // DOC_CHUNK_SIZE)
+
+        all_shards = {(docs[key][0], term[:PREFIX_LENGTH]) for key in docs for term in terms[key]}
+        if rebuild:
+            touched_shards = all_shards
+            touched_chunks = {doc_id // DOC_CHUNK_SIZE for doc_id in ids.values()}
+
+        postings: Dict[Tuple[str, str], Dict[str, List[int]]] = {}
+        for key in sorted(docs, key=ids.get):
+            lang = docs[key][0]
+            for term in terms[key]:
+                shard = (lang, term[:PREFIX_LENGTH])
+                if shard in touched_shards:
+                    postings.setdefault(shard, {}).setdefault(term, []).append(ids[key])
+
+        shards_written = 0
+        for lang, prefix in touched_shards:
+            path = self.search_dir / lang / f"{prefix}.json"
+            shard = postings.get((lang, prefix))
+            if shard:
+                shards_written += json_backend.dump(dict(sorted(shard.items())), path)
+            elif path.exists():
+                path.unlink()
+
+        chunks: Dict[int, Dict[str, Doc]] = {}
+        for key, doc_id in ids.items():
+            chunk = doc_id // DOC_CHUNK_SIZE
+            if chunk in touched_chunks:
+                chunks.setdefault(chunk, {})[str(doc_id)] = docs[key][:5]
+        chunks_written = 0
+        for chunk in touched_chunks:
+            path = self.search_dir / "docs" / f"{chunk}.json"
+            if chunk in chunks:
+                entries = dict(sorted(chunks[chunk].items(), key=lambda item: int(item[0])))
+                chunks_written += json_backend.dump(entries, path)
+            elif path.exists():
+                path.unlink()
+
+        if rebuild:
+            self._remove_stale(all_shards, {doc_id // DOC_CHUNK_SIZE for doc_id in ids.values()})
+
+        json_backend.dump(self._index(all_shards, len(docs)), self.search_dir / "index.json")
+
+        self.docs, self.terms, self.ids = docs, terms, ids
+        return {"changed": len(changed), "removed": len(removed),
+                "shards": shards_written, "chunks": chunks_written}
+
+    def _index(self, shards: Set[Tuple[str, str]], doc_count: int) -> Dict[str, Any]:
+        by_lang: Dict[str, List[str]] = {}
+        for lang, prefix in sorted(shards):
+            by_lang.setdefault(lang, []).append(prefix)
+        return {
+            "version": SEARCH_VERSION,
+            "prefix_length": PREFIX_LENGTH,
+            "min_term_length": MIN_TERM_LENGTH,
+            "doc_chunk_size": DOC_CHUNK_SIZE,
+            "stop_words": STOP_WORDS,
+            "docs": doc_count,
+            "shards": by_lang,
+        }
+
+    def _remove_stale(self, shards: Set[Tuple[str, str]], chunks: Set[int]) -> None:
+        """Delete files left by an earlier build that the current index no longer has."""
+        if not self.search_dir.exists():
+            return
+        for path in self.search_dir.glob("*/*.json"):
+            if path.parent.name == "docs":
+                stale = not path.stem.isdigit() or int(path.stem) not in chunks
+            else:
+                stale = (path.parent.name, path.stem) not in shards
+            if stale:
+                path.unlink()
+
+    def save(self) -> None:
+        """Record this build's documents for the next incremental update."""
+        if self.state_path is None:
+            return
+        self.state_path.parent.mkdir(parents=True, exist_ok=True)
+        json_backend.dump({"version": SEARCH_VERSION, "docs": self.docs,
+                           "terms": self.terms, "ids": self.ids}, self.state_path)
+
+
+def build_search_index(date_grouped: Dict[str, Dict[str, List[Dict]]], site_dir: Path,
+                       state_path: Optional[Path] = None, full: bool = False) -> None:
+    """Update site/search/ from the articles found by build_site and save the state."""
+    index = SearchIndex(site_dir, state_path, load=not full)
+    stats = index.update(documents_from(date_grouped))
+    index.save()
+    print(f"Search index: {len(index.docs)} articles ({stats['changed']} changed, "
+          f"{stats['removed']} removed), {stats['shards']} shard(s) and "
+          f"{stats['chunks']} doc chunk(s) written")
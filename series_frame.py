@@ -0,0 +1,356 @@
+#!/usr/bin/env python3
+"""
+The D-AI-LY Series Frame
+
+A compact, typed view of one data_*.json file, built once per file and shared
+by the article generators and the reviewer:
+
+- Period: a __slots__ record for one observation (latest, comparison points,
+  time_series entries)
+- Breakdown: subseries/provincial categories with array-backed numeric columns
+- Ranking: a breakdown column ordered highest first, computed once per frame
+- SeriesFrame: metadata, the time series as columns, a ref_date index and the
+  breakdowns
+- PeriodIndex / SeriesView / RebasedData: copy-free "data as of period X"
+  views used to rebase a data file to a historical reference period
+
+Missing numbers are stored as NaN in the arrays and read back as None, so
+callers see the same values as in the JSON.
+"""
+
+import math
+from array import array
+from bisect import bisect_right
+from collections.abc import Mapping
+from collections.abc import Sequence as SequenceABC
+from typing import Any, Dict, Iterator, List, Optional, Sequence, Tuple, Union
+
+PERIOD_FIELDS = (
+    "date", "ref_date", "value",
+    "mom_change", "mom_pct_change", "yoy_change", "yoy_pct_change",
+)
+
+# Numeric time_series fields stored as columns
+SERIES_COLUMNS = ("value", "mom_pct_change", "yoy_pct_change")
+
+_MISSING = object()
+NAN = float("nan")
+
+Column = Union[array, List[Any]]
+
+
+def _to_column(values: Sequence[Any]) -> Column:
+    """Pack numbers (None as NaN) into array('d'); keep anything else as a list."""
+    if all(v is None or type(v) in (int, float) for v in values):
+        return array("d", [NAN if v is None else v for v in values])
+    return list(values)
+
+
+def _cell(column: Column, i: int) -> Any:
+    """Read one cell, turning NaN back into None."""
+    value = column[i]
+    if isinstance(value, float) and math.isnan(value):
+        return None
+    return value
+
+
+class Period:
+    """
+    One observation: a time_series entry, 'latest', or a comparison point.
+
+    Supports the dict-style access the generators already use (period["value"],
+    period.get("yoy_pct_change", 0)); a field absent from the JSON behaves like
+    a missing key, while a JSON null reads as None.
+    """
+    __slots__ = PERIOD_FIELDS
+
+    def __init__(self, **fields: Any):
+        for name in PERIOD_FIELDS:
+            setattr(self, name, fields.get(name, _MISSING))
+
+    @classmethod
+    def from_dict(cls, entry: Optional[Dict[str, Any]]) -> Optional["Period"]:
+        if not entry:
+            return None
+        return cls(**{k: v for k, v in entry.items() if k in PERIOD_FIELDS})
+
+    def get(self, name: str, default: Any = None) -> Any:
+        value = getattr(self, name, _MISSING) if name in PERIOD_FIELDS else _MISSING
+        return default if value is _MISSING else value
+
+    def __getitem__(self, name: str) -> Any:
+        value = self.get(name, _MISSING)
+        if value is _MISSING:
+            raise KeyError(name)
+        return value
+
+    def __contains__(self, name: str) -> bool:
+        return self.get(name, _MISSING) is not _MISSING
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {name: getattr(self, name) for name in PERIOD_FIELDS
+                if getattr(self, name) is not _MISSING}
+
+    def __repr__(self) -> str:
+        return f"Period({self.to_dict()!r})"
+
+
+class Breakdown:
+    """
+    A subseries or provincial breakdown: category names plus parallel columns.
+
+    Numeric columns (value, yoy_pct_change, ...) are array-backed; use
+    pairs(column) to iterate (category, value) without building zip lists,
+    and ranking(column) for the memoized ordering shared by every section.
+    """
+    __slots__ = ("categories", "columns", "_rankings")
+
+    def __init__(self, categories: List[str], columns: Dict[str, Column]):
+        self.categories = categories
+        self.columns = columns
+        self._rankings: Dict[str, Ranking] = {}
+
+    @classmethod
+    def from_dict(cls, raw: Optional[Dict[str, Any]]) -> Optional["Breakdown"]:
+        if not raw or "category" not in raw:
+            return None
+        categories = list(raw["category"] or [])
+        columns = {
+            name: _to_column(values)
+            for name, values in raw.items()
+            if name != "category" and isinstance(values, list)
+        }
+        return cls(categories, columns)
+
+    def __len__(self) -> int:
+        return len(self.categories)
+
+    def has(self, column: str) -> bool:
+        """True if the column exists and is non-empty."""
+        return len(self.columns.get(column, ())) > 0
+
+    def column(self, name: str) -> List[Any]:
+        """A column as a plain list (None for missing values)."""
+        col = self.columns.get(name, ())
+        return [_cell(col, i) for i in range(len(col))]
+
+    def value(self, column: str, i: int) -> Any:
+        """One cell, or None if the column is shorter than i."""
+        col = self.columns.get(column, ())
+        return _cell(col, i) if i < len(col) else None
+
+    def pairs(self, column: str) -> Iterator[Tuple[str, Any]]:
+        """(category, value) pairs, truncated to the shorter of the two like zip()."""
+        col = self.columns.get(column, ())
+        for i in range(min(len(self.categories), len(col))):
+            yield self.categories[i], _cell(col, i)
+
+    def ranking(self, column: str) -> "Ranking":
+        """The categories ordered by column, highest first (sorted once, then reused)."""
+        ranking = self._rankings.get(column)
+        if ranking is None:
+            ranking = self._rankings[column] = Ranking(self.pairs(column))
+        return ranking
+
+
+class Ranking:
+    """
+    Breakdown categories ordered by one column, highest first.
+
+    Ordering matches sorted(pairs, key=lambda x: x[1] or 0, reverse=True): a
+    missing value ranks as 0 and ties keep their source order. top(k) and
+    bottom(k) are slices of the sorted lists, and rank(category) uses a lookup
+    table built on first use, so repeated queries stay cheap for breakdowns
+    with thousands of categories.
+    """
+    __slots__ = ("categories", "values", "_positions")
+
+    def __init__(self, pairs: Iterator[Tuple[str, Any]]):
+        ordered = sorted(pairs, key=lambda x: x[1] or 0, reverse=True)
+        self.categories: List[str] = [category for category, _ in ordered]
+        self.values: List[Any] = [value for _, value in ordered]
+        self._positions: Optional[Dict[str, int]] = None
+
+    def __len__(self) -> int:
+        return len(self.categories)
+
+    def items(self) -> List[Tuple[str, Any]]:
+        """All (category, value) pairs, highest first."""
+        return list(zip(self.categories, self.values))
+
+    def top(self, k: int) -> List[Tuple[str, Any]]:
+        """The k highest (category, value) pairs, highest first."""
+        return list(zip(self.categories[:k], self.values[:k]))
+
+    def bottom(self, k: int) -> List[Tuple[str, Any]]:
+        """The k lowest (category, value) pairs, lowest first."""
+        if k <= 0:
+            return []
+        return list(zip(self.categories[:-k - 1:-1], self.values[:-k - 1:-1]))
+
+    def rank(self, category: str) -> Optional[int]:
+        """1-based rank of a category (its first occurrence), or None."""
+        if self._positions is None:
+            positions: Dict[str, int] = {}
+            for i, name in enumerate(self.categories):
+                positions.setdefault(name, i + 1)
+            self._positions = positions
+        return self._positions.get(category)
+
+
+class PeriodIndex:
+    """
+    ref_date lookup for a time_series list.
+
+    position() finds the first entry for a ref_date in O(1). When the ref_dates
+    are all strings in ascending order (the R fetchers' output), stop() finds
+    the end of the "up to and including ref_date" prefix by bisection.
+    """
+    __slots__ = ("ref_dates", "positions", "is_sorted")
+
+    def __init__(self, time_series: Sequence[Dict[str, Any]]):
+        self.ref_dates: List[Any] = [entry.get("ref_date") for entry in time_series]
+        self.positions: Dict[Any, int] = {}
+        for i, ref_date in enumerate(self.ref_dates):
+            self.positions.setdefault(ref_date, i)
+        self.is_sorted = (
+            all(isinstance(ref_date, str) for ref_date in self.ref_dates)
+            and all(a <= b for a, b in zip(self.ref_dates, self.ref_dates[1:]))
+        )
+
+    def position(self, ref_date: str) -> Optional[int]:
+        """Index of the first entry with this ref_date, or None."""
+        return self.positions.get(ref_date)
+
+    def stop(self, ref_date: str) -> Optional[int]:
+        """End of the entries with ref_date <= the given one, or None if unsorted."""
+        if not self.is_sorted:
+            return None
+        return bisect_right(self.ref_dates, ref_date)
+
+
+class SeriesFrame:
+    """
+    Typed, column-oriented view of one data file.
+
+    The raw dict is kept (frame.raw) for JSON embedding and validation; the
+    generators read everything else from the typed fields.
+    """
+    __slots__ = ("raw", "metadata", "urls", "latest", "comparison",
+                 "dates", "ref_dates", "columns", "index", "subseries", "provincial")
+
+    def __init__(self, data: Dict[str, Any]):
+        self.raw = data
+        self.metadata: Dict[str, Any] = data.get("metadata") or {}
+        self.urls: Dict[str, Any] = data.get("urls") or {}
+        self.latest = Period.from_dict(data.get("latest"))
+        self.comparison: Dict[str, Optional[Period]] = {
+            name: Period.from_dict(entry)
+            for name, entry in (data.get("comparison") or {}).items()
+        }
+
+        time_series = data.get("time_series") or []
+        self.dates: List[Optional[str]] = [e.get("date") for e in time_series]
+        self.index = PeriodIndex(time_series)
+        self.ref_dates: List[Optional[str]] = self.index.ref_dates
+        self.columns: Dict[str, Column] = {
+            name: _to_column([e.get(name) for e in time_series])
+            for name in SERIES_COLUMNS
+        }
+
+        self.subseries = Breakdown.from_dict(data.get("subseries"))
+        self.provincial = Breakdown.from_dict(data.get("provincial"))
+
+    @classmethod
+    def of(cls, data: Union["SeriesFrame", Dict[str, Any]]) -> "SeriesFrame":
+        """Return data if it is already a frame, else build one from the dict."""
+        return data if isinstance(data, SeriesFrame) else cls(data)
+
+    @property
+    def series_name(self) -> str:
+        return self.metadata.get("series_name", "")
+
+    def __len__(self) -> int:
+        return len(self.ref_dates)
+
+    def series(self, column: str) -> List[Any]:
+        """A time_series column as a plain list (None for missing values)."""
+        col = self.columns[column]
+        return [_cell(col, i) for i in range(len(col))]
+
+    def period(self, i: int) -> Period:
+        """The time_series entry at position i (negative indexes allowed)."""
+        i = range(len(self))[i]
+        fields = {"date": self.dates[i], "ref_date": self.ref_dates[i]}
+        for name, col in self.columns.items():
+            fields[name] = _cell(col, i)
+        return Period(**fields)
+
+    def position(self, ref_date: str) -> Optional[int]:
+        """Index of ref_date in the time series, or None."""
+        return self.index.position(ref_date)
+
+    def tail(self, n: int) -> range:
+        """Positions of the last n periods."""
+        return range(max(0, len(self) - n), len(self))
+
+
+class SeriesView(SequenceABC):
+    """
+    Read-only prefix view of a time_series list: base[:stop] without copying.
+
+    Not JSON-serializable as-is; use list(view) where a real list is needed.
+    """
+    __slots__ = ("base", "stop")
+
+    def __init__(self, base: Sequence[Any], stop: int):
+        self.base = base
+        self.stop = min(stop, len(base))
+
+    def __len__(self) -> int:
+        return self.stop
+
+    def __getitem__(self, i):
+        if isinstance(i, slice):
+            return [self.base[j] for j in range(*i.indices(self.stop))]
+        return self.base[range(self.stop)[i]]
+
+    def __iter__(self) -> Iterator[Any]:
+        base = self.base
+        for i in range(self.stop):
+            yield base[i]
+
+    def __repr__(self) -> str:
+        return f"SeriesView({self.stop} of {len(self.base)})"
+
+
+class RebasedData(Mapping):
+    """
+    A data dict as seen from an earlier reference period.
+
+    Keys in `overrides` (latest, metadata, time_series) shadow the base data;
+    everything else is read straight from it. The view is read-only and
+    shares the base's objects, so neither should be mutated while in use.
+    """
+    __slots__ = ("base", "overrides")
+
+    def __init__(self, base: Mapping, overrides: Dict[str, Any]):
+        self.base = base
+        self.overrides = overrides
+
+    def __getitem__(self, key: str) -> Any:
+        if key in self.overrides:
+            return self.overrides[key]
+        return self.base[key]
+
+    def __iter__(self) -> Iterator[str]:
+        yield from self.base
+        for key in self.overrides:
+            if key not in self.base:
+                yield key
+
+    def __len__(self) -> int:
+        return len(self.base) + sum(1 for key in self.overrides if key not in self.base)
+
+    def __repr__(self) -> str:
+        return f"RebasedData(latest={self.overrides.get('latest')!r})"
@@ -7,7 +7,8 @@
   'use strict';
 
   // State
-  let articlesData = null;
+  let articlesIndex = null;
+  const monthShards = {};  // month (YYYY-MM) -> promise of {date: {en, fr}}
   let availableDates = [];
   let currentDate = null;
   let currentLang = 'en';
@@ -78,11 +79,11 @@
       currentDate = params.get('date');
     }
 
-    // Load articles data
+    // Load the articles index (dates and month shards); articles are loaded per month
     try {
       const response = await fetch('articles.json');
-      articlesData = await response.json();
-      availableDates = articlesData.dates || [];
+      articlesIndex = await response.json();
+      availableDates = articlesIndex.dates || [];
 
       // Set current date to latest if not specified
       if (!currentDate && availableDates.length > 0) {
@@ -278,13 +279,57 @@
     return date.toLocaleDateString(currentLang === 'fr' ? 'fr-CA' : 'en-CA', options);
   }
 
+  /**
+   * Load the articles of the month containing a date, fetching its shard once
+   */
+  function loadMonth(date) {
+    // Unsharded articles.json (older builds) carries every article itself
+    if (articlesIndex.articles) {
+      return Promise.resolve(articlesIndex.articles);
+    }
+
+    if (!date) {
+      return Promise.resolve({});
+    }
+    const month = date.slice(0, 7);
+    const shardPath = articlesIndex.shards && articlesIndex.shards[month];
+    if (!shardPath) {
+      return Promise.resolve({});
+    }
+    if (!monthShards[month]) {
+      monthShards[month] = fetch(shardPath)
+        .then(response => {
+          if (!response.ok) throw new Error(`HTTP ${response.status}`);
+          return response.json();
+        })
+        .then(shard => shard.articles || {})
+        .catch(error => {
+          delete monthShards[month];
+          throw error;
+        });
+    }
+    return monthShards[month];
+  }
+
   /**
    * Render articles for the current date
    */
-  function renderArticles() {
-    if (!elements.articlesContainer || !articlesData) return;
+  async function renderArticles() {
+    if (!elements.articlesContainer || !articlesIndex) return;
+
+    const date = currentDate;
+    let monthArticles;
+    try {
+      monthArticles = await loadMonth(date);
+    } catch (error) {
+      console.error(`Failed to load articles for ${date}:`, error);
+      showError('Failed to load articles data');
+      return;
+    }
+    // A newer navigation started while this month was loading
+    if (date !== currentDate) return;
 
-    const dateArticles = articlesData.articles[currentDate];
+    const dateArticles = monthArticles[date];
     const langArticles = dateArticles ? dateArticles[currentLang] : null;
 
     // Fallback to other language if current language has no articles
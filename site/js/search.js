@@ -0,0 +1,171 @@
+/**
+ * The D-AI-LY Search Module
+ * Queries the prebuilt index in search/ (written by build_site.py), fetching
+ * only the term shards and document chunks a query needs
+ */
+
+(function() {
+  'use strict';
+
+  const SEARCH_BASE = 'search/';
+  const MAX_RESULTS = 50;
+
+  let indexPromise = null;
+  const shardCache = {};
+  const chunkCache = {};
+
+  const translations = {
+    en: {
+      noResults: 'No articles match your search',
+      results: n => `${n} article${n === 1 ? '' : 's'} found`,
+      table: 'Table'
+    },
+    fr: {
+      noResults: 'Aucun article ne correspond à votre recherche',
+      results: n => `${n} article${n === 1 ? '' : 's'} trouvé${n === 1 ? '' : 's'}`,
+      table: 'Tableau'
+    }
+  };
+
+  function fetchJSON(path, cache) {
+    if (!cache[path]) {
+      cache[path] = fetch(SEARCH_BASE + path)
+        .then(response => {
+          if (!response.ok) throw new Error(`HTTP ${response.status}`);
+          return response.json();
+        })
+        .catch(error => {
+          delete cache[path];
+          throw error;
+        });
+    }
+    return cache[path];
+  }
+
+  function loadIndex() {
+    if (!indexPromise) {
+      indexPromise = fetchJSON('index.json', {});
+      indexPromise.catch(() => { indexPromise = null; });
+    }
+    return indexPromise;
+  }
+
+  /**
+   * Split a query into terms with the same rules as search_index.tokenize()
+   */
+  function tokenize(text, lang, index) {
+    const stopWords = new Set(index.stop_words[lang] || []);
+    return text
+      .normalize('NFD')
+      .replace(/[\u0300-\u036f]/g, '')
+      .toLowerCase()
+      .split(/[^a-z0-9]+/)
+      .filter(term => term.length >= index.min_term_length && !stopWords.has(term));
+  }
+
+  /**
+   * Doc ids matching one term; the last query term also matches as a prefix
+   */
+  async function termIds(term, lang, index, asPrefix) {
+    const prefix = term.slice(0, index.prefix_length);
+    if (!(index.shards[lang] || []).includes(prefix)) {
+      return new Set();
+    }
+    const shard = await fetchJSON(`${lang}/${prefix}.json`, shardCache);
+    if (!asPrefix) {
+      return new Set(shard[term] || []);
+    }
+    const ids = new Set();
+    for (const [candidate, postings] of Object.entries(shard)) {
+      if (candidate.startsWith(term)) {
+        postings.forEach(id => ids.add(id));
+      }
+    }
+    return ids;
+  }
+
+  /**
+   * Search articles in one language; resolves to [{lang, date, title, filename, table}],
+   * newest first
+   */
+  async function search(query, lang) {
+    const index = await loadIndex();
+    const terms = [...new Set(tokenize(query, lang, index))];
+    if (terms.length === 0) return [];
+
+    const idSets = await Promise.all(
+      terms.map((term, i) => termIds(term, lang, index, i === terms.length - 1))
+    );
+    idSets.sort((a, b) => a.size - b.size);
+    // Ids say nothing about dates, so every hit's document is loaded before sorting
+    const ids = [...idSets[0]].filter(id => idSets.every(set => set.has(id)));
+
+    const chunks = [...new Set(ids.map(id => Math.floor(id / index.doc_chunk_size)))];
+    const loaded = await Promise.all(chunks.map(chunk => fetchJSON(`docs/${chunk}.json`, chunkCache)));
+    const docs = Object.assign({}, ...loaded);
+
+    return ids
+      .map(id => docs[id])
+      .filter(Boolean)
+      .map(([docLang, date, title, filename, table]) => ({lang: docLang, date, title, filename, table}))
+      .sort((a, b) => b.date.localeCompare(a.date))
+      .slice(0, MAX_RESULTS);
+  }
+
+  /**
+   * Wire up the search box on the homepage, if present
+   */
+  function init() {
+    const input = document.getElementById('search-input');
+    const container = document.getElementById('search-results');
+    if (!input || !container) return;
+
+    let timer = null;
+    let latest = 0;
+    input.addEventListener('input', () => {
+      clearTimeout(timer);
+      timer = setTimeout(async () => {
+        const query = input.value.trim();
+        const lang = document.documentElement.lang === 'fr' ? 'fr' : 'en';
+        const t = translations[lang];
+        const request = ++latest;
+
+        if (!query) {
+          container.hidden = true;
+          container.innerHTML = '';
+          return;
+        }
+
+        let results;
+        try {
+          results = await search(query, lang);
+        } catch (error) {
+          console.error('Search failed:', error);
+          return;
+        }
+        if (request !== latest) return;
+
+        container.hidden = false;
+        if (results.length === 0) {
+          container.innerHTML = `<p class="no-articles">${t.noResults}</p>`;
+          return;
+        }
+        container.innerHTML = `<p class="search-count">${t.results(results.length)}</p>` +
+          results.map(doc => `
+            <article class="article-card">
+              <h3><a href="articles/${doc.lang}/${doc.filename}">${doc.title}</a></h3>
+              <span class="table-ref">${doc.date}${doc.table ? ` &middot; ${t.table} ${doc.table}` : ''}</span>
+            </article>
+          `).join('');
+      }, 150);
+    });
+  }
+
+  window.DailySearch = { search };
+
+  if (document.readyState === 'loading') {
+    document.addEventListener('DOMContentLoaded', init);
+  } else {
+    init();
+  }
+})();
@@ -0,0 +1,171 @@
+#!/usr/bin/env python3
+"""
+The D-AI-LY Timing Spans
+
+Lightweight wall-clock timing of pipeline stages:
+
+    with spans.collecting(source="output/data_18_10_0004.json") as collector:
+        with spans.span("load"):
+            data = json_backend.load(path)
+    collector.records  # [{"source": "...", "span": "load", "ms": 1.92}]
+
+span() is a no-op unless a collector is active in the current context
+(thread, or task), so instrumented code costs one context-variable lookup per
+span when timing is off. Records are plain dicts so they can be returned from
+pool workers, written as JSON lines and aggregated into a per-stage table.
+
+profiled() wraps a block in cProfile and saves pstats output.
+"""
+
+import contextlib
+import contextvars
+import cProfile
+import io
+import pstats
+import time
+from typing import Any, Dict, Iterable, Iterator, List, Optional, TextIO
+
+import json_backend
+
+Record = Dict[str, Any]
+
+
+class _NullSpan:
+    """Shared do-nothing context manager returned while timing is off."""
+    __slots__ = ()
+
+    def __enter__(self) -> None:
+        return None
+
+    def __exit__(self, *exc) -> bool:
+        return False
+
+
+_NULL_SPAN = _NullSpan()
+
+
+class _Span:
+    __slots__ = ("collector", "name", "start")
+
+    def __init__(self, collector: "SpanCollector", name: str):
+        self.collector = collector
+        self.name = name
+
+    def __enter__(self) -> None:
+        self.start = time.perf_counter()
+
+    def __exit__(self, *exc) -> bool:
+        elapsed_ms = (time.perf_counter() - self.start) * 1e3
+        self.collector.records.append(dict(self.collector.fields, span=self.name,
+                                           ms=round(elapsed_ms, 4)))
+        return False
+
+
+class SpanCollector:
+    """Collects span records, each tagged with the collector's current fields."""
+
+    def __init__(self, **fields: Any):
+        self.fields: Dict[str, Any] = fields
+        self.records: List[Record] = []
+
+    def span(self, name: str) -> _Span:
+        return _Span(self, name)
+
+    @contextlib.contextmanager
+    def bound(self, **fields: Any) -> Iterator["SpanCollector"]:
+        """Tag spans recorded inside the block with extra fields (e.g. lang)."""
+        previous = self.fields
+        self.fields = dict(previous, **fields)
+        try:
+            yield self
+        finally:
+            self.fields = previous
+
+
+_CURRENT: contextvars.ContextVar[Optional[SpanCollector]] = contextvars.ContextVar(
+    "daily_span_collector", default=None
+)
+
+
+def span(name: str):
+    """Time the enclosed block as stage `name` if a collector is active."""
+    collector = _CURRENT.get()
+    if collector is None:
+        return _NULL_SPAN
+    return collector.span(name)
+
+
+@contextlib.contextmanager
+def collecting(**fields: Any) -> Iterator[SpanCollector]:
+    """Activate a new collector for the enclosed block and yield it."""
+    collector = SpanCollector(**fields)
+    token = _CURRENT.set(collector)
+    try:
+        yield collector
+    finally:
+        _CURRENT.reset(token)
+
+
+# =============================================================================
+# OUTPUT
+# =============================================================================
+
+def write_jsonl(records: Iterable[Record], path: str) -> None:
+    """Append records to path as JSON lines ("-" writes to stdout)."""
+    lines = "".join(json_backend.dumps(record) + "\n" for record in records)
+    if path == "-":
+        print(lines, end="")
+        return
+    with open(path, "a", encoding="utf-8") as f:
+        f.write(lines)
+
+
+def aggregate(records: Iterable[Record]) -> List[Dict[str, Any]]:
+    """Per-stage count, total, mean and max ms, in order of first appearance."""
+    stages: Dict[str, List[float]] = {}
+    for record in records:
+        stages.setdefault(record["span"], []).append(record["ms"])
+    return [
+        {"span": name, "count": len(times), "total_ms": sum(times),
+         "mean_ms": sum(times) / len(times), "max_ms": max(times)}
+        for name, times in stages.items()
+    ]
+
+
+def print_span_table(records: Iterable[Record], out: Optional[TextIO] = None) -> None:
+    """Print the aggregated per-stage timing table."""
+    rows = aggregate(records)
+    if not rows:
+        return
+    width = max(len("Stage"), max(len(row["span"]) for row in rows))
+    print(f"{'Stage':<{width}}  {'Count':>5}  {'Total ms':>10}  {'Mean ms':>9}  {'Max ms':>9}", file=out)
+    for row in rows:
+        print(f"{row['span']:<{width}}  {row['count']:>5}  {row['total_ms']:>10.3f}  "
+              f"{row['mean_ms']:>9.3f}  {row['max_ms']:>9.3f}", file=out)
+
+
+# =============================================================================
+# PROFILING
+# =============================================================================
+
+@contextlib.contextmanager
+def profiled(path: Optional[str], top: int = 25) -> Iterator[None]:
+    """
+    Run the enclosed block under cProfile, save the stats to path (readable
+    with pstats or snakeviz) and print the top functions by cumulative time.
+    A None path runs the block unprofiled.
+    """
+    if not path:
+        yield
+        return
+    profiler = cProfile.Profile()
+    profiler.enable()
+    try:
+        yield
+    finally:
+        profiler.disable()
+        profiler.dump_stats(path)
+        report = io.StringIO()
+        pstats.Stats(profiler, stream=report).sort_stats("cumulative").print_stats(top)
+        print(report.getvalue())
+        print(f"Profile saved: {path}")
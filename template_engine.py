@@ -0,0 +1,180 @@
+#!/usr/bin/env python3
+"""
+The D-AI-LY Template Engine
+
+A minimal mustache-style template compiler for the article HTML templates.
+
+Templates are parsed once into a flat tree of literal, placeholder and section
+nodes, cached by path and mtime, and rendered in a single pass with a list
+join. Supported tags:
+
+- {{name}}              placeholder, replaced by the context value (not escaped)
+- {{.}}                 the current item inside a list section
+- {{#name}}...{{/name}} section: repeated for each item of a list, rendered
+                        once for any other truthy value, dropped if falsy
+
+Values are inserted as-is: the generators build HTML fragments themselves, so
+nothing is HTML-escaped. Section tags that sit alone on a line are removed
+together with their line, so list sections render one clean line per item.
+"""
+
+import os
+import re
+import threading
+from pathlib import Path
+from typing import Any, Dict, List, Tuple, Union
+
+TAG_RE = re.compile(r"\{\{([#/]?)\s*([\w.]+)\s*\}\}")
+
+# Node kinds
+LITERAL = 0
+VARIABLE = 1
+SECTION = 2
+
+
+class TemplateSyntaxError(Exception):
+    """Raised when a template has unbalanced or mismatched section tags."""
+    pass
+
+
+Node = Tuple  # (LITERAL, text) | (VARIABLE, name) | (SECTION, name, children)
+
+
+def _standalone_span(source: str, start: int, end: int) -> Tuple[int, int]:
+    """
+    Return the span to remove for a section tag at source[start:end].
+
+    If the tag is the only non-whitespace content on its line, the span is
+    widened to cover the whole line including its newline.
+    """
+    line_start = source.rfind("\n", 0, start) + 1
+    line_end = source.find("\n", end)
+    line_end = len(source) if line_end == -1 else line_end + 1
+    if source[line_start:start].strip() or source[end:line_end].strip():
+        return start, end
+    return line_start, line_end
+
+
+def compile_template(source: str) -> List[Node]:
+    """
+    Parse template source into a list of nodes.
+
+    Raises:
+        TemplateSyntaxError: If section tags are unbalanced
+    """
+    root: List[Node] = []
+    stack: List[Tuple[str, List[Node]]] = [("", root)]
+    pos = 0
+
+    for match in TAG_RE.finditer(source):
+        kind, name = match.group(1), match.group(2)
+        if kind:
+            start, end = _standalone_span(source, match.start(), match.end())
+        else:
+            start, end = match.start(), match.end()
+        # A standalone tag may swallow text already consumed by the previous tag
+        start = max(start, pos)
+
+        children = stack[-1][1]
+        if start > pos:
+            children.append((LITERAL, source[pos:start]))
+        pos = end
+
+        if kind == "#":
+            section: List[Node] = []
+            children.append((SECTION, name, section))
+            stack.append((name, section))
+        elif kind == "/":
+            if len(stack) == 1 or stack[-1][0] != name:
+                open_name = stack[-1][0] or None
+                raise TemplateSyntaxError(
+                    f"Unexpected {{{{/{name}}}}} (open section: {open_name})"
+                )
+            stack.pop()
+        else:
+            children.append((VARIABLE, name))
+
+    if len(stack) > 1:
+        raise TemplateSyntaxError(f"Unclosed section: {{{{#{stack[-1][0]}}}}}")
+
+    if pos < len(source):
+        root.append((LITERAL, source[pos:]))
+
+    return root
+
+
+def _lookup(name: str, stack: List[Any]) -> Any:
+    """Resolve a name against the context stack, innermost first."""
+    if name == ".":
+        return stack[-1]
+    for ctx in reversed(stack):
+        if isinstance(ctx, dict) and name in ctx:
+            return ctx[name]
+    return None
+
+
+def _render_nodes(nodes: List[Node], stack: List[Any], out: List[str]) -> None:
+    for node in nodes:
+        kind = node[0]
+        if kind == LITERAL:
+            out.append(node[1])
+        elif kind == VARIABLE:
+            value = _lookup(node[1], stack)
+            if value is not None:
+                out.append(value if isinstance(value, str) else str(value))
+        else:
+            value = _lookup(node[1], stack)
+            if not value:
+                continue
+            if isinstance(value, (list, tuple)):
+                for item in value:
+                    stack.append(item)
+                    _render_nodes(node[2], stack, out)
+                    stack.pop()
+            elif isinstance(value, dict):
+                stack.append(value)
+                _render_nodes(node[2], stack, out)
+                stack.pop()
+            else:
+                _render_nodes(node[2], stack, out)
+
+
+class Template:
+    """A compiled template."""
+
+    def __init__(self, source: str):
+        self.nodes = compile_template(source)
+
+    def render(self, context: Dict[str, Any]) -> str:
+        """Render the template against a context dict in a single pass."""
+        out: List[str] = []
+        _render_nodes(self.nodes, [context], out)
+        return "".join(out)
+
+
+# Compiled templates keyed by path: (mtime_ns, Template)
+_TEMPLATE_CACHE: Dict[str, Tuple[int, Template]] = {}
+_CACHE_LOCK = threading.Lock()
+
+
+def load_template(path: Union[str, Path]) -> Template:
+    """
+    Load and compile a template file, reusing the cached compile while the
+    file's mtime is unchanged.
+    """
+    key = os.path.abspath(path)
+    mtime = os.stat(key).st_mtime_ns
+    cached = _TEMPLATE_CACHE.get(key)
+    if cached and cached[0] == mtime:
+        return cached[1]
+
+    with open(key, "r", encoding="utf-8") as f:
+        template = Template(f.read())
+    with _CACHE_LOCK:
+        _TEMPLATE_CACHE[key] = (mtime, template)
+    return template
+
+
+def render_template(path: Union[str, Path], context: Dict[str, Any]) -> str:
+    """Load (or reuse) a compiled template and render it."""
+    return load_template(path).render(context)
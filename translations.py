@@ -0,0 +1,95 @@
+#!/usr/bin/env python3
+"""
+The D-AI-LY Translation Catalogs
+
+Loads templates/translations.json once per process (and again only when the
+file's mtime changes) and flattens each language into a read-only mapping of
+dotted keys to strings:
+
+    {"en": {"months": {"January": "January"}}}  ->  {"months.January": "January"}
+
+so a lookup such as t("months.January") is a single dict access instead of a
+walk through nested dicts. Only string leaves are kept, which matches what the
+generators' t() helpers ever return.
+
+RenderContext bundles a language with its catalog. The generators take it as
+an explicit argument rather than keeping the active language in module
+globals, so articles in different languages can render concurrently in one
+process.
+"""
+
+import os
+import threading
+from pathlib import Path
+from types import MappingProxyType
+from typing import Any, Dict, Mapping, Optional, Tuple, Union
+
+import json_backend
+
+TRANSLATIONS_PATH = Path(__file__).parent / "templates" / "translations.json"
+DEFAULT_LANG = "en"
+
+Catalog = Mapping[str, str]
+
+
+def flatten_catalog(tree: Dict[str, Any], prefix: str = "") -> Dict[str, str]:
+    """Flatten nested translation dicts into {"a.b.c": "text"} (strings only)."""
+    flat: Dict[str, str] = {}
+    for key, value in tree.items():
+        path = f"{prefix}{key}"
+        if isinstance(value, dict):
+            flat.update(flatten_catalog(value, path + "."))
+        elif isinstance(value, str):
+            flat[path] = value
+    return flat
+
+
+# Parsed catalogs keyed by path: (mtime_ns, {lang: Catalog})
+_CATALOG_CACHE: Dict[str, Tuple[int, Dict[str, Catalog]]] = {}
+_CACHE_LOCK = threading.Lock()
+
+
+def load_catalogs(path: Union[str, Path] = TRANSLATIONS_PATH) -> Dict[str, Catalog]:
+    """
+    Load every language of a translations file as frozen, flattened catalogs,
+    reusing the cached parse while the file's mtime is unchanged.
+    """
+    key = os.path.abspath(path)
+    mtime = os.stat(key).st_mtime_ns
+    cached = _CATALOG_CACHE.get(key)
+    if cached and cached[0] == mtime:
+        return cached[1]
+
+    all_translations = json_backend.load(key)
+    catalogs = {
+        lang: MappingProxyType(flatten_catalog(tree))
+        for lang, tree in all_translations.items()
+        if isinstance(tree, dict)
+    }
+    with _CACHE_LOCK:
+        _CATALOG_CACHE[key] = (mtime, catalogs)
+    return catalogs
+
+
+def load_catalog(lang: str = DEFAULT_LANG,
+                 path: Union[str, Path] = TRANSLATIONS_PATH) -> Catalog:
+    """Return the catalog for lang, falling back to English for unknown languages."""
+    catalogs = load_catalogs(path)
+    catalog = catalogs.get(lang)
+    return catalog if catalog is not None else catalogs[DEFAULT_LANG]
+
+
+class RenderContext:
+    """The language an article is rendered in, plus its translation catalog."""
+    __slots__ = ("lang", "catalog")
+
+    def __init__(self, lang: str = DEFAULT_LANG, catalog: Optional[Catalog] = None):
+        self.lang = lang
+        self.catalog = catalog if catalog is not None else load_catalog(lang)
+
+    def t(self, key_path: str, default: str = "") -> str:
+        """Get a translation by dot-notation path (e.g., 'article.highlights')."""
+        return self.catalog.get(key_path, default)
+
+    def __repr__(self) -> str:
+        return f"RenderContext({self.lang!r})"